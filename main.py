@@ -7,17 +7,23 @@ Outputs SRT format for video players.
 """
 
 import click
+import importlib.util
 import os
 import platform
+import re
+import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 
 from src.audio_extractor import AudioExtractor
-from src.transcriber import Transcriber
+from src.transcriber import COMPUTE_TYPES, Transcriber, unload_models
+from src import transcriber_daemon
 from src.subtitle_writer import SubtitleWriter
 from src.video_downloader import VideoDownloader, is_url
 from src.translator import OllamaTranslator, load_config, parse_language, unload_all_models
@@ -45,6 +51,13 @@ CUDA_VERSIONS = {
 # Change this when updating the default, and update pyproject.toml to match
 DEFAULT_CUDA = "cu121"
 
+# Max CUDA version in the nvidia-smi header, e.g. "CUDA Version: 12.2"
+CUDA_VERSION_PATTERN = re.compile(r'CUDA Version:\s*(\d+\.\d+)')
+
+# SRT filename stem: optional "YYYYMMDD_" date prefix, base name, optional ".Language" suffix,
+# e.g. "20240101_video.Chinese" -> ("20240101", "video")
+SRT_NAME_PATTERN = re.compile(r'(?:(\d{8})_?)?(.*?)(?:\.[^.]*)?', re.DOTALL)
+
 
 class DataInput(click.ParamType):
     """Custom Click parameter type that accepts file paths, URLs, or SRT files."""
@@ -55,11 +68,11 @@ class DataInput(click.ParamType):
         if is_url(value):
             return value
 
-        # If it's a file path, check it exists
-        path = Path(value)
-        if not path.exists():
+        # If it's a file path, check it exists (strict resolve fails on missing paths)
+        try:
+            return str(Path(value).resolve(strict=True))
+        except OSError:
             self.fail(f"File not found: {value}", param, ctx)
-        return str(path.resolve())
 
 
 class SubtitleChoice(click.ParamType):
@@ -85,7 +98,8 @@ class SubtitleChoice(click.ParamType):
 
 def is_srt_file(path: str) -> bool:
     """Check if the input is an SRT subtitle file."""
-    return path.lower().endswith('.srt')
+    # Lowercase only the extension, not the whole (possibly long URL) string
+    return path[-4:].lower() == '.srt'
 
 
 def _build_preview_command(
@@ -98,6 +112,11 @@ def _build_preview_command(
     stable: bool,
     vad: bool,
     prompt_file: str | None = None,
+    compute_type: str | None = None,
+    concurrency: int | None = None,
+    compile_model: bool = False,
+    split_device: bool = False,
+    condition_on_previous: bool | None = None,
 ) -> str:
     """Build the real command for --preview mode output (subtitle download paths)."""
     import shlex
@@ -118,8 +137,18 @@ def _build_preview_command(
         parts.append('--stable')
     if vad:
         parts.append('--vad')
+    if compute_type is not None:
+        parts.append(f'--compute-type {compute_type}')
+    if compile_model:
+        parts.append('--compile')
+    if split_device:
+        parts.append('--split-device')
+    if condition_on_previous is not None:
+        parts.append('--condition-on-previous' if condition_on_previous else '--no-condition-on-previous')
     if prompt_file is not None:
         parts.append(f'--prompt-file {shlex.quote(prompt_file)}')
+    if concurrency is not None:
+        parts.append(f'--concurrency {concurrency}')
 
     return ' '.join(parts)
 
@@ -132,6 +161,10 @@ def _build_transcribe_command(
     keep_audio: bool,
     stable: bool,
     vad: bool,
+    compute_type: str | None = None,
+    compile_model: bool = False,
+    split_device: bool = False,
+    condition_on_previous: bool | None = None,
 ) -> str:
     """Build Phase 1 transcription command (transcribe only, no translation)."""
     import shlex
@@ -152,6 +185,14 @@ def _build_transcribe_command(
         parts.append('--stable')
     if vad:
         parts.append('--vad')
+    if compute_type is not None:
+        parts.append(f'--compute-type {compute_type}')
+    if compile_model:
+        parts.append('--compile')
+    if split_device:
+        parts.append('--split-device')
+    if condition_on_previous is not None:
+        parts.append('--condition-on-previous' if condition_on_previous else '--no-condition-on-previous')
 
     return ' '.join(parts)
 
@@ -161,6 +202,7 @@ def _build_translate_command(
     output: str | None,
     language: str | None,
     prompt_file: str | None = None,
+    concurrency: int | None = None,
 ) -> str:
     """Build Phase 2 translation command (SRT file + -y + --action translate)."""
     import shlex
@@ -173,10 +215,51 @@ def _build_translate_command(
         parts.append(f'--output {shlex.quote(output)}')
     if prompt_file is not None:
         parts.append(f'--prompt-file {shlex.quote(prompt_file)}')
+    if concurrency is not None:
+        parts.append(f'--concurrency {concurrency}')
 
     return ' '.join(parts)
 
 
+def _echo_transcribe_preview(
+    data_input: str,
+    config: dict,
+    srt_path_for,
+    model: str,
+    language: str | None,
+    output: str | None,
+    keep_audio: bool,
+    stable: bool,
+    vad: bool,
+    compute_type: str | None = None,
+    prompt_file: str | None = None,
+    concurrency: int | None = None,
+    compile_model: bool = False,
+    split_device: bool = False,
+    condition_on_previous: bool | None = None,
+) -> None:
+    """
+    Print the --preview command(s) for transcribing DATA_INPUT.
+
+    With ollama.auto_unload the work is split into a transcribe command and a
+    translate command for the resulting SRT, so Whisper and Ollama never share VRAM.
+
+    Args:
+        srt_path_for: Callable returning the SRT path the transcription will write.
+            Only called in the two-phase case, since URLs need a metadata lookup.
+    """
+    if config['ollama'].get('auto_unload', False):
+        click.echo(_build_transcribe_command(data_input, model, language, output, keep_audio, stable, vad,
+                                             compute_type=compute_type, compile_model=compile_model,
+                                             split_device=split_device, condition_on_previous=condition_on_previous))
+        click.echo(_build_translate_command(srt_path_for(), output, language, prompt_file=prompt_file, concurrency=concurrency))
+    else:
+        click.echo(_build_preview_command(data_input, 0, model, language, output, keep_audio, stable, vad,
+                                          prompt_file=prompt_file, compute_type=compute_type, concurrency=concurrency,
+                                          compile_model=compile_model, split_device=split_device,
+                                          condition_on_previous=condition_on_previous))
+
+
 def format_video_label(video_meta: dict, url: str = None) -> str:
     """
     Format video label from metadata for display.
@@ -202,6 +285,10 @@ def format_video_label(video_meta: dict, url: str = None) -> str:
     return label
 
 
+# Output directories already created in this process (skips repeated mkdir path walks)
+_ensured_directories = set()
+
+
 def get_output_directory(cli_output: str, config: dict, default_path: Path) -> Path:
     """
     Determine output directory with priority: CLI argument > config > default.
@@ -214,17 +301,13 @@ def get_output_directory(cli_output: str, config: dict, default_path: Path) -> P
     Returns:
         Path object for the output directory
     """
-    # Priority 1: CLI argument
-    if cli_output:
-        output_dir = Path(cli_output)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        return output_dir
-
-    # Priority 2: Config file
-    config_output = config.get('output', {}).get('directory')
-    if config_output:
-        output_dir = Path(config_output)
-        output_dir.mkdir(parents=True, exist_ok=True)
+    # Priority 1: CLI argument, Priority 2: Config file
+    configured = cli_output or config.get('output', {}).get('directory')
+    if configured:
+        output_dir = Path(configured)
+        if str(output_dir) not in _ensured_directories:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            _ensured_directories.add(str(output_dir))
         return output_dir
 
     # Priority 3: Default
@@ -245,13 +328,25 @@ def get_date_prefix(upload_date: str = None, file_path: Path = None) -> str:
     if upload_date:
         # Use upload date from video metadata (already in YYYYMMDD format)
         return upload_date
-    elif file_path and file_path.exists():
-        # Fall back to file modification date for local files
-        mtime = file_path.stat().st_mtime
-        return datetime.fromtimestamp(mtime).strftime('%Y%m%d')
-    else:
-        # Fall back to current date
-        return datetime.now().strftime('%Y%m%d')
+
+    # Fall back to file modification date for local files, then to the current date
+    mtime = None
+    if file_path:
+        try:
+            mtime = file_path.stat().st_mtime
+        except OSError:
+            pass
+
+    # time.localtime(None) is now; formatting the fields skips datetime and strftime
+    date = time.localtime(mtime)
+    return f"{date.tm_year:04d}{date.tm_mon:02d}{date.tm_mday:02d}"
+
+
+# Minimum seconds between translation progress redraws
+PROGRESS_INTERVAL = 0.2
+
+# Joins multiple subtitle lines with " / " for compact bilingual display
+JOIN_LINES = str.maketrans({'\n': ' / '})
 
 
 def create_bilingual_segments(original_segments, translated_segments):
@@ -268,26 +363,96 @@ def create_bilingual_segments(original_segments, translated_segments):
 
     Returns:
         List of bilingual segments with both texts
+
+    Raises:
+        ValueError: If the two lists differ in length
     """
-    bilingual = []
-    for orig, trans in zip(original_segments, translated_segments):
-        # Join multiple lines with " / " for compact display
-        orig_text = orig['text'].replace('\n', ' / ')
-        trans_text = trans['text'].replace('\n', ' / ')
-        bilingual.append({
+    return [
+        {
             'start': orig['start'],
             'end': orig['end'],
-            'text': f"{orig_text}\n{trans_text}"
-        })
-    return bilingual
+            'text': f"{orig['text'].translate(JOIN_LINES)}\n{trans['text'].translate(JOIN_LINES)}"
+        }
+        for orig, trans in zip(original_segments, translated_segments, strict=True)
+    ]
+
+
+# (custom_prompt, concurrency) and the translator last built for them; a failed
+# connection check is not kept, so the next input checks again
+_cached_translator = (None, None)
+
+
+def _get_translator(custom_prompt=None, concurrency=None):
+    """
+    Build the Ollama translator, check the connection and start loading the model, once per process.
+
+    Args:
+        custom_prompt: Extra instructions for the translation model (from --prompt-file)
+        concurrency: Batches to send to Ollama in parallel (from --concurrency)
+
+    Returns:
+        OllamaTranslator instance, or None if Ollama is not reachable
+    """
+    global _cached_translator
+    key, translator = _cached_translator
+    if translator is not None and key == (custom_prompt, concurrency):
+        return translator
+
+    translator = OllamaTranslator(custom_prompt=custom_prompt, concurrency=concurrency)
+    if not translator.check_connection():
+        return None
+    translator.warm_up()
+    _cached_translator = ((custom_prompt, concurrency), translator)
+    return translator
+
+
+@lru_cache(maxsize=1)
+def _get_transcriber(**options):
+    """
+    Build the Transcriber once per batch, so every input reuses the loaded model.
+
+    Args:
+        options: Transcriber keyword arguments (model_size, use_stable, use_vad, ...)
+
+    Returns:
+        Transcriber instance
+    """
+    return Transcriber(**options)
 
 
-def translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name, config, yes=False, language_name=None, custom_prompt=None):
+def _load_model_in_background(transcriber) -> Future:
+    """
+    Start transcriber.load_model() on a daemon thread and return a Future for it.
+
+    Executor threads are joined when the interpreter exits, so a download or
+    extraction error would only exit after a load of several minutes that is no
+    longer needed. A daemon thread lets sys.exit() return right away.
+
+    Args:
+        transcriber: Transcriber whose model to load
+
+    Returns:
+        Future resolved when the model is loaded, or holding the load error
+    """
+    future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(transcriber.load_model())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="whisper-model-load", daemon=True).start()
+    return future
+
+
+def translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name, config, yes=False, language_name=None, custom_prompt=None, concurrency=None, writer=None):
     """
     Handle subtitle translation workflow.
 
     Args:
-        segments: List of subtitle segments
+        segments: List of subtitle segments, or None to parse srt_path once translation is accepted
         srt_path: Path to the original SRT file
         output_dir: Directory for output files
         date_prefix: Date prefix for filenames
@@ -295,10 +460,37 @@ def translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name,
         config: Configuration dictionary from load_config()
         yes: If True, skip prompts and use defaults
         language_name: Source language name from --language flag (used with --yes)
+        custom_prompt: Extra instructions for the translation model (from --prompt-file)
+        concurrency: Batches to send to Ollama in parallel (from --concurrency); config value if None
+        writer: SubtitleWriter to reuse for parsing and writing; a new one is created if None
 
     Returns:
         Translation time in seconds, or None if translation was skipped
     """
+    if segments is not None and not segments:
+        click.echo("No segments to translate.")
+        return None
+
+    if not yes and not click.confirm('\nWould you like to translate the subtitles?', default=True):
+        return None
+
+    # Show model info
+    model_name = config['ollama']['model']
+    click.echo(f"\nUsing Ollama model: {model_name}")
+
+    # Check Ollama connection. This also starts loading the model, so it is done before
+    # the language prompts and SRT parsing for the load to overlap them
+    translator = _get_translator(custom_prompt, concurrency)
+    if translator is None:
+        click.echo(
+            f"\n❌ Cannot connect to Ollama at {config['ollama']['base_url']}. "
+            "Make sure Ollama is running (ollama serve).",
+            err=True
+        )
+        return
+    if translator.prompt_file_source:
+        click.echo(f"Using config prompt file: {translator.prompt_file_source}")
+
     if yes:
         # --yes: auto-accept translation with defaults.
         # Source language uses --language name if provided, otherwise "English".
@@ -307,9 +499,6 @@ def translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name,
         target_lang = 'Chinese'
         want_bilingual = True
     else:
-        if not click.confirm('\nWould you like to translate the subtitles?', default=True):
-            return None
-
         source_lang = click.prompt('Source language', default='English')
         target_lang = click.prompt('Target language', default='Chinese')
 
@@ -328,28 +517,31 @@ def translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name,
 
         want_bilingual = click.confirm('Create bilingual subtitle (original + translation)?', default=True)
 
-    # Show model info
-    model_name = config['ollama']['model']
-    click.echo(f"\nUsing Ollama model: {model_name}")
+    writer = writer or SubtitleWriter()
 
-    # Check Ollama connection
-    translator = OllamaTranslator(custom_prompt=custom_prompt)
-    if translator.prompt_file_source:
-        click.echo(f"Using config prompt file: {translator.prompt_file_source}")
-    if not translator.check_connection():
-        click.echo(
-            f"\n❌ Cannot connect to Ollama at {config['ollama']['base_url']}. "
-            "Make sure Ollama is running (ollama serve).",
-            err=True
-        )
-        return
+    # Deferred until here so a declined translation never reads the subtitle file
+    if segments is None:
+        segments = writer.parse_srt(str(srt_path))
+        if not segments:
+            click.echo("No segments to translate.")
+            return None
 
     # Translate with progress indicator
     click.echo(f"\nTranslating {len(segments)} segments...")
 
+    # Segments are already sent to Ollama in batches of ollama.batch_size; progress
+    # arrives per streamed line, so redraw at most every PROGRESS_INTERVAL seconds
+    # (always for the final count), and only when the count moves, in one write
+    last_reported = [None, float('-inf')]  # count, time.monotonic()
+
     def progress_callback(current, total):
-        click.echo(f"  Translating segment {current}/{total}...", nl=False)
-        click.echo('\r', nl=False)
+        now = time.monotonic()
+        if current == last_reported[0]:
+            return
+        if current != total and now - last_reported[1] < PROGRESS_INTERVAL:
+            return
+        last_reported[:] = [current, now]
+        click.echo(f"  Translating segment {current}/{total}...\r", nl=False)
 
     try:
         translation_start = time.time()
@@ -362,18 +554,19 @@ def translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name,
         translation_time = time.time() - translation_start
         click.echo()  # New line after progress
 
-        # Write translated SRT
+        # Write translated SRT (and bilingual SRT if requested) in parallel
         translated_srt_path = output_dir / f"{date_prefix}_{base_name}.{target_lang}.srt"
-        writer = SubtitleWriter()
-        writer.write_srt(translated_segments, str(translated_srt_path))
+        bilingual_srt_path = output_dir / f"{date_prefix}_{base_name}.bilingual.srt"
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            writes = [pool.submit(writer.write_srt, translated_segments, str(translated_srt_path))]
+            if want_bilingual:
+                bilingual_segments = create_bilingual_segments(segments, translated_segments)
+                writes.append(pool.submit(writer.write_srt, bilingual_segments, str(bilingual_srt_path)))
+            for write in writes:
+                write.result()
 
         click.echo(f"✓ Translated SRT created: {translated_srt_path.name}")
-
-        # Create bilingual output if requested
         if want_bilingual:
-            bilingual_segments = create_bilingual_segments(segments, translated_segments)
-            bilingual_srt_path = output_dir / f"{date_prefix}_{base_name}.bilingual.srt"
-            writer.write_srt(bilingual_segments, str(bilingual_srt_path))
             click.echo(f"✓ Bilingual SRT created: {bilingual_srt_path.name}")
 
         return translation_time
@@ -386,7 +579,7 @@ def translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name,
         return None
 
 
-def handle_srt_translation(srt_path: str, output: str, config: dict, yes: bool = False, language_name: str = None, custom_prompt: str = None):
+def handle_srt_translation(srt_path: str, output: str, config: dict, yes: bool = False, language_name: str = None, custom_prompt: str = None, concurrency: int = None):
     """
     Handle translation of an existing SRT file.
 
@@ -396,6 +589,8 @@ def handle_srt_translation(srt_path: str, output: str, config: dict, yes: bool =
         config: Configuration dictionary from load_config()
         yes: If True, skip prompts and use defaults
         language_name: Source language name from --language flag (used with --yes)
+        custom_prompt: Extra instructions for the translation model (from --prompt-file)
+        concurrency: Batches to send to Ollama in parallel (from --concurrency)
     """
     srt_file = Path(srt_path)
     click.echo(f"SRT file detected: {srt_file.name}")
@@ -408,6 +603,9 @@ def handle_srt_translation(srt_path: str, output: str, config: dict, yes: bool =
     except Exception as e:
         click.echo(f"❌ Failed to parse SRT file: {e}", err=True)
         sys.exit(1)
+    if not segments:
+        click.echo(f"❌ No subtitle segments found in {srt_file.name}", err=True)
+        sys.exit(1)
 
     click.echo(f"✓ Parsed {len(segments)} segments from SRT file")
 
@@ -418,22 +616,13 @@ def handle_srt_translation(srt_path: str, output: str, config: dict, yes: bool =
     # Expected format: YYYYMMDD_name.srt or YYYYMMDD_name.Language.srt
     filename = srt_file.stem  # Remove .srt extension
 
-    # Check if filename starts with date prefix
-    if len(filename) >= 8 and filename[:8].isdigit():
-        date_prefix = filename[:8]
-        rest = filename[9:] if len(filename) > 9 else filename[8:]  # Skip underscore
-    else:
+    # One match splits off the date prefix and the language suffix (e.g., "video.Chinese" -> "video")
+    date_prefix, base_name = SRT_NAME_PATTERN.fullmatch(filename).groups()
+    if date_prefix is None:
         date_prefix = get_date_prefix(file_path=srt_file)
-        rest = filename
-
-    # Remove language suffix if present (e.g., "video.Chinese" -> "video")
-    if '.' in rest:
-        base_name = rest.rsplit('.', 1)[0]
-    else:
-        base_name = rest
 
     # Go directly to translation
-    translation_time = translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name, config, yes=yes, language_name=language_name, custom_prompt=custom_prompt)
+    translation_time = translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name, config, yes=yes, language_name=language_name, custom_prompt=custom_prompt, concurrency=concurrency, writer=writer)
 
     click.echo("\n✅ Done!")
 
@@ -443,10 +632,37 @@ def handle_srt_translation(srt_path: str, output: str, config: dict, yes: bool =
         click.echo(f"  Translation: {translation_time:.1f}s")
 
 
+def _get_cuda_driver_version() -> str:
+    """
+    Get the max CUDA version supported by the installed driver, without spawning a process.
+
+    Asks the driver library directly via cuDriverGetVersion (safe to call before cuInit).
+
+    Returns:
+        CUDA version string (e.g., "12.2"), or None if the driver library can't be loaded
+    """
+    import ctypes
+    library_names = ['nvcuda.dll'] if platform.system() == "Windows" else ['libcuda.so.1', 'libcuda.so']
+    for name in library_names:
+        try:
+            libcuda = ctypes.CDLL(name)
+            version = ctypes.c_int()
+            if libcuda.cuDriverGetVersion(ctypes.byref(version)) == 0 and version.value:
+                # Encoded as 1000 * major + 10 * minor, e.g. 12020 -> "12.2"
+                return f"{version.value // 1000}.{(version.value % 1000) // 10}"
+        except (OSError, AttributeError):
+            continue
+    return None
+
+
+@lru_cache(maxsize=1)
 def _get_nvidia_info() -> dict:
     """
     Get NVIDIA GPU information from nvidia-smi.
 
+    Only one nvidia-smi process is spawned; the CUDA version comes from the
+    driver library, falling back to the nvidia-smi header if that fails.
+
     Returns:
         dict with keys:
         - available: bool - whether NVIDIA GPU is available
@@ -466,22 +682,19 @@ def _get_nvidia_info() -> dict:
         driver_version = parts[0] if parts else None
         gpu_name = parts[1] if len(parts) > 1 else None
 
-        # Get CUDA version from nvidia-smi header
-        header_result = subprocess.run(
-            ['nvidia-smi'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        cuda_version = None
-        for line in header_result.stdout.split('\n'):
-            if 'CUDA Version:' in line:
-                # Parse "CUDA Version: 12.2" from the line
-                import re
-                match = re.search(r'CUDA Version:\s*(\d+\.\d+)', line)
-                if match:
-                    cuda_version = match.group(1)
-                break
+        cuda_version = _get_cuda_driver_version()
+        if cuda_version is None:
+            # Fall back to the CUDA version printed in the nvidia-smi header
+            header_result = subprocess.run(
+                ['nvidia-smi'],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+            header = header_result.stdout
+            match = 'CUDA Version:' in header and CUDA_VERSION_PATTERN.search(header)
+            if match:
+                cuda_version = match.group(1)
 
         return {
             'available': True,
@@ -521,19 +734,18 @@ def _get_cuda_compatibility(driver_version: str) -> list:
     return compatible
 
 
+def _is_installed(module_name: str) -> bool:
+    """Check if an optional package is installed without importing it."""
+    return importlib.util.find_spec(module_name) is not None
+
+
+@lru_cache(maxsize=1)
 def _check_ffmpeg() -> bool:
-    """Check if ffmpeg is installed."""
-    try:
-        subprocess.run(
-            ['ffmpeg', '-version'],
-            capture_output=True,
-            check=True
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    """Check if ffmpeg is installed (PATH lookup, no process spawned)."""
+    return shutil.which('ffmpeg') is not None
 
 
+@lru_cache(maxsize=1)
 def _check_ollama() -> bool:
     """Check if Ollama is running by pinging the API."""
     import requests
@@ -548,29 +760,30 @@ def _check_ollama() -> bool:
 
 def run_system_check():
     """Run system diagnostics and display results."""
+    is_apple_silicon = platform.system() == "Darwin" and platform.machine() == "arm64"
+
+    # Start the independent probes (subprocesses, HTTP) together; results are printed in order below
+    probes = [('ffmpeg', _check_ffmpeg), ('ollama', _check_ollama)]
+    if not is_apple_silicon:
+        probes.append(('nvidia', _get_nvidia_info))
+    pool = ThreadPoolExecutor(max_workers=4)
+    futures = {name: pool.submit(probe) for name, probe in probes}
+    pool.shutdown(wait=False)
+
     click.echo("System Check:")
     click.echo(f"  Platform: {platform.system()} {platform.machine()}")
 
     # Check Apple Silicon
-    if platform.system() == "Darwin" and platform.machine() == "arm64":
+    if is_apple_silicon:
         click.echo("  Apple Silicon: Yes")
-        try:
-            import mlx_whisper  # noqa: F401
+        if _is_installed('mlx_whisper'):
             click.echo("  mlx-whisper: Installed (Metal GPU acceleration available)")
-        except ImportError:
+        else:
             click.echo("  mlx-whisper: Not installed")
             click.echo("    → Run 'uv sync --extra mlx' for Metal GPU acceleration")
-
-        # Check stable-ts on Apple Silicon
-        try:
-            import stable_whisper  # noqa: F401
-            click.echo("  stable-ts: Installed (use --stable for better timestamps)")
-        except ImportError:
-            click.echo("  stable-ts: Not installed")
-            click.echo("    → Run 'uv sync --extra stable' for better timestamp accuracy")
     else:
         # Check NVIDIA/CUDA
-        nvidia_info = _get_nvidia_info()
+        nvidia_info = futures['nvidia'].result()
         click.echo(f"  NVIDIA GPU: {'Found' if nvidia_info['available'] else 'Not found'}")
 
         if nvidia_info['available']:
@@ -628,151 +841,42 @@ def run_system_check():
         elif cuda_available:
             click.echo(f"  PyTorch CUDA Device: {torch.cuda.get_device_name(0)}")
 
-        # Check stable-ts on non-Apple Silicon
-        try:
-            import stable_whisper  # noqa: F401
-            click.echo("  stable-ts: Installed (use --stable for better timestamps)")
-        except ImportError:
-            click.echo("  stable-ts: Not installed")
-            click.echo("    → Run 'uv sync --extra stable' for better timestamp accuracy")
+        if _is_installed('faster_whisper'):
+            click.echo("  faster-whisper: Installed (used for transcription, batched on CUDA)")
+        else:
+            click.echo("  faster-whisper: Not installed")
+            click.echo("    → Run 'uv sync --extra faster' for faster transcription")
+
+    # Check stable-ts
+    if _is_installed('stable_whisper'):
+        click.echo("  stable-ts: Installed (use --stable for better timestamps)")
+    else:
+        click.echo("  stable-ts: Not installed")
+        click.echo("    → Run 'uv sync --extra stable' for better timestamp accuracy")
 
     # Check ffmpeg
-    ffmpeg_ok = _check_ffmpeg()
+    ffmpeg_ok = futures['ffmpeg'].result()
     click.echo(f"  ffmpeg: {'Installed' if ffmpeg_ok else 'Not found'}")
     if not ffmpeg_ok:
         click.echo("    → Install with: brew install ffmpeg (macOS) or apt install ffmpeg (Linux)")
 
     # Check Ollama
-    ollama_ok = _check_ollama()
+    ollama_ok = futures['ollama'].result()
     click.echo(f"  Ollama: {'Running' if ollama_ok else 'Not running or not installed'}")
     if not ollama_ok:
         click.echo("    → Optional: Install from https://ollama.ai for subtitle translation")
 
 
-@click.command(context_settings={"help_option_names": ["-h", "--help"]})
-@click.argument('data_input', type=DataInput(), required=False)
-@click.option(
-    '--model',
-    default='medium',
-    type=click.Choice(['tiny', 'base', 'small', 'medium', 'large'], case_sensitive=False),
-    help='Whisper model size (larger = more accurate but slower)'
-)
-@click.option(
-    '--language',
-    default=None,
-    help='Language code (e.g., en, zh, es). Auto-detect if not specified.'
-)
-@click.option(
-    '--output',
-    '-o',
-    default=None,
-    type=click.Path(),
-    help='Output directory (default: same as video file)'
-)
-@click.option(
-    '--keep-audio',
-    is_flag=True,
-    default=False,
-    help='Keep the extracted audio file (WAV)'
-)
-@click.option(
-    '--yes', '-y',
-    is_flag=True,
-    default=False,
-    help='Answer yes to all prompts (use defaults for translation)'
-)
-@click.option(
-    '--check-system',
-    is_flag=True,
-    default=False,
-    help='Check system capabilities (GPU, CUDA, ffmpeg, Ollama)'
-)
-@click.option(
-    '--stable',
-    is_flag=True,
-    default=False,
-    help='Use stable-ts for better timestamp accuracy (requires: uv sync --extra stable)'
-)
-@click.option(
-    '--vad',
-    is_flag=True,
-    default=False,
-    help='Enable VAD to reduce hallucinations in silence (requires: --stable)'
-)
-@click.option(
-    '--subtitle',
-    type=int,
-    default=None,
-    help='Pre-select subtitle by index (0=transcribe, 1+=download that subtitle). Skips interactive prompt.'
-)
-@click.option(
-    '--preview',
-    is_flag=True,
-    default=False,
-    help='Check subtitles, prompt user, output the real command with --subtitle N to stdout, then exit.'
-)
-@click.option(
-    '--action',
-    type=click.Choice(['transcribe', 'translate'], case_sensitive=False),
-    default=None,
-    help='Action to perform: transcribe (no translation), translate (SRT input only). Default: both.'
-)
-@click.option(
-    '--prompt-file',
-    type=click.Path(exists=True),
-    default=None,
-    help='Text file with extra instructions for the translation model (e.g., glossary, style guide).'
-)
-@click.option(
-    '--preview-opt',
-    'preview_opt',
-    type=str,
-    default=None,
-    help='Non-interactive preview selection: L=list subtitles (JSON), S=skip, 0=transcribe, N=subtitle index. Implies --preview.'
-)
-def main(data_input, model, language, output, keep_audio, yes, check_system, stable, vad, subtitle, preview, action, prompt_file, preview_opt):
+def process_input(data_input, model, language, output, keep_audio, yes, stable, vad, compute_type,
+                  compile_model, split_device, condition_on_previous, subtitle, preview, action, prompt_file, concurrency, preview_opt,
+                  daemon=False):
     """
-    Extract subtitles from DATA_INPUT (file path, URL, or SRT file) using AI transcription.
-
-    Generates .srt file for video players with timestamps.
+    Transcribe and/or translate one DATA_INPUT with the options given to main().
 
-    \b
-    Examples:
-      python main.py video.mp4
-      python main.py "https://www.youtube.com/watch?v=VIDEO_ID"
-      python main.py video.mp4 --model medium --language en
-      python main.py existing.srt
-      python main.py "https://youtube.com/watch?v=ID" --preview
-      python main.py "https://youtube.com/watch?v=ID" --subtitle 1 -y
-
-    \b
-    Batch scripting (two-pass workflow):
-      # Pass 1: interactively pick subtitles, save real commands
-      bash preview_run.sh > real_run.sh
-      # Pass 2: run unattended
-      bash real_run.sh
+    The Whisper model comes from _get_transcriber(), so it is loaded once for all inputs.
+    With daemon=True a running --daemon transcribes instead, if there is one.
+    Exits the process on errors.
     """
-    # Handle --check-system flag (runs without requiring data_input)
-    if check_system:
-        run_system_check()
-        return
-
-    # data_input is required for normal operation
-    if data_input is None:
-        raise click.UsageError("Missing argument 'DATA_INPUT'.")
-
-    # --preview-opt implies --preview and validates the value
-    if preview_opt is not None:
-        preview_opt = preview_opt.lower()
-        if preview_opt not in ('l', 's') and not preview_opt.isdigit():
-            raise click.UsageError(
-                f"Invalid --preview-opt value: '{preview_opt}'. "
-                "Must be L (list), S (skip), 0 (transcribe), or a subtitle index number."
-            )
-        if preview_opt.isdigit():
-            preview_opt = int(preview_opt)
-        preview = True
-
     try:
         # Load config for output directory settings
         config = load_config()
@@ -811,21 +915,60 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
         # Handle SRT file input - skip to translation
         if is_srt_file(data_input):
             if preview:
-                cmd = _build_preview_command(data_input, 0, model, language, output, keep_audio, stable, vad, prompt_file=prompt_file)
+                cmd = _build_preview_command(data_input, 0, model, language, output, keep_audio, stable, vad,
+                                             prompt_file=prompt_file, compute_type=compute_type, concurrency=concurrency,
+                                             compile_model=compile_model, split_device=split_device,
+                                             condition_on_previous=condition_on_previous)
                 click.echo(cmd)
                 return
-            handle_srt_translation(data_input, output, config, yes=yes, language_name=language_name, custom_prompt=custom_prompt)
+            handle_srt_translation(data_input, output, config, yes=yes, language_name=language_name, custom_prompt=custom_prompt, concurrency=concurrency)
             return
 
+        def prepare_transcriber():
+            """Free Ollama's VRAM and return (transcriber_options, use_daemon, transcriber)."""
+            # Ollama models must be evicted before Whisper starts loading
+            if config['ollama'].get('auto_unload', False):
+                n_unloaded = unload_all_models(config['ollama']['base_url'])
+                if n_unloaded:
+                    click.echo(f"  Unloading {n_unloaded} Ollama model(s) to free VRAM...")
+
+            options = {
+                'model_size': model, 'use_stable': stable, 'use_vad': vad,
+                'compute_type': compute_type or config.get('whisper', {}).get('compute_type'),
+                'use_compile': compile_model,
+                'split_device': split_device,
+                'condition_on_previous_text': condition_on_previous,
+                'download_root': config.get('whisper', {}).get('model_dir'),
+            }
+            # A running --daemon already holds the model, so nothing is loaded here.
+            # Only probed on request: the socket is never touched without --daemon
+            if daemon and transcriber_daemon.is_running():
+                return options, True, None
+            return options, False, _get_transcriber(**options)
+
         # Step 0: Handle URL vs file path
-        is_url_input = False
+        is_url_input = is_url(data_input)
         temp_dir_path = None
+        model_loading = None
 
-        if is_url(data_input):
-            is_url_input = True
+        if is_url_input:
             click.echo(f"Detected URL: {data_input}", err=preview)
 
             downloader = VideoDownloader()  # Uses system temp directory by default
+            video_meta: dict = {}
+
+            def url_video_info():
+                """ID and upload date for naming, reusing the subtitle check's metadata when it has them."""
+                if 'video_id' in video_meta:
+                    return video_meta
+                return downloader.get_video_info(data_input)
+
+            # SRT path a transcription of this URL will write (two-phase preview only)
+            def url_srt_path():
+                video_info = url_video_info()
+                date_prefix = get_date_prefix(upload_date=video_info.get('upload_date'))
+                output_dir = get_output_directory(output, config, Path.cwd())
+                return str(output_dir / f"{date_prefix}_{video_info['video_id']}.srt")
             temp_dir_path = downloader.download_dir
 
             # When --subtitle 0 is given, skip the subtitle check entirely
@@ -893,19 +1036,15 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
                         comment = f"# {format_video_label(video_meta, data_input)}"
                         click.echo(comment)
                         if choice == 0:
-                            if config['ollama'].get('auto_unload', False):
-                                # Two-phase: transcribe first, translate separately (VRAM constraint)
-                                video_info = downloader.get_video_info(data_input)
-                                video_id = video_info['video_id']
-                                date_prefix = get_date_prefix(upload_date=video_info.get('upload_date'))
-                                output_dir = get_output_directory(output, config, Path.cwd())
-                                srt_path = str(output_dir / f"{date_prefix}_{video_id}.srt")
-                                click.echo(_build_transcribe_command(data_input, model, language, output, keep_audio, stable, vad))
-                                click.echo(_build_translate_command(srt_path, output, language, prompt_file=prompt_file))
-                            else:
-                                click.echo(_build_preview_command(data_input, 0, model, language, output, keep_audio, stable, vad))
+                            _echo_transcribe_preview(data_input, config, url_srt_path, model, language, output, keep_audio, stable, vad,
+                                                     compute_type=compute_type, prompt_file=prompt_file, concurrency=concurrency,
+                                                     compile_model=compile_model, split_device=split_device,
+                                                     condition_on_previous=condition_on_previous)
                         else:
-                            cmd = _build_preview_command(data_input, choice, model, language, output, keep_audio, stable, vad, prompt_file=prompt_file)
+                            cmd = _build_preview_command(data_input, choice, model, language, output, keep_audio, stable, vad,
+                                                         prompt_file=prompt_file, compute_type=compute_type, concurrency=concurrency,
+                                                         compile_model=compile_model, split_device=split_device,
+                                                         condition_on_previous=condition_on_previous)
                             click.echo(cmd)
                         return
                     elif subtitle is not None:
@@ -938,7 +1077,7 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
                         click.echo(f"\nDownloading {selected_name} subtitle...")
 
                         # Get video ID for output naming
-                        video_info = downloader.get_video_info(data_input)
+                        video_info = url_video_info()
                         base_name = video_info['video_id']
 
                         # Get date prefix from video upload date
@@ -952,10 +1091,6 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
                         # Download subtitle
                         downloader.download_subtitle(data_input, selected_lang, str(srt_path))
 
-                        # Parse the downloaded SRT for translation
-                        writer = SubtitleWriter()
-                        segments = writer.parse_srt(str(srt_path))
-
                         click.echo(f"✓ Subtitle downloaded: {srt_path}")
 
                         # Derive translation source from the downloaded subtitle's language,
@@ -964,7 +1099,8 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
                         download_language_name = parsed_sub_lang[0] if parsed_sub_lang else selected_name
 
                         # Offer translation
-                        translation_time = translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name, config, yes=yes, language_name=download_language_name, custom_prompt=custom_prompt)
+                        # The downloaded SRT is parsed only if the translation is accepted
+                        translation_time = translate_subtitles(None, srt_path, output_dir, date_prefix, base_name, config, yes=yes, language_name=download_language_name, custom_prompt=custom_prompt, concurrency=concurrency)
 
                         click.echo("\n✅ Done! Subtitle download complete.")
                         click.echo(f"\nOutput files saved to:")
@@ -1012,17 +1148,10 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
 
                         comment = f"# {format_video_label(video_meta, data_input)}"
                         click.echo(comment)
-                        if config['ollama'].get('auto_unload', False):
-                            # Two-phase: transcribe first, translate separately (VRAM constraint)
-                            video_info = downloader.get_video_info(data_input)
-                            video_id = video_info['video_id']
-                            date_prefix = get_date_prefix(upload_date=video_info.get('upload_date'))
-                            output_dir = get_output_directory(output, config, Path.cwd())
-                            srt_path = str(output_dir / f"{date_prefix}_{video_id}.srt")
-                            click.echo(_build_transcribe_command(data_input, model, language, output, keep_audio, stable, vad))
-                            click.echo(_build_translate_command(srt_path, output, language, prompt_file=prompt_file))
-                        else:
-                            click.echo(_build_preview_command(data_input, 0, model, language, output, keep_audio, stable, vad))
+                        _echo_transcribe_preview(data_input, config, url_srt_path, model, language, output, keep_audio, stable, vad,
+                                                 compute_type=compute_type, prompt_file=prompt_file, concurrency=concurrency,
+                                                 compile_model=compile_model, split_device=split_device,
+                                                 condition_on_previous=condition_on_previous)
                         return
                     elif subtitle is not None and subtitle > 0:
                         click.echo(
@@ -1038,7 +1167,12 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
             elif subtitles_checked and subtitles:
                 click.echo("\nProceeding with video transcription...")
 
-            click.echo("\n[0/4] Downloading video...")
+            click.echo("\n[0/4] Downloading audio...")
+
+            # Whisper loads from disk while yt-dlp waits on the network
+            transcriber_options, use_daemon, transcriber = prepare_transcriber()
+            if transcriber:
+                model_loading = _load_model_in_background(transcriber)
 
             video_info = downloader.download(data_input, quiet=False)
 
@@ -1064,14 +1198,14 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
             click.echo(f"Processing: {video_path.name}")
 
             if preview:
-                if config['ollama'].get('auto_unload', False):
-                    # Two-phase: transcribe first, translate separately (VRAM constraint)
-                    output_dir = get_output_directory(output, config, video_path.parent)
-                    srt_path = str(output_dir / f"{date_prefix}_{base_name}.srt")
-                    click.echo(_build_transcribe_command(data_input, model, language, output, keep_audio, stable, vad))
-                    click.echo(_build_translate_command(srt_path, output, language, prompt_file=prompt_file))
-                else:
-                    click.echo(_build_preview_command(data_input, 0, model, language, output, keep_audio, stable, vad))
+                _echo_transcribe_preview(
+                    data_input, config,
+                    lambda: str(get_output_directory(output, config, video_path.parent) / f"{date_prefix}_{base_name}.srt"),
+                    model, language, output, keep_audio, stable, vad,
+                    compute_type=compute_type, prompt_file=prompt_file, concurrency=concurrency,
+                    compile_model=compile_model, split_device=split_device,
+                    condition_on_previous=condition_on_previous
+                )
                 return
 
         # Determine output directory (priority: CLI > config > default)
@@ -1080,44 +1214,80 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
         output_dir = get_output_directory(output, config, default_output)
 
         # Generate output file paths with date prefix
-        # Audio is temporary - save to video's directory (temp dir for URLs)
+        # Audio is only written with --keep-audio - saved to video's directory (temp dir for URLs)
         audio_path = video_path.parent / f"{date_prefix}_{base_name}.wav"
         srt_path = output_dir / f"{date_prefix}_{base_name}.srt"
 
         # Step 1: Extract audio
-        step_num = "[1/4]" if is_url(data_input) else "[1/3]"
+        step_num = "[1/4]" if is_url_input else "[1/3]"
         click.echo(f"\n{step_num} Extracting audio from video...")
-        extractor = AudioExtractor()
-        extractor.extract_audio(str(video_path), str(audio_path))
-        click.echo(f"✓ Audio extracted to: {audio_path.name}")
-
-        # Step 2: Transcribe audio
-        step_num = "[2/4]" if is_url(data_input) else "[2/3]"
-        click.echo(f"\n{step_num} Transcribing audio (model: {model})...")
-        if language_code:
-            click.echo(f"      Language: {language_name} ({language_code})")
-        else:
-            click.echo("      Language: auto-detect")
 
-        if config['ollama'].get('auto_unload', False):
-            n_unloaded = unload_all_models(config['ollama']['base_url'])
-            if n_unloaded:
-                click.echo(f"  Unloading {n_unloaded} Ollama model(s) to free VRAM...")
+        if not is_url_input:
+            transcriber_options, use_daemon, transcriber = prepare_transcriber()
 
-        transcriber = Transcriber(model_size=model, use_stable=stable, use_vad=vad)
-        click.echo(f"      Device: {transcriber.device} ({transcriber.compute_type})")
-        click.echo(f"      Backend: {transcriber.backend}")
-        transcribe_start = time.time()
-        segments = transcriber.transcribe(str(audio_path), language=language_code)
-        transcribe_time = time.time() - transcribe_start
-        click.echo(f"✓ Transcription complete ({len(segments)} segments)")
+        # Load the Whisper model in the background while ffmpeg decodes the audio
+        extractor = AudioExtractor()
+        writer = SubtitleWriter()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            if transcriber and model_loading is None:
+                # Not a pool task: leaving the pool on an extraction error would wait for it
+                model_loading = _load_model_in_background(transcriber)
+            # One ffmpeg decode; the samples go straight to Whisper
+            audio = extractor.extract_to_array(str(video_path))
+            if is_url_input:
+                # The download is only decoded once; don't let it crowd the page cache
+                extractor.drop_page_cache(str(video_path))
+            if keep_audio:
+                # The WAV is written from the same samples while Whisper runs
+                wav_writing = pool.submit(extractor.write_wav, audio, str(audio_path))
+            click.echo("✓ Audio extracted")
+
+            # Step 2: Transcribe audio
+            step_num = "[2/4]" if is_url_input else "[2/3]"
+            click.echo(f"\n{step_num} Transcribing audio (model: {model})...")
+            if language_code:
+                click.echo(f"      Language: {language_name} ({language_code})")
+            else:
+                click.echo("      Language: auto-detect")
+
+            transcribe_start = time.time()
+            reply = transcriber_daemon.transcribe(audio, language_code, transcriber_options) if use_daemon else None
+            if reply is not None:
+                click.echo(f"      Device: {reply['device']} ({reply['compute_type']})")
+                click.echo(f"      Backend: {reply['backend']} (daemon)")
+                backend, device = reply['backend'], reply['device']
+                segments = reply['segments']
+            else:
+                if transcriber is None:
+                    # The daemon stopped after the check; transcribe locally instead
+                    transcriber = _get_transcriber(**transcriber_options)
+                    model_loading = pool.submit(transcriber.load_model)
+                model_loading.result()
+                click.echo(f"      Device: {transcriber.device} ({transcriber.compute_type})")
+                click.echo(f"      Backend: {transcriber.backend}")
+                backend, device = transcriber.backend, transcriber.device
+                transcribe_start = time.time()
+                # Segments are written as they are decoded; the SRT replaces any old one
+                # only once transcription succeeds, so a failed run leaves no partial file
+                with writer.srt_stream(str(srt_path)) as write_segment:
+                    segments = transcriber.transcribe(audio, language=language_code, on_segment=write_segment)
+            if compute_type and backend != "faster-whisper":
+                click.echo("      Note: --compute-type only applies to the faster-whisper backend")
+            if compile_model and backend != "openai-whisper":
+                click.echo("      Note: --compile only applies to the openai-whisper backend")
+            if split_device and not (backend == "openai-whisper" and device == "cuda"):
+                click.echo("      Note: --split-device only applies to the openai-whisper backend on CUDA")
+            transcribe_time = time.time() - transcribe_start
+            click.echo(f"✓ Transcription complete ({len(segments)} segments)")
+
+            if keep_audio:
+                wav_writing.result()
 
         # Step 3: Write subtitle files
-        step_num = "[3/4]" if is_url(data_input) else "[3/3]"
+        step_num = "[3/4]" if is_url_input else "[3/3]"
         click.echo(f"\n{step_num} Writing subtitle file...")
-        writer = SubtitleWriter()
-
-        writer.write_srt(segments, str(srt_path))
+        if reply is not None:
+            writer.write_srt(segments, str(srt_path))
         click.echo(f"✓ SRT file created: {srt_path}")
 
         # Step 4: Offer translation (for URL inputs this becomes [4/4])
@@ -1125,13 +1295,9 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
         if action == 'transcribe':
             translation_time = None
         else:
-            translation_time = translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name, config, yes=yes, language_name=language_name, custom_prompt=custom_prompt)
+            translation_time = translate_subtitles(segments, srt_path, output_dir, date_prefix, base_name, config, yes=yes, language_name=language_name, custom_prompt=custom_prompt, concurrency=concurrency, writer=writer)
 
-        # Clean up audio file if not keeping it
-        if not keep_audio and audio_path.exists():
-            audio_path.unlink()
-            click.echo(f"\n✓ Cleaned up temporary audio file")
-        elif keep_audio:
+        if keep_audio:
             click.echo(f"\n✓ Audio file kept: {audio_path}")
 
         click.echo("\n✅ Done! Subtitle extraction complete.")
@@ -1153,5 +1319,204 @@ def main(data_input, model, language, output, keep_audio, yes, check_system, sta
         sys.exit(1)
 
 
+
+@click.command(context_settings={"help_option_names": ["-h", "--help"]})
+@click.argument('data_inputs', metavar='[DATA_INPUT]...', type=DataInput(), nargs=-1)
+@click.option(
+    '--model',
+    default='medium',
+    type=click.Choice(['tiny', 'base', 'small', 'medium', 'large'], case_sensitive=False),
+    help='Whisper model size (larger = more accurate but slower)'
+)
+@click.option(
+    '--language',
+    default=None,
+    help='Language code (e.g., en, zh, es). Auto-detect if not specified.'
+)
+@click.option(
+    '--output',
+    '-o',
+    default=None,
+    type=click.Path(),
+    help='Output directory (default: same as video file)'
+)
+@click.option(
+    '--keep-audio',
+    is_flag=True,
+    default=False,
+    help='Keep the extracted audio file (WAV)'
+)
+@click.option(
+    '--yes', '-y',
+    is_flag=True,
+    default=False,
+    help='Answer yes to all prompts (use defaults for translation)'
+)
+@click.option(
+    '--check-system',
+    is_flag=True,
+    default=False,
+    help='Check system capabilities (GPU, CUDA, ffmpeg, Ollama)'
+)
+@click.option(
+    '--daemon',
+    is_flag=True,
+    default=False,
+    help='Without DATA_INPUT: run a background server that keeps the Whisper model loaded. '
+         'With DATA_INPUT: transcribe through that server when it is running'
+)
+@click.option(
+    '--stable',
+    is_flag=True,
+    default=False,
+    help='Use stable-ts for better timestamp accuracy (requires: uv sync --extra stable)'
+)
+@click.option(
+    '--vad',
+    is_flag=True,
+    default=False,
+    help='Enable VAD to reduce hallucinations in silence (requires: --stable)'
+)
+@click.option(
+    '--compute-type',
+    type=click.Choice(COMPUTE_TYPES, case_sensitive=False),
+    default=None,
+    help='faster-whisper weight precision (default: int8_float16 on CUDA, int8 on CPU)'
+)
+@click.option(
+    '--compile', 'compile_model',
+    is_flag=True,
+    default=False,
+    help='Compile the openai-whisper encoder with torch.compile (slower start, faster transcription)'
+)
+@click.option(
+    '--split-device',
+    is_flag=True,
+    default=False,
+    help='openai-whisper on CUDA: run the encoder on the GPU and the decoder on the CPU to save VRAM'
+)
+@click.option(
+    '--condition-on-previous/--no-condition-on-previous',
+    default=None,
+    help='Feed each 30s window the previous window\'s text (default: on for audio up to 10 min, off for longer)'
+)
+@click.option(
+    '--subtitle',
+    type=int,
+    default=None,
+    help='Pre-select subtitle by index (0=transcribe, 1+=download that subtitle). Skips interactive prompt.'
+)
+@click.option(
+    '--preview',
+    is_flag=True,
+    default=False,
+    help='Check subtitles, prompt user, output the real command with --subtitle N to stdout, then exit.'
+)
+@click.option(
+    '--action',
+    type=click.Choice(['transcribe', 'translate'], case_sensitive=False),
+    default=None,
+    help='Action to perform: transcribe (no translation), translate (SRT input only). Default: both.'
+)
+@click.option(
+    '--prompt-file',
+    type=click.Path(exists=True),
+    default=None,
+    help='Text file with extra instructions for the translation model (e.g., glossary, style guide).'
+)
+@click.option(
+    '--concurrency',
+    type=click.IntRange(min=1),
+    default=None,
+    help='Translation batches sent to Ollama in parallel (overrides ollama.concurrency). '
+         'Match the server\'s OLLAMA_NUM_PARALLEL.'
+)
+@click.option(
+    '--preview-opt',
+    'preview_opt',
+    type=str,
+    default=None,
+    help='Non-interactive preview selection: L=list subtitles (JSON), S=skip, 0=transcribe, N=subtitle index. Implies --preview.'
+)
+def main(data_inputs, model, language, output, keep_audio, yes, check_system, daemon, stable, vad, compute_type, compile_model, split_device, condition_on_previous, subtitle, preview, action, prompt_file, concurrency, preview_opt):
+    """
+    Extract subtitles from DATA_INPUT (file path, URL, or SRT file) using AI transcription.
+
+    Generates .srt file for video players with timestamps. Several inputs
+    are processed one after another with the Whisper model loaded once.
+
+    \b
+    Examples:
+      python main.py video.mp4
+      python main.py "https://www.youtube.com/watch?v=VIDEO_ID"
+      python main.py video.mp4 --model medium --language en
+      python main.py part1.mp4 part2.mp4 part3.mp4
+      python main.py existing.srt
+      python main.py "https://youtube.com/watch?v=ID" --preview
+      python main.py "https://youtube.com/watch?v=ID" --subtitle 1 -y
+
+    \b
+    Parallel translation:
+      # OLLAMA_NUM_PARALLEL: concurrent requests per loaded model
+      # OLLAMA_MAX_LOADED_MODELS: models the server keeps loaded at once
+      OLLAMA_NUM_PARALLEL=4 OLLAMA_MAX_LOADED_MODELS=1 ollama serve
+      python main.py existing.srt --concurrency 4
+
+    \b
+    Batch scripting (two-pass workflow):
+      # Pass 1: interactively pick subtitles, save real commands
+      bash preview_run.sh > real_run.sh
+      # Pass 2: run unattended
+      bash real_run.sh
+    """
+    # Handle --check-system flag (runs without requiring data_input)
+    if check_system:
+        run_system_check()
+        return
+
+    if daemon and not transcriber_daemon.SUPPORTED:
+        raise click.UsageError("--daemon needs Unix sockets and is not available on this platform.")
+
+    # --daemon without data_input: serve transcriptions until Ctrl+C
+    if daemon and not data_inputs:
+        try:
+            address = transcriber_daemon.socket_path()
+            click.echo(f"Whisper daemon listening on {address} (Ctrl+C to stop)")
+            transcriber_daemon.serve(address)
+        except KeyboardInterrupt:
+            click.echo("\nWhisper daemon stopped.")
+        except OSError as e:
+            click.echo(f"❌ Error: cannot start the Whisper daemon: {e}", err=True)
+            sys.exit(1)
+        return
+
+    # data_input is required for normal operation
+    if not data_inputs:
+        raise click.UsageError("Missing argument 'DATA_INPUT'.")
+
+    # --preview-opt implies --preview and validates the value
+    if preview_opt is not None:
+        preview_opt = preview_opt.lower()
+        if preview_opt not in ('l', 's') and not preview_opt.isdigit():
+            raise click.UsageError(
+                f"Invalid --preview-opt value: '{preview_opt}'. "
+                "Must be L (list), S (skip), 0 (transcribe), or a subtitle index number."
+            )
+        if preview_opt.isdigit():
+            preview_opt = int(preview_opt)
+        preview = True
+
+    try:
+        for i, data_input in enumerate(data_inputs, 1):
+            if len(data_inputs) > 1:
+                click.echo(f"\n=== [{i}/{len(data_inputs)}] {data_input} ===", err=preview)
+            process_input(data_input, model, language, output, keep_audio, yes, stable, vad, compute_type,
+                          compile_model, split_device, condition_on_previous, subtitle, preview, action, prompt_file, concurrency, preview_opt,
+                          daemon=daemon)
+    finally:
+        # Release the Whisper model kept for the batch
+        _get_transcriber.cache_clear()
+        unload_models()
+
 if __name__ == '__main__':
     main()
@@ -1,5 +1,4 @@
 import os
-import ffmpeg
 from pathlib import Path
 
 
@@ -24,6 +23,9 @@ class AudioExtractor:
         if not os.path.exists(video_path):
             raise FileNotFoundError(f"Video file not found: {video_path}")
 
+        # Imported on use so --help and SRT-only runs don't load ffmpeg-python
+        import ffmpeg
+
         try:
             # Extract audio using ffmpeg
             # Convert to WAV format for better compatibility with Whisper
@@ -36,6 +38,109 @@ class AudioExtractor:
             stderr = e.stderr.decode() if e.stderr else "Unknown error"
             raise Exception(f"Failed to extract audio: {stderr}")
 
+    def extract_to_array(self, video_path: str):
+        """
+        Extract audio from a video file into memory, without writing a WAV file.
+
+        ffmpeg decodes to raw 16 kHz mono PCM on stdout, the same format
+        Whisper would otherwise load back from the WAV file.
+
+        Args:
+            video_path: Path to the input video file
+
+        Returns:
+            numpy float32 array of samples in [-1.0, 1.0)
+
+        Raises:
+            FileNotFoundError: If the video file doesn't exist
+            Exception: If ffmpeg extraction fails
+        """
+        import ffmpeg
+        import numpy as np
+
+        if not os.path.exists(video_path):
+            raise FileNotFoundError(f"Video file not found: {video_path}")
+
+        try:
+            stream = ffmpeg.input(video_path)
+            stream = ffmpeg.output(stream, 'pipe:', format='s16le', acodec='pcm_s16le', ac=1, ar='16000')
+            out, _ = ffmpeg.run(stream, capture_stdout=True, capture_stderr=True)
+        except ffmpeg.Error as e:
+            stderr = e.stderr.decode() if e.stderr else "Unknown error"
+            raise Exception(f"Failed to extract audio: {stderr}")
+
+        return np.frombuffer(out, np.int16).astype(np.float32) / 32768.0
+
+    def write_wav(self, samples, output_path: str) -> str:
+        """
+        Write samples from extract_to_array() to a 16 kHz mono 16-bit WAV file.
+
+        The samples came from 16-bit PCM, so the file matches what
+        extract_audio() would have written, without a second ffmpeg run.
+
+        Args:
+            samples: numpy float32 array of samples in [-1.0, 1.0)
+            output_path: Path to save the WAV file
+
+        Returns:
+            Path to the written WAV file
+        """
+        import wave
+        import numpy as np
+
+        pcm = np.round(samples * 32768.0).astype('<i2')
+        with wave.open(output_path, 'wb') as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(pcm.tobytes())
+
+        return output_path
+
+    def read_wav(self, wav_path: str):
+        """
+        Load a 16 kHz mono 16-bit WAV file (as written by write_wav) without ffmpeg.
+
+        Args:
+            wav_path: Path to the WAV file
+
+        Returns:
+            numpy float32 array of samples in [-1.0, 1.0), or None if the file
+            isn't a WAV in exactly that format and has to be decoded by ffmpeg
+        """
+        import wave
+        import numpy as np
+
+        try:
+            with wave.open(wav_path, 'rb') as wav:
+                if (wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) != (1, 2, 16000):
+                    return None
+                frames = wav.readframes(wav.getnframes())
+        except (wave.Error, EOFError):
+            return None
+
+        return np.frombuffer(frames, dtype='<i2').astype(np.float32) / 32768.0
+
+    @staticmethod
+    def drop_page_cache(path: str) -> None:
+        """
+        Ask the kernel to evict a file that won't be read again from the page cache.
+
+        A downloaded video can be hundreds of MB; once decoded it would otherwise
+        push more useful data (e.g. the Whisper weights) out of memory. No-op where
+        posix_fadvise is unavailable (macOS, Windows).
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except (AttributeError, OSError):
+            pass
+        finally:
+            os.close(fd)
+
     def get_audio_output_path(self, video_path: str) -> str:
         """
         Generate the output path for the extracted audio file.
@@ -1,12 +1,44 @@
-from typing import List, Dict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 from pathlib import Path
+import os
 import re
 
 
+# One SRT block: optional sequence number, timestamp line, then the text (may span lines)
+SRT_BLOCK_PATTERN = re.compile(
+    r'^(?:\d+[ \t]*\n)?'
+    r'(\d+):(\d{2}):(\d{2})[,.](\d{1,3})[ \t]*-->[ \t]*(\d+):(\d{2}):(\d{2})[,.](\d{1,3})[^\n]*\n'
+    r'(.+)$',
+    re.DOTALL
+)
+
+
+# Bound once so the format spec isn't looked up per call
+_TIMESTAMP_FORMAT = "{:02d}:{:02d}:{:02d},{:03d}".format
+
+
+def _parse_timestamp(hours: str, minutes: str, seconds: str, fraction: str) -> float:
+    """Convert SRT timestamp fields to seconds; the fraction is decimal, so ',5' is 500ms."""
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds) + int(fraction.ljust(3, '0')) / 1000
+
+
+def _parse_block(block: str) -> Optional[Dict]:
+    """Parse one blank-line-separated SRT block; returns None if it is malformed."""
+    match = SRT_BLOCK_PATTERN.match(block.strip())
+    if not match:
+        return None
+    return {
+        'start': _parse_timestamp(*match.group(1, 2, 3, 4)),
+        'end': _parse_timestamp(*match.group(5, 6, 7, 8)),
+        'text': match.group(9)
+    }
+
+
 class SubtitleWriter:
     """Writes subtitle files in SRT and plain text formats."""
 
-    def write_srt(self, segments: List[Dict], output_path: str) -> None:
+    def write_srt(self, segments: Iterable[Dict], output_path: str) -> None:
         """
         Write segments to an SRT (SubRip) subtitle file.
 
@@ -20,31 +52,52 @@ class SubtitleWriter:
         This is a test.
 
         Args:
-            segments: List of segments with 'start', 'end', 'text' keys
+            segments: Segments with 'start', 'end', 'text' keys
             output_path: Path to save the SRT file
         """
-        if not segments:
-            Path(output_path).write_text("")
-            return
-
-        lines = []
-        for i, segment in enumerate(segments, start=1):
-            # Sequence number
-            lines.append(str(i))
+        with self.srt_stream(output_path) as write_segment:
+            for segment in segments:
+                write_segment(segment)
 
-            # Timestamp line
-            start_time = self._format_timestamp(segment['start'])
-            end_time = self._format_timestamp(segment['end'])
-            lines.append(f"{start_time} --> {end_time}")
+    @contextmanager
+    def srt_stream(self, output_path: str) -> Iterator[Callable[[Dict], None]]:
+        """
+        Open an SRT file and yield a function that appends one segment to it.
 
-            # Text content
-            lines.append(segment['text'])
+        Lets segments be written while a transcription is still producing them.
+        They go to a temporary file next to output_path, which replaces it only
+        once the block exits cleanly; on an error the temporary file is removed,
+        so an existing file is never truncated and no partial one is left behind.
 
-            # Blank line between entries
-            lines.append("")
+        Args:
+            output_path: Path to save the SRT file
 
-        content = "\n".join(lines)
-        Path(output_path).write_text(content, encoding='utf-8')
+        Yields:
+            Function taking a segment with 'start', 'end', 'text' keys
+        """
+        format_timestamp = self._format_timestamp
+        path = Path(output_path)
+        # Same directory, so os.replace is an atomic rename
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                count = 0
+
+                def write_segment(segment: Dict) -> None:
+                    nonlocal count
+                    count += 1
+                    # Entries are separated by a blank line
+                    separator = "\n" if count > 1 else ""
+                    f.write(
+                        f"{separator}{count}\n{format_timestamp(segment['start'])} --> "
+                        f"{format_timestamp(segment['end'])}\n{segment['text']}\n"
+                    )
+
+                yield write_segment
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
     def write_txt(self, segments: List[Dict], output_path: str) -> None:
         """
@@ -68,11 +121,48 @@ class SubtitleWriter:
 
         Path(output_path).write_text(content, encoding='utf-8')
 
+    @staticmethod
+    def iter_srt(srt_path: str) -> Iterator[Dict]:
+        """
+        Parse an SRT file lazily, yielding one segment at a time.
+
+        The file is read line by line, so only the current block is held in
+        memory. Accepts a UTF-8 BOM, CRLF line endings, '.' or ',' before the
+        milliseconds, and 1-3 millisecond digits. Malformed blocks are skipped.
+
+        Args:
+            srt_path: Path to the SRT file
+
+        Yields:
+            Segments with 'start', 'end', 'text' keys
+
+        Raises:
+            FileNotFoundError: If SRT file doesn't exist
+        """
+        with open(srt_path, encoding='utf-8-sig') as f:
+            block = []
+            for line in f:
+                if line.strip():
+                    block.append(line)
+                    continue
+                # A blank line ends the current block
+                if block:
+                    segment = _parse_block(''.join(block))
+                    if segment:
+                        yield segment
+                    block = []
+            if block:
+                segment = _parse_block(''.join(block))
+                if segment:
+                    yield segment
+
     @staticmethod
     def parse_srt(srt_path: str) -> List[Dict]:
         """
         Parse an SRT file into a list of segments.
 
+        See iter_srt() for the accepted format.
+
         Args:
             srt_path: Path to the SRT file
 
@@ -82,50 +172,7 @@ class SubtitleWriter:
         Raises:
             FileNotFoundError: If SRT file doesn't exist
         """
-        content = Path(srt_path).read_text(encoding='utf-8')
-
-        # Split into blocks (separated by double newlines)
-        blocks = re.split(r'\n\n+', content.strip())
-
-        segments = []
-        for block in blocks:
-            lines = block.strip().split('\n')
-            if len(lines) < 3:
-                continue  # Skip malformed blocks
-
-            # Line 0: sequence number (ignore)
-            # Line 1: timestamp
-            # Line 2+: text content
-
-            timestamp_line = lines[1]
-            text = '\n'.join(lines[2:])
-
-            # Parse timestamp: "00:00:00,000 --> 00:00:02,500"
-            match = re.match(r'(\d{2}):(\d{2}):(\d{2}),(\d{3})\s*-->\s*(\d{2}):(\d{2}):(\d{2}),(\d{3})', timestamp_line)
-            if match:
-                start_h, start_m, start_s, start_ms, end_h, end_m, end_s, end_ms = match.groups()
-
-                start_seconds = (
-                    int(start_h) * 3600 +
-                    int(start_m) * 60 +
-                    int(start_s) +
-                    int(start_ms) / 1000
-                )
-
-                end_seconds = (
-                    int(end_h) * 3600 +
-                    int(end_m) * 60 +
-                    int(end_s) +
-                    int(end_ms) / 1000
-                )
-
-                segments.append({
-                    'start': start_seconds,
-                    'end': end_seconds,
-                    'text': text
-                })
-
-        return segments
+        return list(SubtitleWriter.iter_srt(srt_path))
 
     def _format_timestamp(self, seconds: float) -> str:
         """
@@ -137,9 +184,9 @@ class SubtitleWriter:
         Returns:
             Formatted timestamp string
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
+        # Integer math on whole milliseconds; rounding avoids float drift (1.001 -> 1000.999...)
+        hours, milliseconds = divmod(round(seconds * 1000), 3600000)
+        minutes, milliseconds = divmod(milliseconds, 60000)
+        secs, milliseconds = divmod(milliseconds, 1000)
 
-        return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+        return _TIMESTAMP_FORMAT(hours, minutes, secs, milliseconds)
@@ -1,5 +1,8 @@
+import importlib.util
+import os
 import platform
-from typing import List, Dict, Optional
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
 
 
 MLX_MODEL_MAP = {
@@ -10,11 +13,45 @@ MLX_MODEL_MAP = {
     "large": "mlx-community/whisper-large-v3-mlx",
 }
 
+# CTranslate2 weight precisions accepted by faster-whisper
+COMPUTE_TYPES = ["int8", "int8_float16", "int8_float32", "int16", "float16", "bfloat16", "float32"]
+
+# Number of VAD-split audio chunks faster-whisper decodes at once, per device
+FASTER_WHISPER_BATCH_SIZE = {"cuda": 16, "cpu": 8}
+
+# Audio longer than this is transcribed without conditioning on the previous window's text
+LONG_AUDIO_SECONDS = 600
+
+# Loaded models shared by every Transcriber in the process, keyed by what they were loaded with
+_models: Dict[tuple, object] = {}
+_models_lock = threading.Lock()
+
+
+def unload_models() -> None:
+    """Drop all shared models so their memory can be freed."""
+    with _models_lock:
+        _models.clear()
+
+
+def _segment_dicts(segments) -> Iterable[Dict]:
+    """
+    Convert segment objects with start/end/text attributes (faster-whisper, stable-ts) to dicts.
+
+    Lazy, so a generator of segments (faster-whisper) is converted as it decodes.
+    """
+    return (
+        {'start': segment.start, 'end': segment.end, 'text': segment.text.strip()}
+        for segment in segments
+    )
+
 
 class Transcriber:
-    """Transcribes audio files using openai-whisper, mlx-whisper, or stable-ts."""
+    """Transcribes audio files using openai-whisper, faster-whisper, mlx-whisper, or stable-ts."""
 
-    def __init__(self, model_size: str = "medium", use_stable: bool = False, use_vad: bool = False):
+    def __init__(self, model_size: str = "medium", use_stable: bool = False, use_vad: bool = False,
+                 compute_type: Optional[str] = None, batch_size: Optional[int] = None,
+                 use_compile: bool = False, download_root: Optional[str] = None,
+                 split_device: bool = False, condition_on_previous_text: Optional[bool] = None):
         """
         Initialize the transcriber with a Whisper model.
         Automatically detects the best backend and device.
@@ -23,6 +60,19 @@ class Transcriber:
             model_size: Size of the Whisper model (tiny, base, small, medium, large)
             use_stable: If True, use stable-ts for better timestamp accuracy
             use_vad: If True, enable Silero VAD to reduce hallucinations (requires --stable)
+            compute_type: faster-whisper weight precision (see COMPUTE_TYPES). Defaults to
+                int8_float16 on CUDA and int8 on CPU; ignored by other backends.
+            batch_size: Audio chunks faster-whisper decodes at once. Defaults to 16 on
+                CUDA and 8 on CPU; ignored by other backends.
+            use_compile: If True, compile the openai-whisper encoder with torch.compile
+                when the model loads; ignored by other backends.
+            download_root: Directory to download and cache model weights in. Defaults to
+                each backend's own cache (~/.cache/whisper or the Hugging Face cache).
+            split_device: If True, run the openai-whisper encoder on CUDA and the decoder
+                on the CPU to save VRAM; ignored by other backends and without CUDA.
+            condition_on_previous_text: Feed each 30s window the text of the previous one.
+                None picks per audio: on up to LONG_AUDIO_SECONDS, off for longer audio.
+                faster-whisper's batched pipeline never conditions, so it ignores this.
         """
         self.model_size = model_size
         self.use_stable = use_stable
@@ -31,12 +81,31 @@ class Transcriber:
         if use_vad and not use_stable:
             raise ValueError("--vad requires --stable flag")
         self.backend, self.device, self.compute_type = self._detect_backend()
+        if compute_type and self.backend == "faster-whisper":
+            self.compute_type = compute_type
+        self.batch_size = batch_size or FASTER_WHISPER_BATCH_SIZE.get(self.device, 8)
+        self.use_compile = use_compile and self.backend == "openai-whisper"
+        self.split_device = split_device and self.backend == "openai-whisper" and self.device == "cuda"
+        self.condition_on_previous_text = condition_on_previous_text
+        self.download_root = os.path.expanduser(download_root) if download_root else None
         self.model = None
+        # (path, mtime) and samples of the last decoded audio file
+        self._audio_cache = None
+
+    # (backend, device, compute_type) per use_stable value; hardware doesn't change within a process
+    _backend_cache: Dict[bool, tuple] = {}
 
     def _detect_backend(self):
-        """Detect the best backend based on hardware and use_stable flag."""
+        """Detect the best backend based on hardware and use_stable flag, once per process."""
+        if self.use_stable not in Transcriber._backend_cache:
+            Transcriber._backend_cache[self.use_stable] = self._probe_backend(self.use_stable)
+        return Transcriber._backend_cache[self.use_stable]
+
+    @staticmethod
+    def _probe_backend(use_stable: bool):
+        """Import the backend packages and query the GPU to pick a backend."""
         # With --stable flag: use stable-ts
-        if self.use_stable:
+        if use_stable:
             try:
                 import stable_whisper  # noqa: F401
                 # Apple Silicon: use stable-ts MLX backend
@@ -61,33 +130,186 @@ class Transcriber:
             except ImportError:
                 pass
 
+        # faster-whisper (CTranslate2) when installed; device check doesn't need torch
+        if importlib.util.find_spec("faster_whisper") is not None:
+            import ctranslate2
+            # int8 weights halve memory traffic; activations stay float16 on GPU
+            if ctranslate2.get_cuda_device_count() > 0:
+                return "faster-whisper", "cuda", "int8_float16"
+            return "faster-whisper", "cpu", "int8"
+
         # Everyone else: use openai-whisper with PyTorch
         import torch
         if torch.cuda.is_available():
             return "openai-whisper", "cuda", "float16"
-        return "openai-whisper", "cpu", "float32"
+        return "openai-whisper", "cpu", "int8"
 
     def _load_model(self):
-        """Lazy load the Whisper model when needed."""
+        """
+        Lazy load the Whisper model when needed.
+
+        Another Transcriber with the same settings may already have loaded it; the lock
+        also keeps two threads from loading the same model at once.
+        """
         if self.model is None:
-            if self.backend == "openai-whisper":
-                import whisper
-                self.model = whisper.load_model(self.model_size, device=self.device)
-            elif self.backend == "stable-ts":
-                import stable_whisper
-                self.model = stable_whisper.load_model(self.model_size, device=self.device)
+            key = (self.backend, self.model_size, self.device, self.compute_type,
+                   self.download_root, self.use_compile, self.split_device)
+            with _models_lock:
+                if key not in _models:
+                    self._create_model()
+                    _models[key] = self.model
+                self.model = _models[key]
+
+    def _create_model(self):
+        """Load the model for the detected backend into self.model."""
+        if self.backend == "openai-whisper":
+            import whisper
+            if self.split_device:
+                self.model = whisper.load_model(self.model_size, device="cpu", download_root=self.download_root)
+                self._encoder_on_gpu()
+            else:
+                self.model = whisper.load_model(self.model_size, device=self.device, download_root=self.download_root)
+                if self.device == "cuda":
+                    self._half_precision_weights(self.model)
+                else:
+                    self._int8_linear_weights(self.model)
+            if self.use_compile:
+                self._compile_encoder()
+        elif self.backend == "stable-ts":
+            import stable_whisper
+            self.model = stable_whisper.load_model(self.model_size, device=self.device, download_root=self.download_root)
+        elif self.backend == "faster-whisper":
+            from faster_whisper import WhisperModel, BatchedInferencePipeline
+            model = WhisperModel(self.model_size, device=self.device, compute_type=self.compute_type,
+                                 download_root=self.download_root)
+            # Decode VAD-split chunks in batches instead of one 30s window at a time
+            self.model = BatchedInferencePipeline(model=model)
+        elif self.backend == "mlx":
+            # mlx-whisper loads weights itself; resolving the local snapshot here
+            # lets transcribe() skip the Hub round trip
+            self.model = self._mlx_snapshot()
+
+    def _mlx_snapshot(self) -> str:
+        """Return the local directory of the MLX model, downloading it only if it isn't cached."""
+        from huggingface_hub import snapshot_download
+        from huggingface_hub.utils import LocalEntryNotFoundError
+
+        model_repo = MLX_MODEL_MAP.get(self.model_size, MLX_MODEL_MAP["medium"])
+        try:
+            return snapshot_download(model_repo, cache_dir=self.download_root, local_files_only=True)
+        except LocalEntryNotFoundError:
+            return snapshot_download(model_repo, cache_dir=self.download_root)
+
+    @staticmethod
+    def _half_precision_weights(module):
+        """
+        Store openai-whisper weights in float16.
+
+        openai-whisper already computes in float16 on CUDA, but keeps float32 weights
+        and casts them on every layer call; converting once halves the bytes each
+        forward pass reads. LayerNorm stays float32 because whisper runs it in float32.
+        """
+        import torch
+
+        module.half()
+        for submodule in module.modules():
+            if isinstance(submodule, torch.nn.LayerNorm):
+                submodule.float()
+
+    @staticmethod
+    def _int8_linear_weights(module):
+        """
+        Quantize openai-whisper's Linear layers to int8 in place for the CPU.
+
+        Dynamic quantization stores int8 weights and quantizes activations per call,
+        halving the weight bytes read by the attention and MLP matmuls.
+        """
+        import warnings
+        import torch
+
+        for submodule in module.modules():
+            # whisper's Linear subclass only casts weights to the input dtype, a no-op
+            # in float32; quantize_dynamic matches exact types, so treat it as nn.Linear
+            if isinstance(submodule, torch.nn.Linear) and type(submodule) is not torch.nn.Linear:
+                submodule.__class__ = torch.nn.Linear
+        with warnings.catch_warnings():
+            # Newer torch versions warn that eager-mode quantization moved to torchao
+            warnings.simplefilter("ignore")
+            torch.ao.quantization.quantize_dynamic(module, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+    def _encoder_on_gpu(self):
+        """
+        Move the openai-whisper encoder to CUDA in float16, leaving the decoder on the CPU.
+
+        The encoder runs once per 30s window and is compute-bound; the decoder's per-token
+        steps are latency-bound and cheap enough on the CPU, and its weights and kv-cache
+        no longer take VRAM. The encoder returns float32 features on the CPU for it.
+        """
+        import torch
+
+        encoder = self.model.encoder
+        encoder.to("cuda")
+        self._half_precision_weights(encoder)
+        encode = encoder.forward
+
+        def forward(mel):
+            return encode(mel.to("cuda", torch.float16)).float().cpu()
+
+        encoder.forward = forward
+
+    def _compile_encoder(self):
+        """
+        Compile the openai-whisper encoder and run it once so transcribe() doesn't pay the compile cost.
+
+        The encoder always sees one 30s mel window, so its shapes never change. The decoder
+        grows its kv-cache through forward hooks and is left eager. Falls back to the eager
+        encoder if compilation fails (e.g. no Triton), since torch.compile errors only surface
+        on the first call.
+        """
+        import torch
+        from whisper.audio import N_FRAMES
+
+        eager_encoder = self.model.encoder
+        # CUDA graphs remove the per-kernel launch overhead; they need a GPU
+        mode = "reduce-overhead" if self.device == "cuda" else "default"
+        self.model.encoder = torch.compile(eager_encoder, mode=mode, fullgraph=True)
+
+        # openai-whisper runs in float16 on CUDA and float32 on CPU
+        dtype = torch.float16 if self.device == "cuda" else torch.float32
+        mel = torch.zeros(1, self.model.dims.n_mels, N_FRAMES, device=self.device, dtype=dtype)
+        try:
+            with torch.no_grad():
+                self.model.encoder(mel)
+        except Exception:
+            self.model.encoder = eager_encoder
+            self.use_compile = False
+
+    def load_model(self) -> None:
+        """
+        Load the Whisper model now instead of on the first transcribe() call.
+
+        Safe to run in a background thread while audio is being extracted.
+        For mlx this only resolves the weights on disk; stable-ts-mlx loads by repo path
+        inside transcribe(), so this is a no-op for it.
+        """
+        self._load_model()
 
     def transcribe(
         self,
-        audio_path: str,
-        language: Optional[str] = None
+        audio_path,
+        language: Optional[str] = None,
+        on_segment: Optional[Callable[[Dict], None]] = None
     ) -> List[Dict[str, any]]:
         """
-        Transcribe an audio file.
+        Transcribe an audio file or in-memory audio.
 
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to an audio or video file, or a numpy float32 array of
+                16 kHz mono samples (see AudioExtractor.extract_to_array)
             language: Language code (e.g., 'en', 'zh'). None for auto-detect.
+            on_segment: Optional callback run with each segment as soon as it is
+                available. faster-whisper produces segments while decoding; the
+                other backends produce them all at the end.
 
         Returns:
             List of segments, each containing:
@@ -99,71 +321,124 @@ class Transcriber:
             FileNotFoundError: If audio file doesn't exist
             Exception: If transcription fails
         """
-        import os
-        if not os.path.exists(audio_path):
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if isinstance(audio_path, str):
+            # One stat both checks the file and keys the decoded-audio cache
+            try:
+                mtime = os.stat(audio_path).st_mtime
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Audio file not found: {audio_path}") from None
 
         try:
+            if isinstance(audio_path, str):
+                audio_path = self._load_audio_array(audio_path, mtime)
+
             if self.backend == "mlx":
-                return self._transcribe_mlx(audio_path, language)
+                segments = self._transcribe_mlx(audio_path, language)
             elif self.backend == "stable-ts":
-                return self._transcribe_stable_ts(audio_path, language)
+                segments = self._transcribe_stable_ts(audio_path, language)
             elif self.backend == "stable-ts-mlx":
-                return self._transcribe_stable_ts_mlx(audio_path, language)
+                segments = self._transcribe_stable_ts_mlx(audio_path, language)
+            elif self.backend == "faster-whisper":
+                segments = self._transcribe_faster_whisper(audio_path, language)
             else:
-                return self._transcribe_openai_whisper(audio_path, language)
+                segments = self._transcribe_openai_whisper(audio_path, language)
+
+            if on_segment is None:
+                return list(segments)
+            result = []
+            for segment in segments:
+                result.append(segment)
+                on_segment(segment)
+            return result
         except Exception as e:
             raise Exception(f"Transcription failed: {str(e)}")
 
+    def _load_audio_array(self, audio_path: str, mtime: float):
+        """
+        Decode an audio file to 16 kHz mono samples, once.
+
+        Every backend accepts samples, so the file is decoded by a single ffmpeg run
+        here instead of by each library. Repeated calls for the same unchanged file
+        (e.g. retranscribing in another language) reuse the samples.
+        """
+        key = (audio_path, mtime)
+        if self._audio_cache is None or self._audio_cache[0] != key:
+            from src.audio_extractor import AudioExtractor
+            extractor = AudioExtractor()
+            # A WAV from --keep-audio is already 16 kHz mono PCM; read it without ffmpeg
+            samples = extractor.read_wav(audio_path)
+            if samples is None:
+                samples = extractor.extract_to_array(audio_path)
+            self._audio_cache = (key, samples)
+        return self._audio_cache[1]
+
+    def _condition_on_previous(self, audio) -> bool:
+        """
+        Whether to condition each window on the previous window's text.
+
+        Conditioning keeps terms and style consistent on short clips, but on long audio a
+        single hallucinated or repeated line tends to propagate through every later window.
+        """
+        if self.condition_on_previous_text is not None:
+            return self.condition_on_previous_text
+        return len(audio) / 16000 <= LONG_AUDIO_SECONDS
+
     def _transcribe_mlx(self, audio_path: str, language: Optional[str]) -> List[Dict]:
         """Transcribe using mlx-whisper."""
         import mlx_whisper
 
-        model_repo = MLX_MODEL_MAP.get(self.model_size, MLX_MODEL_MAP["medium"])
+        self._load_model()
 
-        kwargs = {"path_or_hf_repo": model_repo}
+        kwargs = {"path_or_hf_repo": self.model, "condition_on_previous_text": self._condition_on_previous(audio_path)}
         if language:
             kwargs["language"] = language
 
         output = mlx_whisper.transcribe(audio_path, **kwargs)
 
-        result = []
-        for segment in output["segments"]:
-            result.append({
-                'start': segment['start'],
-                'end': segment['end'],
-                'text': segment['text'].strip()
-            })
-        return result
+        return [
+            {'start': segment['start'], 'end': segment['end'], 'text': segment['text'].strip()}
+            for segment in output["segments"]
+        ]
 
     def _transcribe_openai_whisper(self, audio_path: str, language: Optional[str]) -> List[Dict]:
         """Transcribe using openai-whisper."""
         self._load_model()
 
-        kwargs = {}
+        kwargs = {"condition_on_previous_text": self._condition_on_previous(audio_path)}
         if language:
             kwargs["language"] = language
+        if self.split_device:
+            kwargs["fp16"] = False  # The CPU decoder runs in float32
 
         output = self.model.transcribe(audio_path, **kwargs)
 
-        result = []
-        for segment in output["segments"]:
-            result.append({
-                'start': segment['start'],
-                'end': segment['end'],
-                'text': segment['text'].strip()
-            })
-        return result
+        return [
+            {'start': segment['start'], 'end': segment['end'], 'text': segment['text'].strip()}
+            for segment in output["segments"]
+        ]
+
+    def _transcribe_faster_whisper(self, audio_path: str, language: Optional[str]) -> Iterable[Dict]:
+        """Transcribe using faster-whisper's batched pipeline."""
+        self._load_model()
+
+        kwargs = {"batch_size": self.batch_size}
+        if language:
+            kwargs["language"] = language
+
+        # Segments are generated lazily as decoding proceeds; transcribe() consumes them
+        segments, _info = self.model.transcribe(audio_path, **kwargs)
+
+        return _segment_dicts(segments)
 
     def _transcribe_stable_ts(self, audio_path: str, language: Optional[str]) -> List[Dict]:
         """Transcribe using stable-ts (CUDA/CPU)."""
         self._load_model()
 
-        kwargs = {}
+        kwargs = {"condition_on_previous_text": self._condition_on_previous(audio_path)}
         if language:
             kwargs["language"] = language
         if self.use_vad:
-            kwargs["vad"] = True  # Silero VAD
+            kwargs["vad"] = self._stable_ts_vad()
 
         # stable-ts returns a WhisperResult object
         output = self.model.transcribe(audio_path, **kwargs)
@@ -180,20 +455,20 @@ class Transcriber:
         if language:
             kwargs["language"] = language
         if self.use_vad:
-            kwargs["vad"] = True  # Silero VAD
+            kwargs["vad"] = self._stable_ts_vad()
 
         # stable-ts MLX uses transcribe_with_path for MLX models
         output = stable_whisper.transcribe_with_path(model_repo, audio_path, **kwargs)
 
         return self._format_stable_ts_segments(output)
 
+    @staticmethod
+    def _stable_ts_vad():
+        """Silero VAD option for stable-ts: ONNX Runtime when installed, else the torch.hub model."""
+        if importlib.util.find_spec("onnxruntime") is not None:
+            return {"onnx": True}
+        return True
+
     def _format_stable_ts_segments(self, output) -> List[Dict]:
         """Format stable-ts WhisperResult to our segment format."""
-        result = []
-        for segment in output.segments:
-            result.append({
-                'start': segment.start,
-                'end': segment.end,
-                'text': segment.text.strip()
-            })
-        return result
+        return list(_segment_dicts(output.segments))
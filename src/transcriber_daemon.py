@@ -0,0 +1,227 @@
+import os
+import stat
+import sys
+import tempfile
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener
+from typing import Dict, List, Optional
+
+from src.transcriber import Transcriber, unload_models
+
+
+# multiprocessing.connection only offers AF_UNIX sockets on POSIX systems
+SUPPORTED = sys.platform != 'win32'
+
+# Transcriber options that decide which model is loaded (size, backend, device placement,
+# precision, weights directory); the others only change how a transcription decodes
+MODEL_OPTIONS = ('model_size', 'use_stable', 'compute_type', 'use_compile', 'split_device', 'download_root')
+
+
+def _runtime_dir() -> str:
+    """
+    Return the per-user directory holding the socket and its key, creating it on first use.
+
+    XDG_RUNTIME_DIR is already private to the user; otherwise a 0700 directory in the
+    temp dir is used, named by uid so users on a machine never share one.
+    """
+    base = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    path = os.path.join(base, f"whisper-subtitle-{os.getuid()}")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
+
+
+def socket_path() -> str:
+    """Default socket path of this user's daemon."""
+    return os.path.join(_runtime_dir(), 'daemon.sock')
+
+
+def _check_private_dir(directory: str) -> None:
+    """
+    Refuse a socket directory that another user could write to.
+
+    Anyone able to place a socket there could pose as the daemon, so the directory
+    must be a real directory owned by this user with no group or other access.
+
+    Raises:
+        PermissionError: If the directory is not private to the current user
+    """
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise PermissionError(f"{directory} must be a directory only accessible by its owner")
+
+
+def _key_path(address: str) -> str:
+    """The authkey file sits next to the socket, in the same private directory."""
+    return os.path.join(os.path.dirname(address), 'authkey')
+
+
+def _connect(address: Optional[str]):
+    """Open a connection to the daemon, or return None if none is listening."""
+    if not SUPPORTED:
+        return None
+    try:
+        address = address or socket_path()
+        _check_private_dir(os.path.dirname(address))
+        with open(_key_path(address), 'rb') as f:
+            authkey = f.read()
+        # The handshake checks both ends know the key before anything is unpickled
+        return Client(address, family='AF_UNIX', authkey=authkey)
+    except (OSError, ValueError, AuthenticationError, EOFError):
+        return None  # No daemon, a stale socket, or a socket we can't trust
+
+
+def _request(address: Optional[str], message: Dict) -> Optional[Dict]:
+    """Send one request and return the reply, or None if no daemon is listening."""
+    conn = _connect(address)
+    if conn is None:
+        return None
+    with conn:
+        try:
+            conn.send(message)
+            return conn.recv()
+        except (EOFError, OSError):
+            return None  # The daemon exited or was stopped mid-request
+
+
+def is_running(address: Optional[str] = None) -> bool:
+    """Check whether a daemon is listening on the socket."""
+    return _request(address, {'command': 'ping'}) is not None
+
+
+def stop(address: Optional[str] = None) -> bool:
+    """Ask a running daemon to exit. Returns False if none was running."""
+    return _request(address, {'command': 'stop'}) is not None
+
+
+def transcribe(audio, language: Optional[str], options: Dict, address: Optional[str] = None) -> Optional[Dict]:
+    """
+    Transcribe through a running daemon.
+
+    Args:
+        audio: Path to an audio file, or a numpy float32 array of 16 kHz mono samples
+        language: Language code (e.g., 'en', 'zh'). None for auto-detect.
+        options: Transcriber keyword arguments (model_size, use_stable, use_vad, compute_type)
+        address: Daemon socket path; socket_path() if None
+
+    Returns:
+        Dict with 'segments', 'backend', 'device' and 'compute_type' keys,
+        or None if no daemon is listening or it exits before replying
+
+    Raises:
+        Exception: If transcription fails in the daemon
+    """
+    reply = _request(address, {'command': 'transcribe', 'audio': audio, 'language': language, 'options': options})
+    if reply is not None and 'error' in reply:
+        raise Exception(reply['error'])
+    return reply
+
+
+def _apply_decode_options(transcriber: Transcriber, options: Dict) -> None:
+    """
+    Update the options a kept Transcriber reads at transcription time.
+
+    Raises:
+        ValueError: If VAD is requested without stable-ts, as Transcriber() would
+    """
+    use_vad = options.get('use_vad', False)
+    if use_vad and not transcriber.use_stable:
+        raise ValueError("--vad requires --stable flag")
+    transcriber.use_vad = use_vad
+    transcriber.condition_on_previous_text = options.get('condition_on_previous_text')
+
+
+def serve(address: Optional[str] = None, on_ready: Optional[callable] = None) -> None:
+    """
+    Run the daemon until a stop request or Ctrl+C.
+
+    The model is loaded on the first request and kept for the following ones.
+    A request with different MODEL_OPTIONS replaces it, so only one model holds
+    memory at a time; other options (VAD, conditioning) apply to the kept model.
+
+    Args:
+        address: Socket path to listen on; socket_path() if None
+        on_ready: Optional callback run once the socket accepts connections
+
+    Raises:
+        RuntimeError: On platforms without Unix sockets
+        PermissionError: If the socket directory is not private to the current user
+        FileExistsError: If another daemon is already listening on the socket
+    """
+    if not SUPPORTED:
+        raise RuntimeError("The Whisper daemon needs Unix sockets, which this platform lacks")
+    address = address or socket_path()
+    _check_private_dir(os.path.dirname(address))
+
+    # Removing a live daemon's socket and key would leave it running, holding its
+    # model, with no way to reach or stop it
+    if is_running(address):
+        raise FileExistsError(f"A Whisper daemon is already listening on {address}")
+
+    # A socket left behind by a daemon that was killed would make Listener fail
+    if os.path.exists(address):
+        os.unlink(address)
+
+    # A fresh random key per daemon, readable only by this user
+    key_path = _key_path(address)
+    if os.path.exists(key_path):
+        os.unlink(key_path)
+    authkey = os.urandom(32)
+    fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(authkey)
+
+    model_key = None
+    transcriber: Optional[Transcriber] = None
+
+    try:
+        # Listener removes the socket file again when it closes
+        with Listener(address, family='AF_UNIX', authkey=authkey) as listener:
+            os.chmod(address, 0o600)
+            if on_ready:
+                on_ready()
+            while True:
+                try:
+                    conn = listener.accept()
+                except (AuthenticationError, EOFError, OSError):
+                    continue  # Failed handshake (e.g. wrong authkey); keep serving
+
+                with conn:
+                    try:
+                        request = conn.recv()
+                    except (EOFError, OSError):
+                        continue  # Client went away before sending anything
+
+                    command = request.get('command')
+                    if command == 'stop':
+                        conn.send({})
+                        return
+                    if command != 'transcribe':
+                        conn.send({})
+                        continue
+
+                    try:
+                        options = request['options']
+                        key = tuple(options.get(name) for name in MODEL_OPTIONS)
+                        if key != model_key:
+                            # Release the old model before loading the new one
+                            model_key, transcriber = None, None
+                            unload_models()
+                            transcriber = Transcriber(**options)
+                            transcriber.load_model()
+                            model_key = key
+                        else:
+                            _apply_decode_options(transcriber, options)
+                        segments: List[Dict] = transcriber.transcribe(request['audio'], language=request['language'])
+                    except Exception as e:
+                        conn.send({'error': str(e)})
+                        continue
+
+                    conn.send({
+                        'segments': segments,
+                        'backend': transcriber.backend,
+                        'device': transcriber.device,
+                        'compute_type': transcriber.compute_type,
+                    })
+    finally:
+        if os.path.exists(key_path):
+            os.unlink(key_path)
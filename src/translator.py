@@ -1,11 +1,21 @@
 """Ollama-based subtitle translator with batch processing."""
 
+import hashlib
 import json
+import os
 import re
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
+try:
+    import orjson  # Optional: faster JSON for streamed chunks and the cache file
+except ImportError:
+    orjson = None
+
 
 # Language name to ISO 639-1 code mapping for TranslateGemma
 LANGUAGE_CODES = {
@@ -44,13 +54,76 @@ for _name, _code in LANGUAGE_CODES.items():
     if _code not in LANGUAGE_NAMES:
         LANGUAGE_NAMES[_code] = _name.title()
 
+# Name or code → (name, code), for parsing user input with one lookup; names win over codes
+LANGUAGE_INDEX = {_code: (_name, _code) for _code, _name in LANGUAGE_NAMES.items()}
+LANGUAGE_INDEX.update((_name, (_name.title(), _code)) for _name, _code in LANGUAGE_CODES.items())
+
 # Prompt-specific language names: how to describe a language to the LLM
 # "Chinese" is ambiguous, so we clarify it as Traditional Chinese (Taiwan) in prompts
 PROMPT_LANGUAGE_NAMES = {
     'chinese': 'Traditional Chinese (Taiwan, 繁體中文)',
 }
 
+# SRT formatting tags (<i>, <b>, <u>, <font ...>). Tags wrapping the whole line are
+# re-applied around the translation; lines with any other tags are sent as they are.
+WRAPPING_TAGS_PATTERN = re.compile(r'^((?:<[a-zA-Z][^>]*>)+)(.*?)((?:</[a-zA-Z]+>)+)$', re.DOTALL)
+INLINE_TAG_PATTERN = re.compile(r'</?[a-zA-Z][^>]*>')
+TAG_NAME_PATTERN = re.compile(r'</?([a-zA-Z]+)')
+
+# One line of a batch response: "1. translation text"
+NUMBERED_LINE_PATTERN = re.compile(r'^(\d+)\.\s*(.+)$')
+
+
+# Lines with no letters at all (music cues, numbers, punctuation) are passed through untranslated
+NON_TRANSLATABLE_PATTERN = re.compile(r'^[\W\d_]*$')
+
+# Scripts that show a line is already in the target language: (distinctive ranges, ranges also
+# allowed alongside). Chinese is left out because Han characters alone can't tell Simplified from
+# the Traditional Chinese that the prompt asks for.
+TARGET_SCRIPTS = {
+    'ko': (((0x1100, 0x11FF), (0x3130, 0x318F), (0xAC00, 0xD7AF)), ()),  # Hangul
+    'ja': (((0x3040, 0x30FF),), ((0x3400, 0x4DBF), (0x4E00, 0x9FFF))),   # Kana, with Kanji
+}
+
+
+def _in_ranges(char: str, ranges) -> bool:
+    """Check if a character's code point falls in any of the (low, high) ranges."""
+    code = ord(char)
+    return any(low <= code <= high for low, high in ranges)
+
+
+def needs_translation(text: str, target_lang: str) -> bool:
+    """
+    Check if a subtitle line has anything to translate.
+
+    Lines without letters (e.g., "♪♪", "...", "2024") and lines already written in the
+    target language's script (Korean, Japanese) are returned as-is by the translator.
+
+    Args:
+        text: Subtitle text (formatting tags are ignored)
+        target_lang: Target language name (e.g., 'Korean')
+
+    Returns:
+        False if the line can be passed through unchanged, True otherwise
+    """
+    plain = INLINE_TAG_PATTERN.sub('', text)
+    if NON_TRANSLATABLE_PATTERN.match(plain):
+        return False
+
+    script = TARGET_SCRIPTS.get(get_language_code(target_lang))
+    if script is None:
+        return True
+
+    distinctive, allowed = script
+    letters = [char for char in plain if char.isalpha()]
+    already_target = (
+        all(_in_ranges(char, distinctive) or _in_ranges(char, allowed) for char in letters)
+        and any(_in_ranges(char, distinctive) for char in letters)
+    )
+    return not already_target
+
 
+@lru_cache(maxsize=256)
 def get_prompt_language(language: str) -> str:
     """
     Get the language name to use in translation prompts.
@@ -66,6 +139,7 @@ def get_prompt_language(language: str) -> str:
     return PROMPT_LANGUAGE_NAMES.get(language.lower(), language)
 
 
+@lru_cache(maxsize=256)
 def parse_language(language: str):
     """
     Parse user language input and return (name, code) pair.
@@ -78,22 +152,10 @@ def parse_language(language: str):
     Returns:
         Tuple of (name, code) e.g., ('Korean', 'ko'), or None if unrecognized
     """
-    lower = language.lower().strip()
-
-    # Check if it's a known name
-    if lower in LANGUAGE_CODES:
-        code = LANGUAGE_CODES[lower]
-        return (lower.title(), code)
-
-    # Check if it's a known code
-    if lower in LANGUAGE_NAMES:
-        name = LANGUAGE_NAMES[lower]
-        return (name, lower)
-
-    # Unrecognized
-    return None
+    return LANGUAGE_INDEX.get(language.lower().strip())
 
 
+@lru_cache(maxsize=256)
 def get_language_code(language: str) -> str:
     """
     Get ISO 639-1 language code from language name.
@@ -107,6 +169,7 @@ def get_language_code(language: str) -> str:
     return LANGUAGE_CODES.get(language.lower(), language.lower()[:2])
 
 
+@lru_cache(maxsize=256)
 def get_language_name(code: str) -> str:
     """
     Get language name from ISO 639-1 code.
@@ -120,6 +183,18 @@ def get_language_name(code: str) -> str:
     return LANGUAGE_NAMES.get(code.lower(), code)
 
 
+@lru_cache(maxsize=16)
+def _settings_digest(model: str, custom_prompt: str, source_lang: str, target_lang: str) -> str:
+    """
+    Short hash of the settings a translation depends on, used as the memo key prefix.
+
+    A custom prompt can run to several kilobytes, which would otherwise be repeated
+    in every key held in memory and written to the cache file.
+    """
+    settings = '\x1f'.join((model, custom_prompt, source_lang, target_lang))
+    return hashlib.blake2b(settings.encode('utf-8'), digest_size=8).hexdigest()
+
+
 def unload_all_models(base_url: str) -> int:
     """
     Unload all models currently loaded in Ollama to free VRAM.
@@ -130,6 +205,9 @@ def unload_all_models(base_url: str) -> int:
     Returns:
         Number of models unloaded, or 0 if Ollama is not running / no models loaded.
     """
+    # requests is imported on use to keep CLI startup fast
+    import requests
+
     try:
         response = requests.get(f"{base_url}/api/ps", timeout=5)
         models = response.json().get('models', [])
@@ -149,10 +227,37 @@ def unload_all_models(base_url: str) -> int:
     return len(models)
 
 
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when installed."""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when installed."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+class TransientTranslationError(RuntimeError):
+    """A translation request failed in a way that may succeed on retry (timeout, dropped stream)."""
+
+
+# Errors that send a batch to the retry queue instead of aborting the translation
+RETRYABLE_ERRORS = (ConnectionError, TransientTranslationError)
+
+
+class _BatchComplete(Exception):
+    """Raised from a stream callback to stop reading once every line of a batch has arrived."""
+
+
+@lru_cache(maxsize=1)
 def load_config() -> dict:
     """
     Load configuration from config.json file.
 
+    The file is read once per process; the returned dict is shared, so callers must not modify it.
+
     Returns:
         Configuration dictionary with default values merged with file values.
     """
@@ -162,13 +267,20 @@ def load_config() -> dict:
             "model": "translategemma:4b",
             "base_url": "http://localhost:11434",
             "batch_size": 50,
+            "max_batch_chars": 4000,
             "keep_alive": "10m",
             "auto_unload": False,
             "context_lines": 3,
-            "prompt_file": None
+            "concurrency": 1,
+            "prompt_file": None,
+            "cache_file": None
         },
         "output": {
             "directory": None  # None means use default locations
+        },
+        "whisper": {
+            "compute_type": None,  # None means int8_float16 on CUDA, int8 on CPU (faster-whisper only)
+            "model_dir": None  # None means each backend's default model cache
         }
     }
 
@@ -181,6 +293,9 @@ def load_config() -> dict:
             # Deep merge for output section
             if 'output' in file_config:
                 default_config['output'].update(file_config['output'])
+            # Deep merge for whisper section
+            if 'whisper' in file_config:
+                default_config['whisper'].update(file_config['whisper'])
             return default_config
 
     return default_config
@@ -190,7 +305,8 @@ class OllamaTranslator:
     """Translator using local Ollama API for subtitle translation with batch processing."""
 
     def __init__(self, model: str = None, base_url: str = None, batch_size: int = None,
-                 keep_alive: str = None, context_lines: int = None, custom_prompt: str = None):
+                 keep_alive: str = None, context_lines: int = None, custom_prompt: str = None,
+                 concurrency: int = None, cache_file: str = None, max_batch_chars: int = None):
         """
         Initialize the translator with Ollama settings.
 
@@ -201,13 +317,35 @@ class OllamaTranslator:
             keep_alive: How long to keep model loaded (e.g., '10m', '1h', '-1'). Loads from config if not provided.
             context_lines: Number of prior translated pairs to pass as context (0 disables). Loads from config if not provided.
             custom_prompt: Extra instructions to include in translation prompts (e.g., glossary, style guide).
+            concurrency: Number of batches to send to Ollama in parallel. Loads from config if not provided.
+            cache_file: JSON file used to persist translated lines between runs. Loads from config if not provided.
+            max_batch_chars: Most characters of subtitle text per batch; a batch closes early when the
+                next segment would exceed it. Loads from config if not provided (0 or null disables).
         """
         config = load_config()
         self.model = model or config['ollama']['model']
+        self._translategemma = 'translategemma' in self.model.lower()
         self.base_url = base_url or config['ollama']['base_url']
         self.batch_size = batch_size or config['ollama'].get('batch_size', 50)
+        self.max_batch_chars = max_batch_chars if max_batch_chars is not None else config['ollama'].get('max_batch_chars')
         self.keep_alive = keep_alive or config['ollama'].get('keep_alive', '10m')
         self.context_lines = context_lines if context_lines is not None else config['ollama'].get('context_lines', 3)
+        self.concurrency = concurrency or config['ollama'].get('concurrency', 1)
+        # Keep-alive connections reused across batches, one per request in flight
+        self._session = self._shared_session()
+        cache_file = cache_file or config['ollama'].get('cache_file')
+        self.cache_file = Path(cache_file).expanduser() if cache_file else None
+        self._cache: Dict[str, str] = self._load_cache()
+        # (source_lang, target_lang) -> instruction header of the batch prompt
+        self._prompt_headers: Dict[Tuple[str, str], str] = {}
+        # (source_lang, target_lang, has_delimiter) -> TranslateGemma prompt up to the text
+        self._translategemma_prefixes: Dict[Tuple[str, str, bool], str] = {}
+        # Background model load started by warm_up(), joined before the first batch
+        self._warmup: Optional[threading.Thread] = None
+        # Moving average of the longest gap between chunks of a batch response, in seconds;
+        # shared by concurrent batches, so updated under the lock
+        self._chunk_gap: Optional[float] = None
+        self._chunk_gap_lock = threading.Lock()
         if custom_prompt is not None:
             self.custom_prompt = custom_prompt
             self.prompt_file_source = None
@@ -226,17 +364,62 @@ class OllamaTranslator:
                 self.custom_prompt = None
                 self.prompt_file_source = None
 
+    # Sessions per (local, concurrency), so every translator in a process reuses one connection pool
+    _session_cache: Dict[Tuple[bool, int], object] = {}
+
+    def _shared_session(self):
+        """Return the session for this translator's settings, creating it on first use."""
+        key = (self._is_local(), self.concurrency)
+        if key not in OllamaTranslator._session_cache:
+            OllamaTranslator._session_cache[key] = self._new_session()
+        return OllamaTranslator._session_cache[key]
+
+    def _new_session(self):
+        """
+        Create an HTTP session whose connection pool fits `concurrency` parallel requests.
+
+        Each in-flight batch gets its own keep-alive connection, so parallel streams never
+        wait on each other. HTTP/2 multiplexing is not an option: Ollama serves plain
+        http://, and its Go server does not speak HTTP/2 without TLS.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # Request bodies are serialized with _json_dumps rather than requests' json=
+        session.headers['Content-Type'] = 'application/json'
+        if self._is_local():
+            # Compressing on loopback saves no time, only CPU on both ends
+            session.headers['Accept-Encoding'] = 'identity'
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _is_local(self) -> bool:
+        """Check if base_url points at this machine."""
+        from urllib.parse import urlsplit
+
+        host = urlsplit(self.base_url).hostname or ''
+        return host == 'localhost' or host == '::1' or host.startswith('127.')
+
     def _is_translategemma(self) -> bool:
         """Check if the current model is TranslateGemma."""
-        return 'translategemma' in self.model.lower()
+        return self._translategemma
 
-    def _call_ollama(self, prompt: str, timeout: int = 120) -> str:
+    def _call_ollama(self, prompt: str, timeout: int = 120, on_text: Optional[callable] = None,
+                     idle_timeout: Optional[float] = None) -> str:
         """
-        Make a request to Ollama API.
+        Make a streaming request to Ollama API.
+
+        The response is read chunk by chunk as the model generates it, so the
+        timeout applies to the wait between chunks rather than to the whole generation.
 
         Args:
             prompt: The prompt to send
-            timeout: Request timeout in seconds
+            timeout: Seconds to wait for the connection and for each chunk
+            on_text: Optional callback receiving each text fragment as it arrives
+            idle_timeout: Seconds to wait for each chunk after the first one; timeout if None
 
         Returns:
             Response text from Ollama
@@ -245,27 +428,52 @@ class OllamaTranslator:
             ConnectionError: If Ollama API is not available
             RuntimeError: If request fails
         """
+        import requests
+        from urllib3.exceptions import ReadTimeoutError
+
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/api/generate",
-                json={
+                data=_json_dumps({
                     "model": self.model,
                     "prompt": prompt,
-                    "stream": False,
+                    "stream": True,
                     "keep_alive": self.keep_alive
-                },
-                timeout=timeout
+                }),
+                timeout=timeout,
+                stream=True
             )
-            response.raise_for_status()
-            result = response.json()
-            return result.get("response", "").strip()
         except requests.exceptions.ConnectionError:
             raise ConnectionError(
                 f"Cannot connect to Ollama at {self.base_url}. "
                 "Make sure Ollama is running (ollama serve)."
             )
         except requests.exceptions.Timeout:
-            raise RuntimeError("Translation request timed out")
+            raise TransientTranslationError("Translation request timed out")
+        except requests.exceptions.RequestException as e:
+            raise RuntimeError(f"Translation failed: {e}")
+
+        try:
+            response.raise_for_status()
+            parts = []
+            started = False
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                if not started and idle_timeout is not None:
+                    self._set_read_timeout(response, idle_timeout)
+                started = True
+                chunk = _json_loads(line)
+                if 'error' in chunk:
+                    raise RuntimeError(f"Ollama API error: {chunk['error']}")
+                text = chunk.get("response", "")
+                if text:
+                    parts.append(text)
+                    if on_text:
+                        on_text(text)
+            # The stream ends right after the "done" chunk. Reading it to the end (rather than
+            # stopping at "done") lets close() return the connection to the pool for reuse
+            return "".join(parts).strip()
         except requests.exceptions.HTTPError as e:
             # Try to extract error message from response
             try:
@@ -274,12 +482,46 @@ class OllamaTranslator:
             except (ValueError, AttributeError):
                 error_msg = str(e)
             raise RuntimeError(f"Ollama API error: {error_msg}")
+        except requests.exceptions.ConnectionError as e:
+            # requests reports a read timeout during streaming as a ConnectionError
+            if any(isinstance(arg, ReadTimeoutError) for arg in e.args):
+                raise TransientTranslationError("Translation request timed out")
+            raise TransientTranslationError(f"Translation stream interrupted: {e}")
+        except ValueError as e:
+            raise RuntimeError(f"Invalid response from Ollama: {e}")
         except requests.exceptions.RequestException as e:
             raise RuntimeError(f"Translation failed: {e}")
+        finally:
+            response.close()
+
+    @staticmethod
+    def _set_read_timeout(response, seconds: float) -> None:
+        """Change the socket timeout for the rest of a streaming response's reads."""
+        connection = getattr(response.raw, 'connection', None)
+        sock = getattr(connection, 'sock', None)
+        if sock is not None:
+            sock.settimeout(seconds)
+
+    # Failed batches are retried after the main pass with half the batch size,
+    # waiting RETRY_DELAY * attempt seconds before each round
+    MAX_BATCH_RETRIES = 2
+    RETRY_DELAY = 2
 
     # Delimiter used to preserve line breaks during translation
     LINE_DELIMITER = " || "
 
+    # Seconds to wait for Ollama to load the model into memory
+    WARMUP_TIMEOUT = 300
+
+    # Once a batch response has started, the wait for each further chunk is
+    # IDLE_TIMEOUT_MARGIN times the moving average of the longest gap between chunks,
+    # kept between IDLE_TIMEOUT_FLOOR seconds and the first-chunk timeout. A timeout
+    # widens the average by IDLE_TIMEOUT_BACKOFF so repeated timeouts loosen the limit
+    IDLE_TIMEOUT_FLOOR = 30
+    IDLE_TIMEOUT_MARGIN = 3
+    IDLE_TIMEOUT_BACKOFF = 2
+    CHUNK_GAP_EWMA_ALPHA = 0.3
+
     def _preserve_linebreaks(self, text: str) -> str:
         """Replace newlines with delimiter for translation."""
         return text.replace('\n', self.LINE_DELIMITER)
@@ -288,6 +530,34 @@ class OllamaTranslator:
         """Restore newlines from delimiter after translation."""
         return text.replace(self.LINE_DELIMITER, '\n')
 
+    def _split_formatting_tags(self, text: str) -> Tuple[str, str, str]:
+        """
+        Separate SRT formatting tags from the text to translate.
+
+        Tags are only split off when they wrap the whole line: the closing tags match
+        the opening ones in reverse order and no other tags are inside. Any other
+        line (e.g., '<i>Hello</i> there <b>friend</b>') is returned unchanged, tags
+        included, so none of them are lost or mismatched.
+
+        Args:
+            text: Subtitle text, possibly wrapped in tags (e.g., '<i>Hello</i>')
+
+        Returns:
+            Tuple of (prefix, plain_text, suffix), e.g., ('<i>', 'Hello', '</i>')
+        """
+        if '<' not in text:
+            return '', text, ''
+
+        match = WRAPPING_TAGS_PATTERN.match(text)
+        if match:
+            prefix, inner, suffix = match.groups()
+            opening = [name.lower() for name in TAG_NAME_PATTERN.findall(prefix)]
+            closing = [name.lower() for name in TAG_NAME_PATTERN.findall(suffix)]
+            if opening == closing[::-1] and not INLINE_TAG_PATTERN.search(inner):
+                return prefix, inner, suffix
+
+        return '', text, ''
+
     def _build_translategemma_prompt(self, text: str, source_lang: str, target_lang: str, has_delimiter: bool = False) -> str:
         """
         Build a prompt for TranslateGemma model.
@@ -301,19 +571,24 @@ class OllamaTranslator:
         Returns:
             Formatted prompt for TranslateGemma
         """
-        source_code = get_language_code(source_lang)
-        target_code = get_language_code(target_lang)
-        # Use prompt-specific names (e.g., "Chinese" → "Traditional Chinese (Taiwan, 繁體中文)")
-        source_prompt = get_prompt_language(source_lang)
-        target_prompt = get_prompt_language(target_lang)
+        # The instructions only depend on the languages, so they're built once per pair
+        key = (source_lang, target_lang, has_delimiter)
+        prefix = self._translategemma_prefixes.get(key)
+        if prefix is None:
+            source_code = get_language_code(source_lang)
+            target_code = get_language_code(target_lang)
+            # Use prompt-specific names (e.g., "Chinese" → "Traditional Chinese (Taiwan, 繁體中文)")
+            source_prompt = get_prompt_language(source_lang)
+            target_prompt = get_prompt_language(target_lang)
 
-        delimiter_instruction = ' Keep " || " delimiters in the same positions.' if has_delimiter else ''
+            delimiter_instruction = ' Keep " || " delimiters in the same positions.' if has_delimiter else ''
 
-        custom_block = f"\n\n[Additional instructions:]\n{self.custom_prompt}" if self.custom_prompt else ''
+            custom_block = f"\n\n[Additional instructions:]\n{self.custom_prompt}" if self.custom_prompt else ''
 
-        return f"""You are a professional {source_prompt} ({source_code}) to {target_prompt} ({target_code}) translator. Your goal is to accurately convey the meaning and nuances of the original {source_prompt} text while adhering to {target_prompt} grammar, vocabulary, and cultural sensitivities. Produce only the {target_prompt} translation, without any additional explanations or commentary.{delimiter_instruction}{custom_block}
+            prefix = f"""You are a professional {source_prompt} ({source_code}) to {target_prompt} ({target_code}) translator. Your goal is to accurately convey the meaning and nuances of the original {source_prompt} text while adhering to {target_prompt} grammar, vocabulary, and cultural sensitivities. Produce only the {target_prompt} translation, without any additional explanations or commentary.{delimiter_instruction}{custom_block}"""
+            self._translategemma_prefixes[key] = prefix
 
-{text}"""
+        return f"{prefix}\n\n{text}"
 
     def translate_text(self, text: str, source_lang: str, target_lang: str) -> str:
         """
@@ -331,6 +606,13 @@ class OllamaTranslator:
             ConnectionError: If Ollama API is not available
             RuntimeError: If translation fails
         """
+        # Shares the memo with translate_segments, so repeated lines are sent once
+        key = self._cache_key(text, source_lang, target_lang)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        tag_prefix, text, tag_suffix = self._split_formatting_tags(text)
         has_linebreaks = '\n' in text
 
         # Preserve linebreaks using delimiter
@@ -354,6 +636,8 @@ class OllamaTranslator:
         if has_linebreaks:
             result = self._restore_linebreaks(result)
 
+        result = f"{tag_prefix}{result}{tag_suffix}"
+        self._cache[key] = result
         return result
 
     def _build_batch_prompt(
@@ -375,18 +659,15 @@ class OllamaTranslator:
         Returns:
             Formatted prompt string
         """
-        # Replace newlines with delimiter to keep each segment on one line
-        preserved_texts = [self._preserve_linebreaks(text) for text in texts]
-        numbered_lines = "\n".join(
-            f"{i + 1}. {text}" for i, text in enumerate(preserved_texts)
-        )
+        # Replace newlines with delimiter to keep each segment on one line, in the same
+        # pass that numbers the lines; most subtitle lines have none and skip the replace
+        delimiter = self.LINE_DELIMITER
+        preserved_texts = (text.replace('\n', delimiter) if '\n' in text else text for text in texts)
+        numbered_lines = "\n".join([f"{i}. {text}" for i, text in enumerate(preserved_texts, start=1)])
 
-        has_delimiters = any(self.LINE_DELIMITER in text for text in preserved_texts)
+        has_delimiters = self.LINE_DELIMITER in numbered_lines
         delimiter_instruction = ' Keep " || " delimiters in the same positions.' if has_delimiters else ''
 
-        source_prompt = get_prompt_language(source_lang)
-        target_prompt = get_prompt_language(target_lang)
-
         # Build context block if provided
         context_block = ""
         if context:
@@ -395,22 +676,32 @@ class OllamaTranslator:
 
         custom_block = f"\n\n[Additional instructions:]\n{self.custom_prompt}" if self.custom_prompt else ''
 
-        if self._is_translategemma():
-            source_code = get_language_code(source_lang)
-            target_code = get_language_code(target_lang)
-            prompt = f"""You are a professional {source_prompt} ({source_code}) to {target_prompt} ({target_code}) translator. Your goal is to accurately convey the meaning and nuances of the original {source_prompt} text while adhering to {target_prompt} grammar, vocabulary, and cultural sensitivities.
-
-Translate each numbered line below. Return ONLY the translations with the same line numbers. Keep the exact format "N. translation".{delimiter_instruction}{custom_block}
-
-{context_block}{numbered_lines}"""
-        else:
-            prompt = f"""Translate each line from {source_prompt} to {target_prompt}.
-Return ONLY the translations with the same line numbers. Keep the exact format "N. translation".{delimiter_instruction}{custom_block}
+        header = self._batch_prompt_header(source_lang, target_lang)
+        prompt = f"""{header}{delimiter_instruction}{custom_block}
 
 {context_block}{numbered_lines}"""
 
         return prompt
 
+    def _batch_prompt_header(self, source_lang: str, target_lang: str) -> str:
+        """Return the batch prompt's instructions for a language pair, built once per pair."""
+        key = (source_lang, target_lang)
+        header = self._prompt_headers.get(key)
+        if header is None:
+            source_prompt = get_prompt_language(source_lang)
+            target_prompt = get_prompt_language(target_lang)
+            if self._is_translategemma():
+                source_code = get_language_code(source_lang)
+                target_code = get_language_code(target_lang)
+                header = f"""You are a professional {source_prompt} ({source_code}) to {target_prompt} ({target_code}) translator. Your goal is to accurately convey the meaning and nuances of the original {source_prompt} text while adhering to {target_prompt} grammar, vocabulary, and cultural sensitivities.
+
+Translate each numbered line below. Return ONLY the translations with the same line numbers. Keep the exact format "N. translation"."""
+            else:
+                header = f"""Translate each line from {source_prompt} to {target_prompt}.
+Return ONLY the translations with the same line numbers. Keep the exact format "N. translation"."""
+            self._prompt_headers[key] = header
+        return header
+
     def _parse_batch_response(
         self,
         response: str,
@@ -426,27 +717,25 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
         Returns:
             List of translated texts if parsing succeeds, None if validation fails
         """
-        # Parse lines with number prefix: "1. translation text"
-        pattern = r'^(\d+)\.\s*(.+)$'
-
-        translations = {}
+        # Slot i holds translation number i + 1; numbers outside the batch are ignored
+        result: List[Optional[str]] = [None] * expected_count
         for line in response.strip().split('\n'):
             line = line.strip()
-            if not line:
-                continue
-            match = re.match(pattern, line)
-            if match:
-                num = int(match.group(1))
-                text = match.group(2).strip()
-                translations[num] = text
+            # Well-formed "N. text" lines split without the regex; anything else
+            # (e.g. "N.text") falls back to it
+            head, sep, text = line.partition('. ')
+            if not (sep and head.isdecimal()):
+                match = NUMBERED_LINE_PATTERN.match(line)
+                if not match:
+                    continue
+                head, text = match.groups()
+            num = int(head)
+            if 1 <= num <= expected_count:
+                result[num - 1] = text.strip()
 
         # Validate we got all expected numbers
-        result = []
-        for i in range(1, expected_count + 1):
-            if i not in translations:
-                return None  # Missing translation, signal failure
-            result.append(translations[i])
-
+        if None in result:
+            return None  # Missing translation, signal failure
         return result
 
     def _try_translate_batch(
@@ -454,7 +743,8 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
         segments: List[Dict],
         source_lang: str,
         target_lang: str,
-        context: Optional[List[Tuple[str, str]]] = None
+        context: Optional[List[Tuple[str, str]]] = None,
+        on_line: Optional[callable] = None
     ) -> Optional[List[Dict]]:
         """
         Try to translate a batch of segments.
@@ -464,6 +754,8 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
             source_lang: Source language
             target_lang: Target language
             context: Optional list of (original, translation) pairs for context
+            on_line: Optional callback called with the 0-based index of each numbered
+                line received, once per index
 
         Returns:
             List of translated segments if successful, None if failed
@@ -471,20 +763,68 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
         if not segments:
             return []
 
-        texts = [seg['text'] for seg in segments]
+        # Strip formatting tags so the model only sees plain text
+        split_texts = [self._split_formatting_tags(seg['text']) for seg in segments]
+        texts = [text for _, text, _ in split_texts]
         prompt = self._build_batch_prompt(texts, source_lang, target_lang, context=context)
 
-        # Longer timeout for batches
-        timeout = max(120, len(segments) * 5)
-        response = self._call_ollama(prompt, timeout=timeout)
+        # The first chunk may wait on a queue, a model load and the prompt read, so it
+        # keeps the fixed allowance; only the gaps after it use the measured timeout
+        timeout = self._batch_timeout(len(segments))
+        received = []
+        numbers_seen = set()
+        partial_line = ['']
+        last_chunk_at = None
+        longest_gap = 0.0
+
+        def on_text(text):
+            nonlocal last_chunk_at, longest_gap
+            now = time.monotonic()
+            if last_chunk_at is not None:
+                longest_gap = max(longest_gap, now - last_chunk_at)
+            last_chunk_at = now
+            # Text after the last numbered line (notes, an invented next line) is never
+            # parsed; closing the stream makes Ollama stop generating it
+            if len(numbers_seen) == len(segments) and text.strip():
+                raise _BatchComplete()
+            received.append(text)
+            *lines, partial_line[0] = (partial_line[0] + text).split('\n')
+            for line in lines:
+                match = NUMBERED_LINE_PATTERN.match(line.strip())
+                if not match:
+                    continue  # Blank lines, preambles and wrapped text are not progress
+                number = int(match.group(1))
+                if 1 <= number <= len(segments) and number not in numbers_seen:
+                    numbers_seen.add(number)
+                    if on_line:
+                        on_line(number - 1)
+
+        try:
+            response = self._call_ollama(
+                prompt, timeout=timeout, on_text=on_text, idle_timeout=self._idle_timeout(timeout)
+            )
+        except _BatchComplete:
+            response = "".join(received)
+        except TransientTranslationError:
+            self._widen_chunk_gap()
+            raise
+        if last_chunk_at is not None:
+            self._record_chunk_gap(longest_gap)
 
         translated_texts = self._parse_batch_response(response, len(segments))
 
         if translated_texts is None:
             return None  # Parsing failed, can retry with smaller batch
 
-        # Restore linebreaks in translated texts
-        translated_texts = [self._restore_linebreaks(text) for text in translated_texts]
+        # Restore linebreaks and formatting tags in translated texts. One search of the
+        # whole response tells whether any line has delimiters; usually none does
+        delimiter = self.LINE_DELIMITER
+        if delimiter in response:
+            translated_texts = [text.replace(delimiter, '\n') for text in translated_texts]
+        translated_texts = [
+            prefix + text + suffix
+            for (prefix, _, suffix), text in zip(split_texts, translated_texts)
+        ]
 
         # Build result with preserved timestamps
         result = []
@@ -497,6 +837,38 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
 
         return result
 
+    def _batch_timeout(self, segment_count: int) -> float:
+        """Seconds to wait for the first chunk of a batch response."""
+        return max(120, segment_count * 5)
+
+    def _idle_timeout(self, first_chunk_timeout: float) -> float:
+        """
+        Seconds to wait for each chunk after the first one.
+
+        Chunks arrive steadily once generation runs, so a long pause means a stalled
+        request; it then fails and is split well before the first-chunk allowance.
+        """
+        with self._chunk_gap_lock:
+            gap = self._chunk_gap
+        if gap is None:
+            return first_chunk_timeout
+        return min(first_chunk_timeout, max(self.IDLE_TIMEOUT_FLOOR, gap * self.IDLE_TIMEOUT_MARGIN))
+
+    def _record_chunk_gap(self, seconds: float) -> None:
+        """Fold a completed response's longest gap between chunks into the moving average."""
+        with self._chunk_gap_lock:
+            if self._chunk_gap is None:
+                self._chunk_gap = seconds
+            else:
+                alpha = self.CHUNK_GAP_EWMA_ALPHA
+                self._chunk_gap = alpha * seconds + (1 - alpha) * self._chunk_gap
+
+    def _widen_chunk_gap(self) -> None:
+        """Raise the moving average after a timeout, so retries are given longer."""
+        with self._chunk_gap_lock:
+            if self._chunk_gap is not None:
+                self._chunk_gap *= self.IDLE_TIMEOUT_BACKOFF
+
     def _translate_batch_recursive(
         self,
         segments: List[Dict],
@@ -508,7 +880,10 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
         context: Optional[List[Tuple[str, str]]] = None
     ) -> List[Dict]:
         """
-        Recursively translate segments with split-on-failure strategy.
+        Translate segments with split-on-failure strategy.
+
+        A batch that fails to parse is split in half and each half retried, down to
+        single segments, using a worklist of index spans rather than recursion.
 
         Args:
             segments: List of segments to translate
@@ -525,56 +900,49 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
         if not segments:
             return []
 
-        # Try to translate the batch
-        result = self._try_translate_batch(segments, source_lang, target_lang, context=context)
-
-        if result is not None:
-            # Success - update progress and return
+        results: List[Optional[Dict]] = [None] * len(segments)
+        # Indices already reported; a split retries lines that streamed in before the
+        # parse failed, and counting them again would push progress past the span
+        counted = set()
+        # Spans still to translate; the left half is popped first so progress stays in order.
+        # Every span gets the same original context (siblings do not share results).
+        pending = [(0, len(segments))]
+        while pending:
+            lo, hi = pending.pop()
+            batch = segments[lo:hi]
+
+            # Try to translate the span, reporting progress as numbered lines stream in.
+            # The last line has no trailing newline; the success path reports it
+            on_line = None
             if progress_callback:
-                progress_callback(progress_offset + len(segments), total_segments)
-            return result
-
-        # Base case: single segment, can't split further
-        if len(segments) == 1:
-            # Try single translation as last resort
-            translated_text = self.translate_text(
-                segments[0]['text'],
-                source_lang,
-                target_lang
-            )
-            if progress_callback:
-                progress_callback(progress_offset + 1, total_segments)
-            return [{
-                'start': segments[0]['start'],
-                'end': segments[0]['end'],
-                'text': translated_text
-            }]
-
-        # Recursive case: split in half and try each.
-        # Both halves get the same original context (siblings do not share results).
-        mid = len(segments) // 2
-
-        left = self._translate_batch_recursive(
-            segments[:mid],
-            source_lang,
-            target_lang,
-            progress_callback,
-            progress_offset,
-            total_segments,
-            context=context
-        )
-
-        right = self._translate_batch_recursive(
-            segments[mid:],
-            source_lang,
-            target_lang,
-            progress_callback,
-            progress_offset + mid,
-            total_segments,
-            context=context
-        )
-
-        return left + right
+                def on_line(index, lo=lo):
+                    if lo + index not in counted:
+                        counted.add(lo + index)
+                        progress_callback(progress_offset + len(counted), total_segments)
+
+            result = self._try_translate_batch(batch, source_lang, target_lang, context=context, on_line=on_line)
+
+            if result is None and len(batch) == 1:
+                # Single segment, can't split further: try single translation as last resort
+                result = [{
+                    'start': batch[0]['start'],
+                    'end': batch[0]['end'],
+                    'text': self.translate_text(batch[0]['text'], source_lang, target_lang)
+                }]
+
+            if result is not None:
+                results[lo:hi] = result
+                if progress_callback:
+                    counted.update(range(lo, hi))
+                    progress_callback(progress_offset + len(counted), total_segments)
+                continue
+
+            # Split in half and try each
+            mid = (lo + hi) // 2
+            pending.append((mid, hi))
+            pending.append((lo, mid))
+
+        return results
 
     def translate_segments(
         self,
@@ -588,6 +956,7 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
 
         Segments are processed in batches for better context and speed.
         If a batch fails, it's split in half and retried recursively.
+        Batches that time out or lose the connection are retried after the main pass.
 
         Args:
             segments: List of segments with 'start', 'end', 'text' keys
@@ -604,35 +973,301 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
         if not segments:
             return []
 
+        # Lines with nothing to translate are passed through; repeated lines are translated once
+        keys = [self._cache_key(seg['text'], source_lang, target_lang) for seg in segments]
+        passthrough = [not needs_translation(seg['text'], target_lang) for seg in segments]
+        pending = []
+        queued = set()
+        for seg, key, skip in zip(segments, keys, passthrough):
+            if not skip and key not in self._cache and key not in queued:
+                queued.add(key)
+                pending.append(seg)
+
+        if pending:
+            # Report progress against all segments; cached and passed-through ones count as done
+            skipped = len(segments) - len(pending)
+            callback = None
+            if progress_callback:
+                def callback(current, _total):
+                    progress_callback(current + skipped, len(segments))
+
+            if self._warmup is not None:
+                # Let a cold model finish loading so it doesn't eat into the first batch's timeout
+                self._warmup.join()
+                self._warmup = None
+
+            try:
+                self._translate_pending(pending, source_lang, target_lang, callback)
+            finally:
+                # Save whatever completed so a rerun after a failure resumes from here
+                self._save_cache()
+        elif progress_callback:
+            progress_callback(len(segments), len(segments))
+
+        return [
+            {'start': seg['start'], 'end': seg['end'], 'text': seg['text'] if skip else self._cache[key]}
+            for seg, key, skip in zip(segments, keys, passthrough)
+        ]
+
+    def _translate_pending(
+        self,
+        segments: List[Dict],
+        source_lang: str,
+        target_lang: str,
+        progress_callback: Optional[callable]
+    ) -> None:
+        """
+        Translate uncached segments in batches and store the results in the cache.
+
+        Args:
+            segments: Segments whose text is not yet cached
+            source_lang: Source language
+            target_lang: Target language
+            progress_callback: Optional callback function(current, total) for progress updates
+        """
         total = len(segments)
-        translated_segments = []
-        context: List[Tuple[str, str]] = []  # accumulates (original, translated) pairs
-
-        # Process in batches
-        for batch_start in range(0, total, self.batch_size):
-            batch_end = min(batch_start + self.batch_size, total)
-            batch = segments[batch_start:batch_end]
-
-            # Slice last context_lines pairs; empty list when context_lines=0
-            batch_context = context[-self.context_lines:] if self.context_lines > 0 else []
-
-            batch_result = self._translate_batch_recursive(
-                batch,
-                source_lang,
-                target_lang,
-                progress_callback,
-                batch_start,
-                total,
-                context=batch_context
+        batches = self._pack_batches(segments)
+
+        if self.concurrency > 1 and len(batches) > 1:
+            failed = self._translate_batches_concurrently(
+                batches, source_lang, target_lang, progress_callback, total
             )
+        else:
+            failed = []
+            context: List[Tuple[str, str]] = []  # accumulates (original, translated) pairs
+
+            # Process in batches
+            for batch_start, batch in batches:
+                # Slice last context_lines pairs; empty list when context_lines=0
+                batch_context = context[-self.context_lines:] if self.context_lines > 0 else []
+
+                try:
+                    batch_result = self._translate_batch_recursive(
+                        batch,
+                        source_lang,
+                        target_lang,
+                        progress_callback,
+                        batch_start,
+                        total,
+                        context=batch_context
+                    )
+                except RETRYABLE_ERRORS:
+                    # Keep going; this batch is retried after the main pass
+                    failed.append(batch)
+                    continue
+
+                self._remember(batch, batch_result, source_lang, target_lang)
+
+                # Accumulate context from completed batch
+                for orig_seg, trans_seg in zip(batch, batch_result):
+                    context.append((orig_seg['text'], trans_seg['text']))
+
+        if failed:
+            self._retry_failed_batches(failed, source_lang, target_lang)
+            if progress_callback:
+                progress_callback(total, total)
+
+    def _pack_batches(self, segments: List[Dict]) -> List[Tuple[int, List[Dict]]]:
+        """
+        Split segments into (batch_start, batch) pairs.
+
+        Segments are spread evenly over the fewest batches of at most batch_size, so
+        101 lines become 34+34+33 instead of 50+50+1. A batch also closes early when
+        the next segment would take its text past max_batch_chars, so long lines don't
+        overrun the model's context and fail into the split-in-half retry.
+        """
+        total = len(segments)
+        n_batches = -(-total // self.batch_size)
+        size = -(-total // n_batches)
+        if not self.max_batch_chars:
+            return [
+                (batch_start, segments[batch_start:batch_start + size])
+                for batch_start in range(0, total, size)
+            ]
+
+        batches = []
+        batch_start = 0
+        chars = 0
+        for i, seg in enumerate(segments):
+            length = len(seg['text'])
+            if i > batch_start and (i - batch_start == size or chars + length > self.max_batch_chars):
+                batches.append((batch_start, segments[batch_start:i]))
+                batch_start, chars = i, 0
+            chars += length
+        batches.append((batch_start, segments[batch_start:]))
+        return batches
+
+    def _retry_failed_batches(
+        self,
+        failed: List[List[Dict]],
+        source_lang: str,
+        target_lang: str
+    ) -> None:
+        """
+        Retry batches that failed with a transient error, halving the batch size each round.
+
+        The chunks of a round are independent, so with concurrency > 1 they are sent
+        in parallel like the main pass.
+
+        Args:
+            failed: Batches that failed during the main pass
+            source_lang: Source language
+            target_lang: Target language
+
+        Raises:
+            ConnectionError or TransientTranslationError: If batches still fail after MAX_BATCH_RETRIES rounds
+        """
+        batch_size = self.batch_size
+        last_error = None
+
+        def retry_chunk(chunk):
+            """Translate one chunk; return the retryable error instead of raising it."""
+            try:
+                result = self._translate_batch_recursive(chunk, source_lang, target_lang, context=[])
+            except RETRYABLE_ERRORS as e:
+                return e
+            self._remember(chunk, result, source_lang, target_lang)
+            return None
+
+        for attempt in range(1, self.MAX_BATCH_RETRIES + 1):
+            time.sleep(self.RETRY_DELAY * attempt)
+            batch_size = max(1, batch_size // 2)
+            chunks = [
+                batch[start:start + batch_size]
+                for batch in failed
+                for start in range(0, len(batch), batch_size)
+            ]
+
+            if self.concurrency > 1 and len(chunks) > 1:
+                with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+                    errors = list(pool.map(retry_chunk, chunks))
+            else:
+                errors = [retry_chunk(chunk) for chunk in chunks]
+
+            failed = [chunk for chunk, error in zip(chunks, errors) if error is not None]
+            if not failed:
+                return
+            last_error = [error for error in errors if error is not None][-1]
+
+        raise last_error
+
+    def _translate_batches_concurrently(
+        self,
+        batches: List[Tuple[int, List[Dict]]],
+        source_lang: str,
+        target_lang: str,
+        progress_callback: Optional[callable],
+        total: int
+    ) -> List[List[Dict]]:
+        """
+        Translate batches in parallel, keeping up to `concurrency` requests in flight.
+
+        Batches run independently, so no sliding context is passed between them.
+
+        Args:
+            batches: List of (batch_start, segments) tuples
+            source_lang: Source language
+            target_lang: Target language
+            progress_callback: Optional callback function(current, total) for progress updates
+            total: Total number of segments being translated
+
+        Returns:
+            Batches that failed with a retryable error, in original order
+        """
+        done = {}  # batch_start -> segments completed in that batch
+        completed = 0  # sum of done.values(), kept up to date under the lock
+        lock = threading.Lock()
+
+        def translate_batch(batch_start, batch):
+            try:
+                result = self._translate_batch_recursive(
+                    batch,
+                    source_lang,
+                    target_lang,
+                    batch_progress(batch_start) if progress_callback else None,
+                    batch_start,
+                    total,
+                    context=[]
+                )
+            except RETRYABLE_ERRORS:
+                return False
+            self._remember(batch, result, source_lang, target_lang)
+            return True
+
+        def batch_progress(batch_start):
+            def callback(current, _total):
+                nonlocal completed
+                with lock:
+                    batch_done = current - batch_start
+                    completed += batch_done - done.get(batch_start, 0)
+                    done[batch_start] = batch_done
+                    progress_callback(completed, total)
+            return callback
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [
+                executor.submit(translate_batch, batch_start, batch)
+                for batch_start, batch in batches
+            ]
+            try:
+                return [
+                    batch for (_, batch), future in zip(batches, futures)
+                    if not future.result()
+                ]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
+        """
+        Build the memo key for a subtitle line.
 
-            # Accumulate context from completed batch
-            for orig_seg, trans_seg in zip(batch, batch_result):
-                context.append((orig_seg['text'], trans_seg['text']))
+        The model, custom prompt and languages are hashed into the key so a
+        persisted cache never returns a translation made under different settings.
+        """
+        digest = _settings_digest(self.model, self.custom_prompt or '', source_lang, target_lang)
+        return f"{digest}\x1f{text.strip()}"
+
+    def _remember(self, originals: List[Dict], translated: List[Dict],
+                  source_lang: str, target_lang: str) -> List[Dict]:
+        """Store a completed batch in the memo and return it unchanged."""
+        for orig_seg, trans_seg in zip(originals, translated):
+            self._cache[self._cache_key(orig_seg['text'], source_lang, target_lang)] = trans_seg['text']
+        return translated
+
+    def _load_cache(self) -> Dict[str, str]:
+        """Load persisted translations, or start empty if no cache file is configured."""
+        if not self.cache_file:
+            return {}
+        try:
+            # A missing file is the common first-run case; read_bytes raises instead of a separate stat
+            cache = _json_loads(self.cache_file.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) else {}
 
-            translated_segments.extend(batch_result)
+    def _save_cache(self) -> None:
+        """
+        Write the memo to the cache file in a single dump (no-op without a cache file).
 
-        return translated_segments
+        The dump goes to a temp file that replaces the cache only once complete, so
+        an interrupted or failed write keeps the previous cache instead of a
+        truncated one that would load as empty.
+        """
+        if not self.cache_file:
+            return
+        # Same directory, so os.replace is an atomic rename
+        temp_path = self.cache_file.with_name(f".{self.cache_file.name}.{os.getpid()}.tmp")
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(_json_dumps(self._cache))
+            os.replace(temp_path, self.cache_file)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
 
     def check_connection(self) -> bool:
         """
@@ -641,8 +1276,35 @@ Return ONLY the translations with the same line numbers. Keep the exact format "
         Returns:
             True if connection is successful, False otherwise
         """
+        import requests
+
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self._session.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except requests.exceptions.RequestException:
             return False
+
+    def warm_up(self) -> None:
+        """
+        Start loading the model in a background thread.
+
+        Ollama loads a model without generating anything when the prompt is empty.
+        Started early, the load overlaps other work instead of delaying the first
+        batch, which could otherwise time out and be split while the model loads.
+        """
+        if self._warmup is None:
+            self._warmup = threading.Thread(target=self._load_model, daemon=True)
+            self._warmup.start()
+
+    def _load_model(self) -> None:
+        """Ask Ollama to load the model; failures surface later on the real requests."""
+        import requests
+
+        try:
+            self._session.post(
+                f"{self.base_url}/api/generate",
+                data=_json_dumps({"model": self.model, "prompt": "", "stream": False, "keep_alive": self.keep_alive}),
+                timeout=self.WARMUP_TIMEOUT,
+            )
+        except requests.exceptions.RequestException:
+            pass
@@ -5,7 +5,6 @@ import tempfile
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Tuple
-import yt_dlp
 
 
 def is_url(input_str: str) -> bool:
@@ -69,12 +68,16 @@ class VideoDownloader:
         """
         # Configure yt-dlp options
         ydl_opts = {
-            'format': 'bestvideo+bestaudio/best',  # Best quality
+            # Only the audio is transcribed: skip the video stream and the ffmpeg merge
+            'format': 'bestaudio/best',
             'outtmpl': str(self.download_dir / '%(id)s.%(ext)s'),  # Use video ID as filename
             'quiet': quiet,
             'no_warnings': quiet,
         }
 
+        # Imported on use: yt-dlp is the slowest import at CLI startup
+        import yt_dlp
+
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 # Extract video information
@@ -139,14 +142,19 @@ class VideoDownloader:
             - video_meta_dict: {
                 'title': 'Video Title',
                 'channel': 'Channel Name' or None,
+                'video_id': 'dQw4w9WgXcQ',
+                'upload_date': '20240115' or None,
               }
-              Empty dict on error.
+              Same keys as get_video_info() returns for naming, so callers
+              don't have to fetch the metadata a second time. Empty dict on error.
         """
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
         }
 
+        import yt_dlp
+
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 # Get video info without downloading
@@ -167,6 +175,8 @@ class VideoDownloader:
                 video_meta = {
                     'title': info.get('title', 'Unknown'),
                     'channel': info.get('channel', None),
+                    'video_id': info.get('id', 'unknown'),
+                    'upload_date': info.get('upload_date', None),
                 }
 
                 return result, video_meta
@@ -203,6 +213,8 @@ class VideoDownloader:
             'no_warnings': True,
         }
 
+        import yt_dlp
+
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 ydl.download([url])
@@ -235,6 +247,8 @@ class VideoDownloader:
             'no_warnings': True,
         }
 
+        import yt_dlp
+
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 info = ydl.extract_info(url, download=False)
@@ -57,3 +57,102 @@ class TestAudioExtractor:
 
         result = extractor.get_audio_output_path(video_path)
         assert result == expected
+
+    def test_extract_to_array_decodes_pcm(self):
+        """Test that raw 16-bit PCM from ffmpeg is converted to float32 samples."""
+        import numpy as np
+        from unittest.mock import patch
+
+        extractor = AudioExtractor()
+        raw = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / "test_video.mp4"
+            video_path.touch()
+
+            with patch('ffmpeg.run', return_value=(raw, b'')) as mock_run:
+                samples = extractor.extract_to_array(str(video_path))
+
+        assert samples.dtype == np.float32
+        assert samples.tolist() == [0.0, 0.5, -1.0]
+        # Output goes to stdout as raw 16 kHz mono PCM
+        args = mock_run.call_args[0][0].get_args()
+        assert args[-1] == 'pipe:'
+        assert '16000' in args and 's16le' in args
+
+    def test_extract_to_array_raises_on_missing_file(self):
+        """Test that extracting from a non-existent file raises FileNotFoundError."""
+        extractor = AudioExtractor()
+
+        with pytest.raises(FileNotFoundError):
+            extractor.extract_to_array("nonexistent_video.mp4")
+
+    def test_write_wav_roundtrips_pcm(self):
+        """Test that write_wav stores the decoded samples as the original 16-bit PCM."""
+        import wave
+        import numpy as np
+
+        extractor = AudioExtractor()
+        pcm = np.array([0, 16384, -32768, 32767], dtype=np.int16)
+        samples = pcm.astype(np.float32) / 32768.0
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            wav_path = str(Path(tmpdir) / "audio.wav")
+            result = extractor.write_wav(samples, wav_path)
+
+            with wave.open(wav_path, 'rb') as wav:
+                assert (wav.getnchannels(), wav.getsampwidth(), wav.getframerate()) == (1, 2, 16000)
+                frames = wav.readframes(wav.getnframes())
+
+        assert result == wav_path
+        assert np.frombuffer(frames, np.int16).tolist() == pcm.tolist()
+
+    def test_drop_page_cache_advises_dontneed(self):
+        """Test that drop_page_cache evicts the whole file with POSIX_FADV_DONTNEED."""
+        if not hasattr(os, 'posix_fadvise'):
+            pytest.skip("posix_fadvise not available on this platform")
+        from unittest.mock import patch
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "video.webm"
+            path.write_bytes(b'\0' * 4096)
+
+            with patch('os.posix_fadvise') as mock_fadvise:
+                AudioExtractor.drop_page_cache(str(path))
+
+        assert mock_fadvise.call_args[0][1:] == (0, 0, os.POSIX_FADV_DONTNEED)
+
+    def test_drop_page_cache_ignores_missing_file(self):
+        AudioExtractor.drop_page_cache("nonexistent_video.mp4")
+
+    def test_read_wav_loads_write_wav_output(self):
+        """Test that read_wav returns the samples write_wav stored."""
+        import numpy as np
+
+        extractor = AudioExtractor()
+        samples = np.array([0, 16384, -32768, 32767], dtype=np.float32) / 32768.0
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            wav_path = extractor.write_wav(samples, str(Path(tmpdir) / "audio.wav"))
+            loaded = extractor.read_wav(wav_path)
+
+        assert loaded.dtype == np.float32
+        assert loaded.tolist() == samples.tolist()
+
+    def test_read_wav_rejects_other_formats(self):
+        """Test that read_wav returns None for files ffmpeg has to decode."""
+        import wave
+
+        extractor = AudioExtractor()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stereo_path = str(Path(tmpdir) / "stereo.wav")
+            with wave.open(stereo_path, 'wb') as wav:
+                wav.setnchannels(2)
+                wav.setsampwidth(2)
+                wav.setframerate(44100)
+                wav.writeframes(b'\0' * 8)
+            video_path = Path(tmpdir) / "video.mp4"
+            video_path.write_bytes(b'\0\0\0\x18ftypmp42')
+
+            assert extractor.read_wav(stereo_path) is None
+            assert extractor.read_wav(str(video_path)) is None
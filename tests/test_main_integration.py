@@ -3,6 +3,7 @@ from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 from click.testing import CliRunner
 import tempfile
+import time
 import sys
 import os
 
@@ -11,6 +12,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import main
 
 
+@pytest.fixture(autouse=True)
+def clear_translator_cache():
+    """_get_translator is cached per process; tests patch OllamaTranslator underneath it."""
+    main._cached_translator = (None, None)
+    yield
+    main._cached_translator = (None, None)
+
+
 class TestMainWithURLInput:
     """Integration tests for main.py with URL inputs."""
 
@@ -68,9 +77,75 @@ class TestMainWithURLInput:
             mock_downloader_instance.download.assert_called_once()
 
             # Verify the rest of the pipeline was called
-            mock_extractor_instance.extract_audio.assert_called_once()
+            mock_extractor_instance.extract_to_array.assert_called_once()
             mock_transcriber_instance.transcribe.assert_called_once()
-            mock_writer_instance.write_srt.assert_called_once()
+            mock_writer_instance.srt_stream.assert_called_once()
+
+    @patch('main.VideoDownloader')
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_model_loads_while_url_downloads(self, mock_writer, mock_transcriber, mock_extractor, mock_downloader):
+        """Test that the Whisper model starts loading before the URL download finishes."""
+        import threading
+        runner = CliRunner()
+        model_loading = threading.Event()
+        seen_during_download = []
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            def download(url, quiet=False):
+                seen_during_download.append(model_loading.wait(timeout=5))
+                return {'file_path': f'{tmpdir}/abc123.mp4', 'title': 'Test', 'video_id': 'abc123', 'duration': 1.0}
+
+            mock_downloader_instance = mock_downloader.return_value
+            mock_downloader_instance.get_available_subtitles.return_value = ({}, {'title': 'Test', 'channel': None})
+            mock_downloader_instance.download.side_effect = download
+            mock_transcriber_instance = mock_transcriber.return_value
+            mock_transcriber_instance.load_model.side_effect = model_loading.set
+            mock_transcriber_instance.transcribe.return_value = [{'start': 0.0, 'end': 1.0, 'text': 'Test'}]
+
+            result = runner.invoke(main.main, ['https://www.youtube.com/watch?v=abc123', '--output', tmpdir], input='n\n')
+
+        assert result.exit_code == 0, result.output
+        assert seen_during_download == [True]
+        mock_transcriber_instance.load_model.assert_called_once()
+        mock_transcriber_instance.transcribe.assert_called_once()
+
+    @patch('main.VideoDownloader')
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_failed_download_does_not_wait_for_model_load(self, mock_writer, mock_transcriber, mock_extractor, mock_downloader):
+        """Test that a download error exits while the model is still loading, on a daemon thread."""
+        import threading
+        runner = CliRunner()
+        load_started = threading.Event()
+        release_load = threading.Event()
+        load_threads = []
+
+        def load_model():
+            load_threads.append(threading.current_thread())
+            load_started.set()
+            release_load.wait(timeout=10)
+
+        def download(url, quiet=False):
+            assert load_started.wait(timeout=5)
+            raise RuntimeError("HTTP Error 403: Forbidden")
+
+        mock_downloader_instance = mock_downloader.return_value
+        mock_downloader_instance.get_available_subtitles.return_value = ({}, {'title': 'Test', 'channel': None})
+        mock_downloader_instance.download.side_effect = download
+        mock_transcriber.return_value.load_model.side_effect = load_model
+
+        try:
+            result = runner.invoke(main.main, ['https://www.youtube.com/watch?v=abc123'])
+
+            assert result.exit_code == 1
+            assert 'HTTP Error 403' in result.output
+            # Still loading: a daemon thread doesn't keep the process from exiting
+            assert load_threads[0].is_alive() and load_threads[0].daemon
+        finally:
+            release_load.set()
 
     @patch('main.SubtitleWriter')
     @patch('main.Transcriber')
@@ -115,9 +190,8 @@ class TestMainWithURLInput:
 
             assert result.exit_code == 0
 
-            # Verify write_srt was called with video ID in filename
-            srt_call_args = mock_writer_instance.write_srt.call_args[0]
-            srt_path = str(srt_call_args[1])
+            # Verify the SRT was streamed to a path with the video ID in its name
+            srt_path = str(mock_writer_instance.srt_stream.call_args[0][0])
             # Should use video ID instead of title
             assert 'xyz789' in srt_path
 
@@ -154,9 +228,9 @@ class TestMainWithFilePathInput:
             assert result.exit_code == 0
 
             # Verify pipeline was called
-            mock_extractor_instance.extract_audio.assert_called_once()
+            mock_extractor_instance.extract_to_array.assert_called_once()
             mock_transcriber_instance.transcribe.assert_called_once()
-            mock_writer_instance.write_srt.assert_called_once()
+            mock_writer_instance.srt_stream.assert_called_once()
 
     @patch('main.AudioExtractor')
     @patch('main.Transcriber')
@@ -187,10 +261,278 @@ class TestMainWithFilePathInput:
             assert result.exit_code == 0
 
             # Verify SRT output uses the file stem
-            srt_call_args = mock_writer_instance.write_srt.call_args[0]
-            srt_path = str(srt_call_args[1])
+            srt_path = str(mock_writer_instance.srt_stream.call_args[0][0])
             assert 'my_video_file' in srt_path
 
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_main_with_keep_audio_writes_wav(self, mock_writer, mock_transcriber, mock_extractor):
+        """Test that --keep-audio decodes once, saves the WAV from the samples, and transcribes in memory."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'test_video.mp4'
+            video_path.touch()
+
+            samples = object()
+            mock_extractor_instance = mock_extractor.return_value
+            mock_extractor_instance.extract_to_array.return_value = samples
+            mock_transcriber_instance = mock_transcriber.return_value
+            mock_transcriber_instance.transcribe.return_value = [
+                {'start': 0.0, 'end': 1.0, 'text': 'Test'}
+            ]
+
+            result = runner.invoke(main.main, [str(video_path), '--keep-audio'], input='n\n')
+
+            assert result.exit_code == 0
+            mock_extractor_instance.extract_audio.assert_not_called()
+            written_samples, wav_path = mock_extractor_instance.write_wav.call_args[0]
+            assert written_samples is samples
+            assert wav_path.endswith('.wav')
+            assert mock_transcriber_instance.transcribe.call_args[0][0] is samples
+
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_main_without_keep_audio_transcribes_in_memory(self, mock_writer, mock_transcriber, mock_extractor):
+        """Test that without --keep-audio the extracted samples are passed straight to the transcriber."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'test_video.mp4'
+            video_path.touch()
+
+            samples = object()
+            mock_extractor_instance = mock_extractor.return_value
+            mock_extractor_instance.extract_to_array.return_value = samples
+            mock_transcriber_instance = mock_transcriber.return_value
+            mock_transcriber_instance.transcribe.return_value = [
+                {'start': 0.0, 'end': 1.0, 'text': 'Test'}
+            ]
+
+            result = runner.invoke(main.main, [str(video_path)], input='n\n')
+
+            assert result.exit_code == 0
+            mock_extractor_instance.extract_audio.assert_not_called()
+            assert mock_transcriber_instance.transcribe.call_args[0][0] is samples
+            assert not list(Path(tmpdir).glob('*.wav'))
+
+    @patch('main.OllamaTranslator')
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_one_writer_shared_with_translation(self, mock_writer, mock_transcriber, mock_extractor, mock_translator):
+        """Test that transcription and translation write through the same SubtitleWriter."""
+        runner = CliRunner()
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'Test'}]
+        mock_transcriber.return_value.transcribe.return_value = segments
+        mock_translator_instance = mock_translator.return_value
+        mock_translator_instance.prompt_file_source = None
+        mock_translator_instance.check_connection.return_value = True
+        mock_translator_instance.translate_segments.return_value = segments
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'test_video.mp4'
+            video_path.touch()
+
+            result = runner.invoke(main.main, [str(video_path), '-y'])
+
+        assert result.exit_code == 0, result.output
+        mock_writer.assert_called_once()
+        # Original SRT streamed during transcription, then translated and bilingual SRT
+        mock_writer.return_value.srt_stream.assert_called_once()
+        assert mock_writer.return_value.write_srt.call_count == 2
+
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_model_loads_while_audio_is_extracted(self, mock_writer, mock_transcriber, mock_extractor):
+        """Test that the Whisper model starts loading before audio extraction finishes."""
+        import threading
+        runner = CliRunner()
+        model_loading = threading.Event()
+        seen_during_extraction = []
+
+        def extract_to_array(video_path):
+            seen_during_extraction.append(model_loading.wait(timeout=5))
+            return object()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'test_video.mp4'
+            video_path.touch()
+
+            mock_extractor.return_value.extract_to_array.side_effect = extract_to_array
+            mock_transcriber_instance = mock_transcriber.return_value
+            mock_transcriber_instance.load_model.side_effect = model_loading.set
+            mock_transcriber_instance.transcribe.return_value = [
+                {'start': 0.0, 'end': 1.0, 'text': 'Test'}
+            ]
+
+            result = runner.invoke(main.main, [str(video_path)], input='n\n')
+
+            assert result.exit_code == 0, result.output
+            assert seen_during_extraction == [True]
+            mock_transcriber_instance.transcribe.assert_called_once()
+
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_multiple_inputs_share_one_model(self, mock_writer, mock_transcriber, mock_extractor):
+        """Test that several inputs are processed in order with the Whisper model built once."""
+        runner = CliRunner()
+        mock_transcriber.return_value.transcribe.return_value = [{'start': 0.0, 'end': 1.0, 'text': 'Test'}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            videos = [Path(tmpdir) / 'part1.mp4', Path(tmpdir) / 'part2.mp4']
+            for video in videos:
+                video.touch()
+
+            result = runner.invoke(main.main, [str(v) for v in videos] + ['--action', 'transcribe'])
+
+            assert result.exit_code == 0, result.output
+            mock_transcriber.assert_called_once()
+            assert mock_transcriber.return_value.transcribe.call_count == 2
+            assert '=== [1/2]' in result.output and '=== [2/2]' in result.output
+            written = [Path(c[0][0]).name for c in mock_writer.return_value.srt_stream.call_args_list]
+            assert written[0].endswith('_part1.srt') and written[1].endswith('_part2.srt')
+        # The model is released once the batch is done
+        assert main._get_transcriber.cache_info().currsize == 0
+
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_failed_extraction_does_not_wait_for_model_load(self, mock_writer, mock_transcriber, mock_extractor):
+        """Test that an extraction error exits without waiting for the model load to finish."""
+        import threading
+        runner = CliRunner()
+        load_started = threading.Event()
+        release_load = threading.Event()
+
+        def load_model():
+            load_started.set()
+            release_load.wait(timeout=10)
+
+        def extract_to_array(video_path):
+            assert load_started.wait(timeout=5)
+            raise RuntimeError("ffmpeg failed: invalid data found")
+
+        mock_extractor.return_value.extract_to_array.side_effect = extract_to_array
+        mock_transcriber.return_value.load_model.side_effect = load_model
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'test_video.mp4'
+            video_path.touch()
+
+            try:
+                started = time.monotonic()
+                result = runner.invoke(main.main, [str(video_path)])
+
+                # Returned while the load was still blocked
+                assert time.monotonic() - started < 5
+                assert result.exit_code == 1
+                assert 'ffmpeg failed' in result.output
+            finally:
+                release_load.set()
+
+    @patch('main.transcriber_daemon')
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_running_daemon_transcribes_without_local_model(self, mock_writer, mock_transcriber, mock_extractor, mock_daemon):
+        """Test that a running --daemon does the transcription and no local model is loaded."""
+        runner = CliRunner()
+        samples = object()
+        mock_extractor.return_value.extract_to_array.return_value = samples
+        mock_daemon.is_running.return_value = True
+        mock_daemon.transcribe.return_value = {
+            'segments': [{'start': 0.0, 'end': 1.0, 'text': 'Test'}],
+            'backend': 'faster-whisper', 'device': 'cuda', 'compute_type': 'int8_float16',
+        }
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'test_video.mp4'
+            video_path.touch()
+
+            result = runner.invoke(main.main, [str(video_path), '--model', 'small', '--daemon'], input='n\n')
+
+        assert result.exit_code == 0, result.output
+        mock_transcriber.assert_not_called()
+        audio, language, options = mock_daemon.transcribe.call_args[0]
+        assert audio is samples
+        assert options['model_size'] == 'small'
+        assert 'Backend: faster-whisper (daemon)' in result.output
+        # Daemon replies arrive whole, so the SRT is written in one go
+        assert mock_writer.return_value.write_srt.call_args[0][0] == mock_daemon.transcribe.return_value['segments']
+        assert 'Transcription complete (1 segments)' in result.output
+
+    @patch('main.transcriber_daemon')
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_vanished_daemon_falls_back_to_local_model(self, mock_writer, mock_transcriber, mock_extractor, mock_daemon):
+        """Test that a daemon stopping between the check and the request falls back to local transcription."""
+        runner = CliRunner()
+        mock_daemon.is_running.return_value = True
+        mock_daemon.transcribe.return_value = None
+        mock_transcriber_instance = mock_transcriber.return_value
+        mock_transcriber_instance.transcribe.return_value = [{'start': 0.0, 'end': 1.0, 'text': 'Test'}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'test_video.mp4'
+            video_path.touch()
+
+            result = runner.invoke(main.main, [str(video_path), '--daemon'], input='n\n')
+
+        assert result.exit_code == 0, result.output
+        mock_transcriber_instance.load_model.assert_called_once()
+        mock_transcriber_instance.transcribe.assert_called_once()
+
+    @patch('main.transcriber_daemon')
+    @patch('main.AudioExtractor')
+    @patch('main.Transcriber')
+    @patch('main.SubtitleWriter')
+    def test_daemon_not_probed_without_flag(self, mock_writer, mock_transcriber, mock_extractor, mock_daemon):
+        """Test that runs without --daemon never connect to the daemon socket."""
+        runner = CliRunner()
+        mock_transcriber.return_value.transcribe.return_value = [{'start': 0.0, 'end': 1.0, 'text': 'Test'}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'test_video.mp4'
+            video_path.touch()
+
+            result = runner.invoke(main.main, [str(video_path)], input='n\n')
+
+        assert result.exit_code == 0, result.output
+        mock_daemon.is_running.assert_not_called()
+        mock_daemon.transcribe.assert_not_called()
+        mock_transcriber.return_value.transcribe.assert_called_once()
+
+    @patch('main.transcriber_daemon')
+    def test_daemon_flag_serves_without_input(self, mock_daemon):
+        """Test that --daemon starts the server and needs no DATA_INPUT."""
+        runner = CliRunner()
+        mock_daemon.SUPPORTED = True
+        mock_daemon.socket_path.return_value = '/run/user/1000/whisper-subtitle-1000/daemon.sock'
+
+        result = runner.invoke(main.main, ['--daemon'])
+
+        assert result.exit_code == 0, result.output
+        mock_daemon.serve.assert_called_once_with('/run/user/1000/whisper-subtitle-1000/daemon.sock')
+        assert '/run/user/1000/whisper-subtitle-1000/daemon.sock' in result.output
+
+    @patch('main.transcriber_daemon')
+    def test_daemon_flag_rejected_without_unix_sockets(self, mock_daemon):
+        """Test that --daemon fails cleanly on platforms without Unix sockets (Windows)."""
+        runner = CliRunner()
+        mock_daemon.SUPPORTED = False
+
+        result = runner.invoke(main.main, ['--daemon'])
+
+        assert result.exit_code != 0
+        assert 'not available on this platform' in result.output
+        mock_daemon.serve.assert_not_called()
+
 
 class TestMainErrorScenarios:
     """Integration tests for error handling."""
@@ -227,6 +569,32 @@ class TestMainErrorScenarios:
         # Should exit with error code
         assert result.exit_code != 0
 
+    def test_main_with_missing_file_shows_error(self):
+        """Test that a nonexistent local path is rejected during argument parsing."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = str(Path(tmpdir) / 'missing.mp4')
+            result = runner.invoke(main.main, [missing])
+
+        assert result.exit_code == 2
+        assert 'File not found' in result.output
+
+    def test_get_date_prefix_from_file_mtime(self):
+        """Test that local files use their modification date, and missing files fall back to today."""
+        import os
+        from datetime import datetime
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'video.mp4'
+            video_path.touch()
+            timestamp = datetime(2023, 5, 17, 12, 0).timestamp()
+            os.utime(video_path, (timestamp, timestamp))
+
+            assert main.get_date_prefix(file_path=video_path) == '20230517'
+            assert main.get_date_prefix(file_path=Path(tmpdir) / 'missing.mp4') == \
+                datetime.now().strftime('%Y%m%d')
+
 
 class TestTranslationPrompt:
     """Integration tests for translation prompt."""
@@ -277,6 +645,284 @@ class TestTranslationPrompt:
             assert len(srt_files) == 1
 
 
+    @patch('main.OllamaTranslator')
+    def test_translation_writes_translated_and_bilingual_srt(self, mock_translator):
+        """Test that --yes translation writes both the translated and bilingual SRT files."""
+        segments = [{'start': 0.0, 'end': 2.0, 'text': 'Hello\nthere'}]
+        mock_translator_instance = mock_translator.return_value
+        mock_translator_instance.prompt_file_source = None
+        mock_translator_instance.check_connection.return_value = True
+        mock_translator_instance.translate_segments.return_value = [
+            {'start': 0.0, 'end': 2.0, 'text': '你好'}
+        ]
+        config = {'ollama': {'model': 'test', 'base_url': 'http://localhost:11434'}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            main.translate_subtitles(segments, output_dir / '20240101_video.srt', output_dir,
+                                     '20240101', 'video', config, yes=True)
+
+            translated = (output_dir / '20240101_video.Chinese.srt').read_text(encoding='utf-8')
+            bilingual = (output_dir / '20240101_video.bilingual.srt').read_text(encoding='utf-8')
+
+        assert translated == "1\n00:00:00,000 --> 00:00:02,000\n你好\n"
+        assert bilingual == "1\n00:00:00,000 --> 00:00:02,000\nHello / there\n你好\n"
+
+    @patch('main.OllamaTranslator')
+    def test_translator_and_connection_check_reused(self, mock_translator):
+        """Test that repeated translations in one process build the translator and ping Ollama once."""
+        mock_translator_instance = mock_translator.return_value
+        mock_translator_instance.prompt_file_source = None
+        mock_translator_instance.check_connection.return_value = True
+        mock_translator_instance.translate_segments.side_effect = lambda segments, *args, **kwargs: segments
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}]
+        config = {'ollama': {'model': 'test', 'base_url': 'http://localhost:11434'}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            for name in ('first', 'second'):
+                main.translate_subtitles(segments, output_dir / f'20240101_{name}.srt', output_dir,
+                                         '20240101', name, config, yes=True)
+
+        mock_translator.assert_called_once()
+        mock_translator_instance.check_connection.assert_called_once()
+        assert mock_translator_instance.translate_segments.call_count == 2
+
+    @patch('main.click.prompt', side_effect=['English', 'Chinese'])
+    @patch('main.click.confirm', return_value=True)
+    @patch('main.OllamaTranslator')
+    def test_model_load_starts_before_language_prompts(self, mock_translator, mock_confirm, mock_prompt):
+        """Test that the model starts loading once translation is accepted, before the prompts and parsing."""
+        events = []
+        mock_translator_instance = mock_translator.return_value
+        mock_translator_instance.prompt_file_source = None
+        mock_translator_instance.check_connection.return_value = True
+        mock_translator_instance.warm_up.side_effect = lambda: events.append('warm_up')
+        mock_translator_instance.translate_segments.side_effect = lambda segments, *args, **kwargs: segments
+        mock_prompt.side_effect = lambda text, **kwargs: events.append(text) or kwargs['default']
+        writer = Mock()
+        writer.parse_srt.side_effect = lambda path: events.append('parse') or [{'start': 0.0, 'end': 1.0, 'text': 'Hi'}]
+        config = {'ollama': {'model': 'test', 'base_url': 'http://localhost:11434'}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            main.translate_subtitles(None, output_dir / '20240101_video.srt', output_dir,
+                                     '20240101', 'video', config, writer=writer)
+
+        assert events == ['warm_up', 'Source language', 'Target language', 'parse']
+
+    @patch('main.click.prompt')
+    @patch('main.click.confirm', return_value=True)
+    @patch('main.OllamaTranslator')
+    def test_unreachable_ollama_reported_before_language_prompts(self, mock_translator, mock_confirm, mock_prompt):
+        """Test that a failed connection check returns without asking for languages."""
+        mock_translator.return_value.check_connection.return_value = False
+        config = {'ollama': {'model': 'test', 'base_url': 'http://localhost:11434'}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            result = main.translate_subtitles([{'start': 0.0, 'end': 1.0, 'text': 'Hi'}],
+                                              output_dir / '20240101_video.srt', output_dir,
+                                              '20240101', 'video', config)
+
+        assert result is None
+        mock_prompt.assert_not_called()
+
+    @patch('main.OllamaTranslator')
+    def test_failed_connection_check_retried_for_next_input(self, mock_translator):
+        """Test that an unreachable Ollama is checked again, not remembered, for the next input."""
+        mock_translator_instance = mock_translator.return_value
+        mock_translator_instance.prompt_file_source = None
+        mock_translator_instance.check_connection.side_effect = [False, True]
+        mock_translator_instance.translate_segments.side_effect = lambda segments, *args, **kwargs: segments
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}]
+        config = {'ollama': {'model': 'test', 'base_url': 'http://localhost:11434'}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            for name in ('first', 'second'):
+                main.translate_subtitles(segments, output_dir / f'20240101_{name}.srt', output_dir,
+                                         '20240101', name, config, yes=True)
+
+        assert mock_translator_instance.check_connection.call_count == 2
+        mock_translator_instance.translate_segments.assert_called_once()
+
+    @patch('main.click.confirm')
+    @patch('main.OllamaTranslator')
+    def test_empty_segments_skip_prompts_and_ollama(self, mock_translator, mock_confirm):
+        """Test that an empty transcript returns before prompting or contacting Ollama."""
+        config = {'ollama': {'model': 'test', 'base_url': 'http://localhost:11434'}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            result = main.translate_subtitles([], output_dir / '20240101_video.srt', output_dir,
+                                              '20240101', 'video', config)
+
+        assert result is None
+        mock_confirm.assert_not_called()
+        mock_translator.assert_not_called()
+
+    def test_bilingual_segments_reject_length_mismatch(self):
+        """Test that a missing translation raises instead of silently dropping lines."""
+        original = [{'start': 0.0, 'end': 1.0, 'text': 'a'}, {'start': 1.0, 'end': 2.0, 'text': 'b'}]
+        translated = [{'start': 0.0, 'end': 1.0, 'text': 'A'}]
+
+        with pytest.raises(ValueError):
+            main.create_bilingual_segments(original, translated)
+
+    @patch('main.OllamaTranslator')
+    def test_translation_parses_srt_when_segments_deferred(self, mock_translator):
+        """Test that segments=None parses srt_path once translation is accepted."""
+        mock_translator_instance = mock_translator.return_value
+        mock_translator_instance.prompt_file_source = None
+        mock_translator_instance.check_connection.return_value = True
+        mock_translator_instance.translate_segments.side_effect = lambda segments, *args, **kwargs: segments
+        config = {'ollama': {'model': 'test', 'base_url': 'http://localhost:11434'}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            srt_path = output_dir / '20240101_video.srt'
+            srt_path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHello\n", encoding='utf-8')
+
+            main.translate_subtitles(None, srt_path, output_dir, '20240101', 'video', config, yes=True)
+
+        segments = mock_translator_instance.translate_segments.call_args[0][0]
+        assert segments == [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}]
+
+    @patch('main.OllamaTranslator')
+    def test_concurrency_flag_reaches_translator(self, mock_translator):
+        """Test that --concurrency is passed to the translator for SRT input."""
+        runner = CliRunner()
+        mock_translator.return_value.prompt_file_source = None
+        mock_translator.return_value.check_connection.return_value = False
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / '20240101_video.srt'
+            srt_path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHello\n", encoding='utf-8')
+
+            result = runner.invoke(main.main, [str(srt_path), '-y', '--concurrency', '4'])
+
+        assert result.exit_code == 0, result.output
+        assert mock_translator.call_args.kwargs['concurrency'] == 4
+
+    @patch('main.time.monotonic')
+    @patch('main.click.echo')
+    @patch('main.OllamaTranslator')
+    def test_progress_redraws_throttled(self, mock_translator, mock_echo, mock_monotonic):
+        """Test that progress redraws at most every PROGRESS_INTERVAL, but always shows the final count."""
+        # One clock reading per progress call
+        clock = iter([10.0, 10.1, 10.3, 10.35])
+        mock_monotonic.side_effect = lambda: next(clock)
+
+        def translate_segments(segments, source, target, progress_callback=None):
+            for current in (1, 2, 3, 4):
+                progress_callback(current, 4)
+            return segments
+
+        mock_translator_instance = mock_translator.return_value
+        mock_translator_instance.prompt_file_source = None
+        mock_translator_instance.check_connection.return_value = True
+        mock_translator_instance.translate_segments.side_effect = translate_segments
+        segments = [{'start': float(i), 'end': float(i + 1), 'text': 'a'} for i in range(4)]
+        config = {'ollama': {'model': 'test', 'base_url': 'http://localhost:11434'}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            main.translate_subtitles(segments, output_dir / '20240101_video.srt', output_dir,
+                                     '20240101', 'video', config, yes=True)
+
+        progress_writes = [c.args[0] for c in mock_echo.call_args_list if c.args and 'Translating segment' in c.args[0]]
+        assert progress_writes == [
+            "  Translating segment 1/4...\r",
+            "  Translating segment 3/4...\r",
+            "  Translating segment 4/4...\r",
+        ]
+
+    @patch('main.click.echo')
+    @patch('main.OllamaTranslator')
+    def test_progress_redraws_only_when_count_changes(self, mock_translator, mock_echo):
+        """Test that repeated progress reports for the same count don't redraw the line."""
+        def translate_segments(segments, source, target, progress_callback=None):
+            for current in (1, 1, 2, 2, 2):
+                progress_callback(current, 2)
+            return segments
+
+        mock_translator_instance = mock_translator.return_value
+        mock_translator_instance.prompt_file_source = None
+        mock_translator_instance.check_connection.return_value = True
+        mock_translator_instance.translate_segments.side_effect = translate_segments
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'a'}, {'start': 1.0, 'end': 2.0, 'text': 'b'}]
+        config = {'ollama': {'model': 'test', 'base_url': 'http://localhost:11434'}}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir)
+            main.translate_subtitles(segments, output_dir / '20240101_video.srt', output_dir,
+                                     '20240101', 'video', config, yes=True)
+
+        progress_writes = [c for c in mock_echo.call_args_list if c.args and 'Translating segment' in c.args[0]]
+        assert [c.args[0] for c in progress_writes] == [
+            "  Translating segment 1/2...\r",
+            "  Translating segment 2/2...\r",
+        ]
+
+
+class TestSrtInput:
+    """Tests for SRT input detection and output naming."""
+
+    @patch('main.translate_subtitles', return_value=None)
+    def test_handle_srt_translation_without_date_prefix(self, mock_translate):
+        """Without a YYYYMMDD prefix the date comes from the file and only the suffix is dropped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / 'video.Chinese.srt'
+            srt_path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHello\n", encoding='utf-8')
+
+            main.handle_srt_translation(str(srt_path), tmpdir, {'output': {'directory': None}})
+            expected_prefix = main.get_date_prefix(file_path=srt_path)
+
+        args = mock_translate.call_args[0]
+        assert (args[3], args[4]) == (expected_prefix, 'video')
+
+    @patch('main.translate_subtitles')
+    def test_empty_srt_file_fails_fast(self, mock_translate):
+        """An SRT without any subtitle blocks exits with an error before translation."""
+        runner = CliRunner()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / '20240101_empty.srt'
+            srt_path.write_text('', encoding='utf-8')
+
+            result = runner.invoke(main.main, [str(srt_path), '-y'])
+
+        assert result.exit_code == 1
+        assert 'No subtitle segments found' in result.output
+        mock_translate.assert_not_called()
+
+    def test_is_srt_file_case_insensitive(self):
+        """The .srt extension is matched regardless of case."""
+        assert main.is_srt_file('movie.SRT')
+        assert main.is_srt_file('/path/to/20240101_video.Chinese.srt')
+        assert not main.is_srt_file('video.mp4')
+        assert not main.is_srt_file('srt')
+
+    @pytest.mark.parametrize('filename, date_prefix, base_name', [
+        ('20240101_video.Chinese.srt', '20240101', 'video'),
+        ('20240101_video.srt', '20240101', 'video'),
+        ('20240101video.srt', '20240101', 'video'),
+        ('20240101_my.video.Chinese.srt', '20240101', 'my.video'),
+        ('20240101.srt', '20240101', ''),
+    ])
+    @patch('main.translate_subtitles', return_value=None)
+    def test_handle_srt_translation_reads_date_prefix(self, mock_translate, filename, date_prefix, base_name):
+        """The YYYYMMDD_ prefix is reused and a trailing language suffix is dropped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / filename
+            srt_path.write_text("1\n00:00:00,000 --> 00:00:01,000\nHello\n", encoding='utf-8')
+
+            main.handle_srt_translation(str(srt_path), tmpdir, {'output': {'directory': None}})
+
+        args = mock_translate.call_args[0]
+        assert (args[3], args[4]) == (date_prefix, base_name)
+
+
 class TestOutputDirectoryPriority:
     """Tests for output directory configuration priority: CLI > config > default."""
 
@@ -350,6 +996,18 @@ class TestOutputDirectoryPriority:
             assert result == new_dir
             assert new_dir.exists()
 
+    def test_directory_created_once_per_process(self):
+        """Repeated lookups of the same output directory only call mkdir once."""
+        with tempfile.TemporaryDirectory() as base_dir:
+            new_dir = Path(base_dir) / 'repeated_output_dir'
+            config = {'output': {'directory': None}}
+
+            with patch.object(Path, 'mkdir') as mock_mkdir:
+                main.get_output_directory(str(new_dir), config, Path(base_dir))
+                main.get_output_directory(str(new_dir), config, Path(base_dir))
+
+            assert mock_mkdir.call_count == 1
+
 
 class TestDefaultOutputDirectory:
     """Tests for default output directory: cwd for URLs, video dir for local files."""
@@ -395,9 +1053,8 @@ class TestDefaultOutputDirectory:
 
             assert result.exit_code == 0
 
-            # Verify write_srt path is in cwd, not in temp dir
-            srt_call_args = mock_writer_instance.write_srt.call_args[0]
-            srt_path = str(srt_call_args[1])
+            # Verify the SRT path is in cwd, not in temp dir
+            srt_path = str(mock_writer_instance.srt_stream.call_args[0][0])
             assert tmpdir not in srt_path  # Should NOT be in temp dir
             assert str(Path.cwd()) in srt_path  # Should be in cwd
 
@@ -429,9 +1086,8 @@ class TestDefaultOutputDirectory:
 
             assert result.exit_code == 0
 
-            # Verify write_srt path is in the video's directory
-            srt_call_args = mock_writer_instance.write_srt.call_args[0]
-            srt_path = str(srt_call_args[1])
+            # Verify the SRT path is in the video's directory
+            srt_path = str(mock_writer_instance.srt_stream.call_args[0][0])
             assert tmpdir in srt_path  # Should be in video's directory
 
 
@@ -573,6 +1229,30 @@ class TestSkipOptionInSubtitleMenu:
             assert result.exit_code == 0, result.output
             assert 'Skip' in result.output or 'skip' in result.output.lower()
 
+    @patch('main.SubtitleWriter')
+    @patch('main.load_config')
+    @patch('main.VideoDownloader')
+    def test_downloaded_subtitle_not_parsed_when_translation_declined(self, mock_downloader, mock_config, mock_writer):
+        """A downloaded subtitle is only parsed once the user accepts translation."""
+        runner = CliRunner()
+        mock_config.return_value = {
+            'ollama': {'model': 'test', 'base_url': 'http://localhost:11434',
+                       'batch_size': 50, 'keep_alive': '10m', 'auto_unload': False},
+            'output': {'directory': None},
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_dl = self._make_downloader_with_subtitles(mock_downloader, tmpdir)
+
+            result = runner.invoke(
+                main.main,
+                ['https://youtube.com/watch?v=abc123', '--output', tmpdir],
+                input='1\nn\n',  # pick the first subtitle, decline translation
+            )
+
+            assert result.exit_code == 0, result.output
+            mock_dl.download_subtitle.assert_called_once()
+            mock_writer.return_value.parse_srt.assert_not_called()
+
     @patch('main.load_config')
     @patch('main.VideoDownloader')
     def test_skip_in_interactive_exits_without_processing(self, mock_downloader, mock_config):
@@ -641,3 +1321,99 @@ class TestSkipOptionInSubtitleMenu:
 
             assert result.exit_code == 0
             assert 'Skip' in result.output or 'skip' in result.output.lower()
+
+
+class TestSystemCheckProbes:
+    """Tests for the cached system check helpers."""
+
+    @pytest.fixture(autouse=True)
+    def clear_probe_caches(self):
+        main._get_nvidia_info.cache_clear()
+        main._check_ffmpeg.cache_clear()
+        yield
+        main._get_nvidia_info.cache_clear()
+        main._check_ffmpeg.cache_clear()
+
+    def test_nvidia_info_spawns_nvidia_smi_once(self):
+        """The CUDA version comes from the driver library, so only the query call runs."""
+        query = Mock(stdout="535.104.05, NVIDIA GeForce RTX 3080\n")
+        with patch('main.subprocess.run', return_value=query) as mock_run, \
+             patch('main._get_cuda_driver_version', return_value="12.2"):
+            info = main._get_nvidia_info()
+            main._get_nvidia_info()
+
+        assert mock_run.call_count == 1
+        assert info == {
+            'available': True,
+            'driver_version': '535.104.05',
+            'cuda_version': '12.2',
+            'gpu_name': 'NVIDIA GeForce RTX 3080'
+        }
+
+    def test_nvidia_info_falls_back_to_header(self):
+        """Without the driver library, the CUDA version is read from the nvidia-smi header."""
+        query = Mock(stdout="535.104.05, NVIDIA GeForce RTX 3080\n")
+        header = Mock(stdout="| NVIDIA-SMI 535.104.05   Driver Version: 535.104.05   CUDA Version: 12.2 |\n")
+        with patch('main.subprocess.run', side_effect=[query, header]), \
+             patch('main._get_cuda_driver_version', return_value=None):
+            info = main._get_nvidia_info()
+
+        assert info['cuda_version'] == '12.2'
+
+    def test_nvidia_info_without_gpu(self):
+        """A missing nvidia-smi reports no GPU."""
+        with patch('main.subprocess.run', side_effect=FileNotFoundError()):
+            info = main._get_nvidia_info()
+
+        assert info['available'] is False
+
+    def test_check_ffmpeg_uses_path_lookup(self):
+        """ffmpeg is found on PATH without spawning it, once per process."""
+        with patch('main.shutil.which', return_value='/usr/bin/ffmpeg') as mock_which, \
+             patch('main.subprocess.run') as mock_run:
+            assert main._check_ffmpeg() is True
+            assert main._check_ffmpeg() is True
+
+        mock_which.assert_called_once_with('ffmpeg')
+        mock_run.assert_not_called()
+
+    def test_check_ffmpeg_missing(self):
+        """A missing ffmpeg binary is reported as not installed."""
+        with patch('main.shutil.which', return_value=None):
+            assert main._check_ffmpeg() is False
+
+    def test_system_check_runs_probes_concurrently(self):
+        """ffmpeg and Ollama probes overlap, and results print in a fixed order."""
+        import threading
+        barrier = threading.Barrier(2, timeout=5)
+
+        def probe():
+            barrier.wait()  # raises BrokenBarrierError if the probes ran one after another
+            return True
+
+        with patch('main.platform.system', return_value='Darwin'), \
+             patch('main.platform.machine', return_value='arm64'), \
+             patch('main._check_ffmpeg', side_effect=probe), \
+             patch('main._check_ollama', side_effect=probe):
+            result = CliRunner().invoke(main.main, ['--check-system'])
+
+        assert result.exit_code == 0, result.output
+        assert result.output.index('ffmpeg: Installed') < result.output.index('Ollama: Running')
+
+
+class TestStartupImports:
+    """Tests that CLI startup doesn't load the heavy backends."""
+
+    def test_import_main_skips_heavy_modules(self):
+        """Importing main must not pull in Whisper, yt-dlp, requests, numpy or ffmpeg-python."""
+        import subprocess
+        heavy = ['torch', 'whisper', 'faster_whisper', 'stable_whisper', 'mlx_whisper',
+                 'yt_dlp', 'requests', 'numpy', 'ffmpeg']
+        code = f"import sys, main; print([m for m in {heavy!r} if m in sys.modules])"
+
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            cwd=Path(__file__).parent.parent, capture_output=True, text=True, check=True,
+        )
+
+        assert result.stdout.strip() == '[]'
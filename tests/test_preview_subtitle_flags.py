@@ -106,6 +106,35 @@ class TestSubtitleFlag:
             call_args = mock_downloader_instance.download_subtitle.call_args
             assert call_args[0][1] == 'en'
 
+    @patch('main.VideoDownloader')
+    @patch('main.SubtitleWriter')
+    def test_subtitle_download_reuses_subtitle_check_metadata(self, mock_writer, mock_downloader):
+        """The ID and upload date from the subtitle check name the file; no second metadata fetch."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mock_downloader_instance = mock_downloader.return_value
+            mock_downloader_instance.get_available_subtitles.return_value = (
+                {'en': {'name': 'English'}},
+                {'title': 'Test Video', 'channel': None, 'video_id': 'abc123', 'upload_date': '20200101'},
+            )
+
+            def create_srt(url, lang, path):
+                Path(path).write_text("1\n00:00:00,000 --> 00:00:01,000\nTest\n")
+                return path
+
+            mock_downloader_instance.download_subtitle.side_effect = create_srt
+
+            result = runner.invoke(
+                main.main,
+                ['https://youtube.com/watch?v=abc123', '--subtitle', '1', '--output', tmpdir],
+                input='n\n',
+            )
+
+            assert result.exit_code == 0, result.output
+            mock_downloader_instance.get_video_info.assert_not_called()
+            assert mock_downloader_instance.download_subtitle.call_args[0][2] == str(Path(tmpdir) / '20200101_abc123.srt')
+
     @patch('main.VideoDownloader')
     def test_subtitle_out_of_range_exits_with_error(self, mock_downloader):
         """--subtitle N where N exceeds available count should exit with code 1."""
@@ -1398,6 +1427,27 @@ class TestPromptFileInPreviewCommands:
         )
         assert '--prompt-file' not in cmd
 
+    @patch('main.load_config')
+    def test_local_file_preview_keeps_prompt_file(self, mock_config):
+        """A transcribe-and-translate preview command should keep --prompt-file."""
+        runner = CliRunner()
+        mock_config.return_value = {
+            'ollama': {'model': 'test', 'base_url': 'http://localhost:11434', 'auto_unload': False},
+            'output': {'directory': None},
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video_path = Path(tmpdir) / 'video.mp4'
+            video_path.touch()
+            prompt_path = Path(tmpdir) / 'glossary.txt'
+            prompt_path.write_text('Keep names in English.')
+
+            result = runner.invoke(
+                main.main, [str(video_path), '--preview', '--prompt-file', str(prompt_path)]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert f'--prompt-file {prompt_path}' in result.output
+
     def test_prompt_file_with_spaces_is_quoted(self):
         """Prompt file paths with spaces should be shell-quoted."""
         cmd = main._build_preview_command(
@@ -1405,3 +1455,93 @@ class TestPromptFileInPreviewCommands:
             False, False, False, prompt_file='my glossary.txt',
         )
         assert "--prompt-file 'my glossary.txt'" in cmd
+
+
+class TestComputeTypeInPreviewCommands:
+    """Tests that --compute-type is passed through to preview output commands."""
+
+    def test_build_preview_command_includes_compute_type(self):
+        """_build_preview_command should include --compute-type when provided."""
+        cmd = main._build_preview_command(
+            'https://youtube.com/watch?v=abc123', 0, 'medium', None, None,
+            False, False, False, compute_type='int8',
+        )
+        assert '--compute-type int8' in cmd
+
+    def test_build_transcribe_command_includes_compute_type(self):
+        """_build_transcribe_command should include --compute-type when provided."""
+        cmd = main._build_transcribe_command(
+            'https://youtube.com/watch?v=abc123', 'medium', None, None,
+            False, False, False, compute_type='float16',
+        )
+        assert '--compute-type float16' in cmd
+
+    def test_build_preview_command_omits_compute_type_when_none(self):
+        """_build_preview_command should not include --compute-type when not provided."""
+        cmd = main._build_preview_command(
+            'https://youtube.com/watch?v=abc123', 0, 'medium', None, None,
+            False, False, False,
+        )
+        assert '--compute-type' not in cmd
+
+
+class TestCompileInPreviewCommands:
+    """Tests that --compile is passed through to commands that transcribe."""
+
+    def test_build_preview_command_includes_compile(self):
+        cmd = main._build_preview_command(
+            'https://youtube.com/watch?v=abc123', 0, 'medium', None, None,
+            False, False, False, compile_model=True,
+        )
+        assert '--compile' in cmd
+
+    def test_build_transcribe_command_includes_compile(self):
+        cmd = main._build_transcribe_command(
+            'https://youtube.com/watch?v=abc123', 'medium', None, None,
+            False, False, False, compile_model=True,
+        )
+        assert '--compile' in cmd
+
+    def test_build_transcribe_command_includes_split_device(self):
+        cmd = main._build_transcribe_command(
+            'https://youtube.com/watch?v=abc123', 'medium', None, None,
+            False, False, False, split_device=True,
+        )
+        assert '--split-device' in cmd
+
+    @pytest.mark.parametrize("value, flag", [(True, '--condition-on-previous'), (False, '--no-condition-on-previous')])
+    def test_build_transcribe_command_includes_condition_on_previous(self, value, flag):
+        cmd = main._build_transcribe_command(
+            'https://youtube.com/watch?v=abc123', 'medium', None, None,
+            False, False, False, condition_on_previous=value,
+        )
+        assert cmd.endswith(flag)
+
+    def test_build_transcribe_command_omits_compile_by_default(self):
+        cmd = main._build_transcribe_command(
+            'https://youtube.com/watch?v=abc123', 'medium', None, None,
+            False, False, False,
+        )
+        assert '--compile' not in cmd
+
+
+class TestConcurrencyInPreviewCommands:
+    """Tests that --concurrency is passed through to commands that translate."""
+
+    def test_build_translate_command_includes_concurrency(self):
+        """_build_translate_command should include --concurrency when provided."""
+        cmd = main._build_translate_command('test.srt', None, None, concurrency=4)
+        assert '--concurrency 4' in cmd
+
+    def test_build_preview_command_includes_concurrency(self):
+        """_build_preview_command should include --concurrency when provided."""
+        cmd = main._build_preview_command(
+            'https://youtube.com/watch?v=abc123', 1, 'medium', None, None,
+            False, False, False, concurrency=2,
+        )
+        assert '--concurrency 2' in cmd
+
+    def test_build_translate_command_omits_concurrency_when_none(self):
+        """_build_translate_command should not include --concurrency when not provided."""
+        cmd = main._build_translate_command('test.srt', None, None)
+        assert '--concurrency' not in cmd
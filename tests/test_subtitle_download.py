@@ -9,7 +9,7 @@ from src.video_downloader import VideoDownloader
 class TestGetAvailableSubtitles:
     """Tests for subtitle listing functionality."""
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_get_available_subtitles_returns_dict(self, mock_youtube_dl):
         """Test that get_available_subtitles returns subtitles as first element of tuple."""
         # Mock yt-dlp to return subtitle info
@@ -30,7 +30,7 @@ class TestGetAvailableSubtitles:
         assert 'en' in result
         assert 'es' in result
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_get_available_subtitles_filters_auto_generated(self, mock_youtube_dl):
         """Test that auto-generated subtitles are filtered out."""
         # Mock yt-dlp to return both manual and auto-generated subtitles
@@ -57,7 +57,7 @@ class TestGetAvailableSubtitles:
         assert 'de' not in result
         assert 'ja' not in result
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_get_available_subtitles_empty_when_none(self, mock_youtube_dl):
         """Test that empty dict is returned when no subtitles exist."""
         # Mock yt-dlp to return no subtitles
@@ -79,7 +79,7 @@ class TestGetAvailableSubtitles:
 class TestGetAvailableSubtitlesReturnsMeta:
     """Tests that get_available_subtitles returns video metadata alongside subtitles."""
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_returns_tuple_of_subtitles_and_meta(self, mock_youtube_dl):
         """get_available_subtitles should return (subtitles_dict, video_meta_dict)."""
         mock_instance = MagicMock()
@@ -100,7 +100,7 @@ class TestGetAvailableSubtitlesReturnsMeta:
         assert isinstance(subtitles, dict)
         assert isinstance(meta, dict)
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_meta_contains_title_and_channel(self, mock_youtube_dl):
         """Video meta should contain title and channel fields."""
         mock_instance = MagicMock()
@@ -118,7 +118,25 @@ class TestGetAvailableSubtitlesReturnsMeta:
         assert meta['title'] == 'My Video Title'
         assert meta['channel'] == 'Test Channel'
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
+    def test_meta_contains_naming_fields(self, mock_youtube_dl):
+        """Video meta should carry the ID and upload date used to name output files."""
+        mock_instance = MagicMock()
+        mock_youtube_dl.return_value.__enter__.return_value = mock_instance
+        mock_instance.extract_info.return_value = {
+            'subtitles': {},
+            'id': 'abc123',
+            'title': 'My Video Title',
+            'upload_date': '20240115',
+        }
+
+        downloader = VideoDownloader()
+        _, meta = downloader.get_available_subtitles("https://youtube.com/watch?v=abc123")
+
+        assert meta['video_id'] == 'abc123'
+        assert meta['upload_date'] == '20240115'
+
+    @patch('yt_dlp.YoutubeDL')
     def test_meta_handles_missing_channel(self, mock_youtube_dl):
         """Video meta should handle missing channel gracefully."""
         mock_instance = MagicMock()
@@ -136,7 +154,7 @@ class TestGetAvailableSubtitlesReturnsMeta:
         assert meta['title'] == 'My Video Title'
         assert meta['channel'] is None
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_error_returns_empty_subtitles_and_empty_meta(self, mock_youtube_dl):
         """On error, should return empty dict and empty meta."""
         mock_instance = MagicMock()
@@ -155,7 +173,7 @@ class TestGetAvailableSubtitlesReturnsMeta:
 class TestDownloadSubtitle:
     """Tests for subtitle download functionality."""
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_subtitle_creates_file(self, mock_youtube_dl):
         """Test that download_subtitle creates a subtitle file."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -186,7 +204,7 @@ class TestDownloadSubtitle:
             # Verify file was created
             assert Path(output_path).exists()
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_subtitle_correct_language(self, mock_youtube_dl):
         """Test that download_subtitle downloads the correct language."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -215,7 +233,7 @@ class TestDownloadSubtitle:
             # Verify the file was created
             assert Path(output_path).exists()
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_subtitle_raises_on_invalid_lang(self, mock_youtube_dl):
         """Test that download_subtitle raises exception for invalid language."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -239,7 +257,7 @@ class TestDownloadSubtitle:
 class TestGetVideoInfo:
     """Tests for getting video metadata without downloading."""
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_get_video_info_without_download(self, mock_youtube_dl):
         """Test that get_video_info doesn't download the video."""
         # Mock yt-dlp
@@ -261,7 +279,7 @@ class TestGetVideoInfo:
             download=False
         )
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_get_video_info_returns_required_fields(self, mock_youtube_dl):
         """Test that get_video_info returns all required fields."""
         # Mock yt-dlp
@@ -289,7 +307,7 @@ class TestGetVideoInfo:
         assert result['duration'] == 300.0
         assert result['platform'] == 'youtube'
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_get_video_info_includes_channel(self, mock_youtube_dl):
         """Test that get_video_info returns channel field."""
         mock_instance = MagicMock()
@@ -307,7 +325,7 @@ class TestGetVideoInfo:
 
         assert result['channel'] == 'Test Channel'
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_get_video_info_missing_channel_returns_none(self, mock_youtube_dl):
         """Test that get_video_info handles missing channel gracefully."""
         mock_instance = MagicMock()
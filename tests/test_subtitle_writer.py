@@ -92,6 +92,14 @@ class TestSubtitleWriter:
         assert writer._format_timestamp(65.123) == "00:01:05,123"
         assert writer._format_timestamp(3661.5) == "01:01:01,500"
 
+    def test_format_timestamp_float_drift(self):
+        """Test that float representation error doesn't drop a millisecond."""
+        writer = SubtitleWriter()
+
+        assert writer._format_timestamp(1.001) == "00:00:01,001"
+        assert writer._format_timestamp(0.29) == "00:00:00,290"
+        assert writer._format_timestamp(59.9996) == "00:01:00,000"
+
     def test_empty_segments(self):
         """Test handling of empty segments list."""
         writer = SubtitleWriter()
@@ -161,3 +169,122 @@ class TestSubtitleWriter:
             content2 = srt_path2.read_text()
 
             assert content1 == content2
+
+    def test_parse_srt_bom_and_crlf(self):
+        """Test that a UTF-8 BOM and Windows line endings are handled."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / "windows.srt"
+            srt_path.write_bytes(
+                '\ufeff1\r\n00:00:01,000 --> 00:00:02,000\r\nFirst line\r\nSecond line\r\n\r\n'
+                '2\r\n00:00:03,000 --> 00:00:04,000\r\nNext\r\n'.encode('utf-8')
+            )
+
+            parsed = SubtitleWriter.parse_srt(str(srt_path))
+
+            assert [seg['text'] for seg in parsed] == ['First line\nSecond line', 'Next']
+            assert parsed[0]['start'] == 1.0
+
+    def test_parse_srt_lenient_timestamps(self):
+        """Test '.' separators, short millisecond fields, and trailing position info."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / "lenient.srt"
+            srt_path.write_text(
+                "1\n00:00:01.5 --> 00:00:02.25 X1:100 X2:200\nHello\n\n"
+                "2\n01:02:03,007 --> 01:02:04,000\nWorld\n",
+                encoding='utf-8'
+            )
+
+            parsed = SubtitleWriter.parse_srt(str(srt_path))
+
+            assert parsed[0]['start'] == 1.5
+            assert parsed[0]['end'] == 2.25
+            assert abs(parsed[1]['start'] - 3723.007) < 1e-9
+
+    def test_parse_srt_skips_malformed_blocks(self):
+        """Test that blocks without a timestamp or text are skipped."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / "broken.srt"
+            srt_path.write_text(
+                "1\nnot a timestamp\nText\n\n"
+                "2\n00:00:01,000 --> 00:00:02,000\n\n"
+                "3\n00:00:03,000 --> 00:00:04,000\nKept\n",
+                encoding='utf-8'
+            )
+
+            parsed = SubtitleWriter.parse_srt(str(srt_path))
+
+            assert [seg['text'] for seg in parsed] == ['Kept']
+
+    def test_iter_srt_yields_lazily(self, sample_segments):
+        """Test that iter_srt yields segments one at a time and matches parse_srt."""
+        writer = SubtitleWriter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / "test.srt"
+            writer.write_srt(sample_segments, str(srt_path))
+
+            segments = SubtitleWriter.iter_srt(str(srt_path))
+
+            assert next(segments) == sample_segments[0]
+            assert list(segments) == sample_segments[1:]
+            assert SubtitleWriter.parse_srt(str(srt_path)) == sample_segments
+
+    def test_srt_stream_matches_write_srt(self, sample_segments):
+        """Test that segments written one by one give the same file as write_srt."""
+        writer = SubtitleWriter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            streamed_path = Path(tmpdir) / "streamed.srt"
+            written_path = Path(tmpdir) / "written.srt"
+
+            with writer.srt_stream(str(streamed_path)) as write_segment:
+                for segment in sample_segments:
+                    write_segment(segment)
+            writer.write_srt(sample_segments, str(written_path))
+
+            assert streamed_path.read_text(encoding='utf-8') == written_path.read_text(encoding='utf-8')
+
+    def test_srt_stream_leaves_no_partial_file_on_error(self, sample_segments):
+        """Test that a failed stream removes its temporary file and writes nothing."""
+        writer = SubtitleWriter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / "partial.srt"
+
+            with pytest.raises(RuntimeError):
+                with writer.srt_stream(str(srt_path)) as write_segment:
+                    write_segment(sample_segments[0])
+                    raise RuntimeError("decoding failed")
+
+            assert list(Path(tmpdir).iterdir()) == []
+
+    def test_srt_stream_keeps_existing_file_until_done(self, sample_segments):
+        """Test that an existing SRT is only replaced once the stream completes."""
+        writer = SubtitleWriter()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / "existing.srt"
+            writer.write_srt(sample_segments[:1], str(srt_path))
+            original = srt_path.read_text(encoding='utf-8')
+
+            with pytest.raises(RuntimeError):
+                with writer.srt_stream(str(srt_path)) as write_segment:
+                    write_segment(sample_segments[1])
+                    assert srt_path.read_text(encoding='utf-8') == original
+                    raise RuntimeError("interrupted")
+            assert srt_path.read_text(encoding='utf-8') == original
+
+            with writer.srt_stream(str(srt_path)) as write_segment:
+                write_segment(sample_segments[1])
+            assert SubtitleWriter.parse_srt(str(srt_path)) == sample_segments[1:2]
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["existing.srt"]
+
+    def test_iter_srt_whitespace_only_separator(self):
+        """Test that lines containing only whitespace separate blocks."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            srt_path = Path(tmpdir) / "spaces.srt"
+            srt_path.write_text(
+                "1\n00:00:01,000 --> 00:00:02,000\nOne  \n \t\n\n"
+                "2\n00:00:03,000 --> 00:00:04,000\nTwo",
+                encoding='utf-8'
+            )
+
+            parsed = list(SubtitleWriter.iter_srt(str(srt_path)))
+
+            assert [seg['text'] for seg in parsed] == ['One', 'Two']
@@ -1,6 +1,19 @@
+import os
+import time
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
-from src.transcriber import Transcriber
+from src.transcriber import Transcriber, unload_models
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    """Loaded models and detected backends are shared per process; tests mock different hardware."""
+    unload_models()
+    Transcriber._backend_cache.clear()
+    yield
+    unload_models()
+    Transcriber._backend_cache.clear()
 
 
 class TestTranscriber:
@@ -32,6 +45,87 @@ class TestTranscriber:
         sig = inspect.signature(transcriber.transcribe)
         assert 'audio_path' in sig.parameters
 
+    def test_transcribe_accepts_audio_array(self):
+        """Test that in-memory audio skips the file existence check."""
+        transcriber = Transcriber()
+        samples = np.zeros(16000, dtype=np.float32)
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'Hi'}]
+
+        with patch.object(transcriber, '_transcribe_openai_whisper', return_value=segments) as mock_transcribe:
+            transcriber.backend = "openai-whisper"
+            result = transcriber.transcribe(samples)
+
+        assert result == segments
+        assert mock_transcribe.call_args[0][0] is samples
+
+    def test_audio_file_is_decoded_once(self, tmp_path):
+        """Test that a file path is decoded to samples once and reused for the same file."""
+        audio_file = tmp_path / "audio.wav"
+        audio_file.touch()
+        samples = np.zeros(16000, dtype=np.float32)
+        transcriber = Transcriber()
+        transcriber.backend = "openai-whisper"
+
+        with patch('src.audio_extractor.AudioExtractor.extract_to_array', return_value=samples) as mock_extract, \
+                patch.object(transcriber, '_transcribe_openai_whisper', return_value=[]) as mock_transcribe:
+            transcriber.transcribe(str(audio_file), language='en')
+            transcriber.transcribe(str(audio_file), language='de')
+
+        mock_extract.assert_called_once_with(str(audio_file))
+        assert all(c[0][0] is samples for c in mock_transcribe.call_args_list)
+
+    def test_pcm_wav_is_read_without_ffmpeg(self, tmp_path):
+        """Test that a 16 kHz mono WAV (e.g. from --keep-audio) skips the ffmpeg decode."""
+        from src.audio_extractor import AudioExtractor
+        samples = np.array([0.0, 0.5, -0.5], dtype=np.float32)
+        wav_path = AudioExtractor().write_wav(samples, str(tmp_path / "audio.wav"))
+        transcriber = Transcriber()
+        transcriber.backend = "openai-whisper"
+
+        with patch('src.audio_extractor.AudioExtractor.extract_to_array') as mock_extract, \
+                patch.object(transcriber, '_transcribe_openai_whisper', return_value=[]) as mock_transcribe:
+            transcriber.transcribe(wav_path)
+
+        mock_extract.assert_not_called()
+        assert mock_transcribe.call_args[0][0].tolist() == samples.tolist()
+
+    def test_missing_audio_file_raises(self, tmp_path):
+        transcriber = Transcriber()
+
+        with pytest.raises(FileNotFoundError, match="Audio file not found"):
+            transcriber.transcribe(str(tmp_path / "missing.wav"))
+
+    def test_modified_audio_file_is_decoded_again(self, tmp_path):
+        """Test that the decoded-audio cache is keyed by mtime, so a rewritten file is decoded again."""
+        audio_file = tmp_path / "audio.wav"
+        audio_file.touch()
+        transcriber = Transcriber()
+        transcriber.backend = "openai-whisper"
+
+        with patch('src.audio_extractor.AudioExtractor.extract_to_array', return_value=np.zeros(16000)) as mock_extract, \
+                patch.object(transcriber, '_transcribe_openai_whisper', return_value=[]):
+            transcriber.transcribe(str(audio_file))
+            os.utime(audio_file, (0, 0))
+            transcriber.transcribe(str(audio_file))
+
+        assert mock_extract.call_count == 2
+
+    def test_load_model_preloads_once(self):
+        """Test that load_model loads eagerly and transcribe() reuses the loaded model."""
+        transcriber = Transcriber()
+        transcriber.backend = "openai-whisper"
+        mock_model = MagicMock()
+        mock_model.transcribe.return_value = {"segments": []}
+        mock_whisper = MagicMock()
+        mock_whisper.load_model.return_value = mock_model
+
+        with patch.dict('sys.modules', {'whisper': mock_whisper}):
+            transcriber.load_model()
+            transcriber.transcribe(np.zeros(16000, dtype=np.float32))
+
+        mock_whisper.load_model.assert_called_once()
+        assert transcriber.model is mock_model
+
     def test_transcribe_accepts_language_parameter(self):
         """Test that transcribe accepts optional language parameter."""
         import inspect
@@ -78,7 +172,7 @@ class TestTranscriberStableTs:
         """Test that use_stable=False uses standard backend detection."""
         transcriber = Transcriber(use_stable=False)
         # Should not use stable-ts backend
-        assert transcriber.backend in ("mlx", "openai-whisper")
+        assert transcriber.backend in ("mlx", "faster-whisper", "openai-whisper")
 
     @patch('src.transcriber.platform.system', return_value='Darwin')
     @patch('src.transcriber.platform.machine', return_value='arm64')
@@ -216,6 +310,441 @@ class TestTranscriberStableTsTranscribe:
             assert seg['text'] == f"Segment {i}"
 
 
+class TestTranscriberFasterWhisper:
+    """Tests for the faster-whisper backend."""
+
+    @staticmethod
+    def installed(name):
+        return MagicMock() if name == "faster_whisper" else None
+
+    @patch('src.transcriber.platform.system', return_value='Linux')
+    @patch('src.transcriber.platform.machine', return_value='x86_64')
+    def test_faster_whisper_preferred_when_installed(self, mock_machine, mock_system):
+        """Test that faster-whisper is used on CUDA when installed."""
+        mock_ct2 = MagicMock()
+        mock_ct2.get_cuda_device_count.return_value = 1
+
+        with patch('src.transcriber.importlib.util.find_spec', side_effect=self.installed), \
+             patch.dict('sys.modules', {'ctranslate2': mock_ct2}):
+            transcriber = Transcriber()
+
+        assert transcriber.backend == "faster-whisper"
+        assert transcriber.device == "cuda"
+        assert transcriber.compute_type == "int8_float16"
+
+    @patch('src.transcriber.platform.system', return_value='Linux')
+    @patch('src.transcriber.platform.machine', return_value='x86_64')
+    def test_faster_whisper_cpu_without_cuda(self, mock_machine, mock_system):
+        """Test that faster-whisper falls back to CPU without CUDA devices."""
+        mock_ct2 = MagicMock()
+        mock_ct2.get_cuda_device_count.return_value = 0
+
+        with patch('src.transcriber.importlib.util.find_spec', side_effect=self.installed), \
+             patch.dict('sys.modules', {'ctranslate2': mock_ct2}):
+            transcriber = Transcriber()
+
+        assert transcriber.backend == "faster-whisper"
+        assert transcriber.device == "cpu"
+        assert transcriber.compute_type == "int8"
+
+    @patch('src.transcriber.platform.system', return_value='Linux')
+    @patch('src.transcriber.platform.machine', return_value='x86_64')
+    def test_compute_type_override(self, mock_machine, mock_system):
+        """Test that an explicit compute_type replaces the int8 default."""
+        mock_ct2 = MagicMock()
+        mock_ct2.get_cuda_device_count.return_value = 1
+
+        with patch('src.transcriber.importlib.util.find_spec', side_effect=self.installed), \
+             patch.dict('sys.modules', {'ctranslate2': mock_ct2}):
+            transcriber = Transcriber(compute_type="float16")
+
+        assert transcriber.compute_type == "float16"
+
+    def test_compute_type_ignored_by_other_backends(self):
+        """Test that compute_type doesn't change openai-whisper's reported precision."""
+        with patch('src.transcriber.importlib.util.find_spec', return_value=None):
+            transcriber = Transcriber(compute_type="bfloat16")
+
+        assert transcriber.backend in ("mlx", "openai-whisper")
+        assert transcriber.compute_type != "bfloat16"
+
+    def test_batched_pipeline_used_on_cuda(self):
+        """Test that CUDA transcription goes through BatchedInferencePipeline with a batch size."""
+        transcriber = Transcriber()
+        transcriber.backend, transcriber.device, transcriber.compute_type = "faster-whisper", "cuda", "float16"
+        transcriber.batch_size = 16
+
+        segment = MagicMock(start=0.0, end=1.5, text="  Hello  ")
+        mock_fw = MagicMock()
+        mock_fw.BatchedInferencePipeline.return_value.transcribe.return_value = (iter([segment]), MagicMock())
+
+        with patch.dict('sys.modules', {'faster_whisper': mock_fw}):
+            result = transcriber.transcribe(np.zeros(16000, dtype=np.float32), language='en')
+
+        assert result == [{'start': 0.0, 'end': 1.5, 'text': 'Hello'}]
+        mock_fw.WhisperModel.assert_called_once_with("medium", device="cuda", compute_type="float16", download_root=None)
+        kwargs = mock_fw.BatchedInferencePipeline.return_value.transcribe.call_args[1]
+        assert kwargs == {'language': 'en', 'batch_size': 16}
+
+    def test_segments_reach_callback_while_decoding(self):
+        """Test that on_segment sees each segment before the next one is decoded."""
+        transcriber = Transcriber()
+        transcriber.backend, transcriber.device, transcriber.compute_type = "faster-whisper", "cpu", "int8"
+        events = []
+
+        def decode():
+            for i in range(2):
+                events.append(f"decoded {i}")
+                yield MagicMock(start=float(i), end=i + 1.0, text=f"Line {i}")
+
+        mock_fw = MagicMock()
+        mock_fw.BatchedInferencePipeline.return_value.transcribe.return_value = (decode(), MagicMock())
+
+        with patch.dict('sys.modules', {'faster_whisper': mock_fw}):
+            result = transcriber.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                on_segment=lambda segment: events.append(f"got {segment['text']}")
+            )
+
+        assert events == ["decoded 0", "got Line 0", "decoded 1", "got Line 1"]
+        assert [segment['text'] for segment in result] == ["Line 0", "Line 1"]
+
+    def test_batched_pipeline_used_on_cpu(self):
+        """Test that CPU transcription is batched too, with the smaller CPU batch size."""
+        transcriber = Transcriber()
+        transcriber.backend, transcriber.device, transcriber.compute_type = "faster-whisper", "cpu", "int8"
+        transcriber.batch_size = 8
+
+        mock_fw = MagicMock()
+        mock_fw.BatchedInferencePipeline.return_value.transcribe.return_value = (iter([]), MagicMock())
+
+        with patch.dict('sys.modules', {'faster_whisper': mock_fw}):
+            transcriber.transcribe(np.zeros(16000, dtype=np.float32))
+
+        mock_fw.BatchedInferencePipeline.assert_called_once_with(model=mock_fw.WhisperModel.return_value)
+        assert mock_fw.BatchedInferencePipeline.return_value.transcribe.call_args[1] == {'batch_size': 8}
+
+    @patch('src.transcriber.platform.system', return_value='Linux')
+    @patch('src.transcriber.platform.machine', return_value='x86_64')
+    def test_batch_size_defaults_per_device(self, mock_machine, mock_system):
+        """Test that the batch size defaults to 16 on CUDA, 8 on CPU, and can be overridden."""
+        sizes = []
+        for cuda_devices, batch_size in ((1, None), (0, None), (1, 4)):
+            Transcriber._backend_cache.clear()
+            mock_ct2 = MagicMock()
+            mock_ct2.get_cuda_device_count.return_value = cuda_devices
+            with patch('src.transcriber.importlib.util.find_spec', side_effect=self.installed), \
+                 patch.dict('sys.modules', {'ctranslate2': mock_ct2}):
+                sizes.append(Transcriber(batch_size=batch_size).batch_size)
+
+        assert sizes == [16, 8, 4]
+
+    @patch('src.transcriber.platform.system', return_value='Linux')
+    @patch('src.transcriber.platform.machine', return_value='x86_64')
+    def test_backend_detected_once_per_process(self, mock_machine, mock_system):
+        """Test that later Transcribers reuse the detected backend instead of querying CUDA again."""
+        mock_ct2 = MagicMock()
+        mock_ct2.get_cuda_device_count.return_value = 1
+
+        with patch('src.transcriber.importlib.util.find_spec', side_effect=self.installed), \
+             patch.dict('sys.modules', {'ctranslate2': mock_ct2}):
+            first = Transcriber()
+            second = Transcriber(model_size="small", compute_type="float16")
+
+        mock_ct2.get_cuda_device_count.assert_called_once()
+        assert (first.backend, first.device, first.compute_type) == ("faster-whisper", "cuda", "int8_float16")
+        assert (second.backend, second.device, second.compute_type) == ("faster-whisper", "cuda", "float16")
+
+
+class TestTranscriberConditionOnPrevious:
+    """Tests for condition_on_previous_text (auto-off for long audio)."""
+
+    def _transcribe(self, seconds, **kwargs):
+        transcriber = Transcriber(**kwargs)
+        transcriber.backend = "openai-whisper"
+        transcriber.model = MagicMock()
+        transcriber.model.transcribe.return_value = {"segments": []}
+        transcriber.transcribe(np.zeros(int(seconds * 16000), dtype=np.float32))
+        return transcriber.model.transcribe.call_args[1]['condition_on_previous_text']
+
+    def test_short_audio_conditions_on_previous_text(self):
+        assert self._transcribe(60) is True
+
+    def test_long_audio_does_not_condition(self):
+        assert self._transcribe(20 * 60) is False
+
+    def test_explicit_setting_wins(self):
+        assert self._transcribe(60, condition_on_previous_text=False) is False
+        assert self._transcribe(20 * 60, condition_on_previous_text=True) is True
+
+
+class TestTranscriberModelCache:
+    """Tests for sharing loaded models between Transcriber instances."""
+
+    def _openai_whisper_transcriber(self, **kwargs):
+        with patch.object(Transcriber, '_detect_backend', return_value=("openai-whisper", "cpu", "float32")):
+            return Transcriber(**kwargs)
+
+    def test_instances_with_same_settings_share_model(self):
+        mock_whisper = MagicMock()
+
+        with patch.dict('sys.modules', {'whisper': mock_whisper}):
+            first = self._openai_whisper_transcriber()
+            first.load_model()
+            second = self._openai_whisper_transcriber()
+            second.load_model()
+
+        mock_whisper.load_model.assert_called_once()
+        assert second.model is first.model
+
+    def test_different_settings_load_separately(self):
+        mock_whisper = MagicMock()
+
+        with patch.dict('sys.modules', {'whisper': mock_whisper}):
+            self._openai_whisper_transcriber(model_size="small").load_model()
+            self._openai_whisper_transcriber(model_size="large").load_model()
+
+        assert mock_whisper.load_model.call_count == 2
+
+    def test_unload_models_forces_reload(self):
+        mock_whisper = MagicMock()
+
+        with patch.dict('sys.modules', {'whisper': mock_whisper}):
+            self._openai_whisper_transcriber().load_model()
+            unload_models()
+            self._openai_whisper_transcriber().load_model()
+
+        assert mock_whisper.load_model.call_count == 2
+
+    def test_concurrent_first_loads_load_once(self):
+        """Two threads loading the same model at once must not load it twice."""
+        import threading
+        mock_whisper = MagicMock()
+        mock_whisper.load_model.side_effect = lambda *args, **kwargs: (time.sleep(0.05), MagicMock())[1]
+        transcribers = [self._openai_whisper_transcriber() for _ in range(2)]
+
+        with patch.dict('sys.modules', {'whisper': mock_whisper}):
+            threads = [threading.Thread(target=t.load_model) for t in transcribers]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_whisper.load_model.assert_called_once()
+        assert transcribers[0].model is transcribers[1].model
+
+
+class TestTranscriberModelDir:
+    """Tests for whisper.model_dir (persistent model weight cache)."""
+
+    def test_download_root_passed_to_openai_whisper(self):
+        transcriber = Transcriber(download_root="/models")
+        transcriber.backend = "openai-whisper"
+        mock_whisper = MagicMock()
+
+        with patch.dict('sys.modules', {'whisper': mock_whisper}):
+            transcriber.load_model()
+
+        assert mock_whisper.load_model.call_args[1]['download_root'] == "/models"
+
+    def test_download_root_passed_to_faster_whisper(self):
+        transcriber = Transcriber(download_root="~/models")
+        transcriber.backend, transcriber.device, transcriber.compute_type = "faster-whisper", "cpu", "int8"
+        mock_fw = MagicMock()
+
+        with patch.dict('sys.modules', {'faster_whisper': mock_fw}):
+            transcriber.load_model()
+
+        assert mock_fw.WhisperModel.call_args[1]['download_root'] == os.path.expanduser("~/models")
+
+    def _mlx_load(self, transcriber, snapshot_download):
+        mock_hub = MagicMock(snapshot_download=snapshot_download)
+        mock_hub_utils = MagicMock(LocalEntryNotFoundError=LookupError)
+        with patch.dict('sys.modules', {'huggingface_hub': mock_hub, 'huggingface_hub.utils': mock_hub_utils}):
+            transcriber.load_model()
+
+    def test_mlx_uses_cached_snapshot_without_hub(self):
+        """Test that a cached MLX model is resolved with local_files_only and passed to mlx-whisper as a path."""
+        transcriber = Transcriber(model_size="small", download_root="/models")
+        transcriber.backend = "mlx"
+        snapshot_download = MagicMock(return_value="/models/whisper-small-mlx")
+
+        self._mlx_load(transcriber, snapshot_download)
+
+        snapshot_download.assert_called_once_with(
+            "mlx-community/whisper-small-mlx", cache_dir="/models", local_files_only=True
+        )
+        mock_mlx = MagicMock()
+        mock_mlx.transcribe.return_value = {"segments": []}
+        with patch.dict('sys.modules', {'mlx_whisper': mock_mlx}):
+            transcriber.transcribe(np.zeros(16000, dtype=np.float32))
+        assert mock_mlx.transcribe.call_args[1]['path_or_hf_repo'] == "/models/whisper-small-mlx"
+
+    def test_mlx_downloads_when_not_cached(self):
+        transcriber = Transcriber(model_size="small")
+        transcriber.backend = "mlx"
+        snapshot_download = MagicMock(side_effect=[LookupError("not cached"), "/hf/whisper-small-mlx"])
+
+        self._mlx_load(transcriber, snapshot_download)
+
+        assert snapshot_download.call_args == (("mlx-community/whisper-small-mlx",), {'cache_dir': None})
+        assert transcriber.model == "/hf/whisper-small-mlx"
+
+
+class TestTranscriberOpenaiWhisperPrecision:
+    """Tests for float16 weights on the openai-whisper CUDA path and int8 weights on the CPU."""
+
+    def _load(self, device):
+        torch = pytest.importorskip("torch")
+        model = torch.nn.Sequential(torch.nn.Linear(4, 4), torch.nn.LayerNorm(4))
+        mock_whisper = MagicMock()
+        mock_whisper.load_model.return_value = model
+        with patch.object(Transcriber, '_detect_backend', return_value=("openai-whisper", device, "float16")):
+            transcriber = Transcriber()
+        with patch.dict('sys.modules', {'whisper': mock_whisper}):
+            transcriber.load_model()
+        return torch, model
+
+    def test_cuda_weights_are_float16_except_layernorm(self):
+        torch, model = self._load("cuda")
+
+        assert model[0].weight.dtype == torch.float16
+        assert model[1].weight.dtype == torch.float32
+
+    def test_cpu_linear_weights_are_int8(self):
+        torch, model = self._load("cpu")
+
+        assert model[0].weight().dtype == torch.qint8
+        assert model[1].weight.dtype == torch.float32
+
+    def test_cpu_quantizes_whisper_linear_subclass(self):
+        """whisper.model.Linear is a subclass, which quantize_dynamic skips by exact type."""
+        torch = pytest.importorskip("torch")
+
+        class WhisperLinear(torch.nn.Linear):
+            def forward(self, x):
+                return super().forward(x)
+
+        model = torch.nn.Sequential(WhisperLinear(4, 4))
+        x = torch.randn(2, 4)
+        expected = model(x)
+
+        Transcriber._int8_linear_weights(model)
+
+        assert model[0].weight().dtype == torch.qint8
+        assert torch.allclose(model(x), expected, atol=0.1)
+
+    def test_cpu_detection_reports_int8(self):
+        torch = pytest.importorskip("torch")
+        with patch('src.transcriber.importlib.util.find_spec', return_value=None), \
+             patch('src.transcriber.platform.system', return_value='Linux'), \
+             patch.object(torch.cuda, 'is_available', return_value=False):
+            transcriber = Transcriber()
+
+        assert (transcriber.backend, transcriber.device, transcriber.compute_type) == ("openai-whisper", "cpu", "int8")
+
+
+class TestTranscriberSplitDevice:
+    """Tests for --split-device (openai-whisper encoder on CUDA, decoder on CPU)."""
+
+    def _transcriber(self, backend="openai-whisper", device="cuda"):
+        with patch.object(Transcriber, '_detect_backend', return_value=(backend, device, "float16")):
+            return Transcriber(split_device=True)
+
+    def test_encoder_moves_to_cuda_and_decoder_stays_on_cpu(self):
+        pytest.importorskip("torch")
+        transcriber = self._transcriber()
+        mock_whisper = MagicMock()
+        model = mock_whisper.load_model.return_value
+        model.transcribe.return_value = {"segments": []}
+
+        with patch.dict('sys.modules', {'whisper': mock_whisper}):
+            transcriber.transcribe(np.zeros(16000, dtype=np.float32))
+
+        assert mock_whisper.load_model.call_args[1]['device'] == "cpu"
+        model.encoder.to.assert_called_once_with("cuda")
+        model.decoder.to.assert_not_called()
+        # The CPU decoder can't run in float16
+        assert model.transcribe.call_args[1]['fp16'] is False
+
+    def test_encoder_returns_float32_features_on_cpu(self):
+        torch = pytest.importorskip("torch")
+        transcriber = self._transcriber()
+        transcriber.model = MagicMock()
+        features = MagicMock()
+        transcriber.model.encoder.forward.return_value = features
+
+        transcriber._encoder_on_gpu()
+        mel = MagicMock()
+        result = transcriber.model.encoder.forward(mel)
+
+        mel.to.assert_called_once_with("cuda", torch.float16)
+        assert result is features.float.return_value.cpu.return_value
+
+    @pytest.mark.parametrize("backend, device", [("openai-whisper", "cpu"), ("faster-whisper", "cuda")])
+    def test_split_device_needs_openai_whisper_on_cuda(self, backend, device):
+        assert self._transcriber(backend, device).split_device is False
+
+
+class TestTranscriberCompile:
+    """Tests for --compile (torch.compile on the openai-whisper encoder)."""
+
+    def _load(self, transcriber, compiled_encoder):
+        # Imported before patch.dict so torch isn't dropped from sys.modules afterwards
+        pytest.importorskip("torch")
+        mock_model = MagicMock()
+        mock_model.dims.n_mels = 80
+        eager_encoder = mock_model.encoder
+        mock_whisper = MagicMock()
+        mock_whisper.load_model.return_value = mock_model
+        mock_audio = MagicMock(N_FRAMES=3000)
+
+        with patch.dict('sys.modules', {'whisper': mock_whisper, 'whisper.audio': mock_audio}), \
+                patch('torch.compile', return_value=compiled_encoder) as mock_compile:
+            transcriber.load_model()
+        return mock_model, eager_encoder, mock_compile
+
+    def _openai_whisper_transcriber(self, **kwargs):
+        with patch.object(Transcriber, '_detect_backend', return_value=("openai-whisper", "cpu", "float32")):
+            return Transcriber(**kwargs)
+
+    def test_compile_wraps_encoder_and_warms_up(self):
+        """Test that the encoder is compiled and run once while the model loads."""
+        transcriber = self._openai_whisper_transcriber(use_compile=True)
+        compiled_encoder = MagicMock()
+
+        model, eager_encoder, mock_compile = self._load(transcriber, compiled_encoder)
+
+        assert mock_compile.call_args[0][0] is eager_encoder
+        assert model.encoder is compiled_encoder
+        mel = compiled_encoder.call_args[0][0]
+        assert tuple(mel.shape) == (1, 80, 3000)
+        assert transcriber.use_compile is True
+
+    def test_compile_failure_falls_back_to_eager(self):
+        """Test that a compile error during warmup restores the eager encoder."""
+        transcriber = self._openai_whisper_transcriber(use_compile=True)
+        compiled_encoder = MagicMock(side_effect=RuntimeError("Cannot find a working triton installation"))
+
+        model, eager_encoder, _ = self._load(transcriber, compiled_encoder)
+
+        assert model.encoder is eager_encoder
+        assert transcriber.use_compile is False
+
+    def test_no_compile_by_default(self):
+        transcriber = self._openai_whisper_transcriber()
+
+        _, _, mock_compile = self._load(transcriber, MagicMock())
+
+        mock_compile.assert_not_called()
+
+    def test_compile_ignored_by_other_backends(self):
+        with patch.object(Transcriber, '_detect_backend', return_value=("faster-whisper", "cpu", "int8")):
+            transcriber = Transcriber(use_compile=True)
+
+        assert transcriber.use_compile is False
+
+
 class TestTranscriberVAD:
     """Tests for VAD (Voice Activity Detection) support."""
 
@@ -235,6 +764,19 @@ class TestTranscriberVAD:
         assert transcriber.use_stable is True
         assert transcriber.use_vad is True
 
+    @pytest.mark.parametrize("onnxruntime_installed, expected", [(True, {"onnx": True}), (False, True)])
+    def test_stable_ts_vad_uses_onnx_when_available(self, onnxruntime_installed, expected):
+        """Test that stable-ts runs Silero VAD through ONNX Runtime when it is installed."""
+        transcriber = Transcriber()
+        transcriber.backend, transcriber.use_vad = "stable-ts", True
+        transcriber.model = MagicMock()
+        transcriber.model.transcribe.return_value = MagicMock(segments=[])
+
+        with patch('src.transcriber.importlib.util.find_spec', return_value=object() if onnxruntime_installed else None):
+            transcriber.transcribe(np.zeros(16000, dtype=np.float32))
+
+        assert transcriber.model.transcribe.call_args[1]['vad'] == expected
+
     def test_stable_without_vad_works(self):
         """Test that --stable without --vad works (VAD off by default)."""
         try:
@@ -0,0 +1,220 @@
+import os
+import tempfile
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import transcriber_daemon
+
+
+@pytest.fixture
+def socket_path():
+    # A short directory: AF_UNIX paths are limited to ~100 characters
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield os.path.join(tmpdir, "d.sock")
+
+
+@pytest.fixture
+def fake_transcriber_cls():
+    def make(**options):
+        transcriber = MagicMock()
+        transcriber.backend = "faster-whisper"
+        transcriber.device = "cpu"
+        transcriber.compute_type = options.get('compute_type') or "int8"
+        transcriber.transcribe.return_value = [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}]
+        return transcriber
+
+    with patch('src.transcriber_daemon.Transcriber', side_effect=make) as mock_cls:
+        yield mock_cls
+
+
+@pytest.fixture
+def daemon(socket_path, fake_transcriber_cls):
+    """Run serve() in a thread and stop it after the test."""
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=transcriber_daemon.serve, args=(socket_path,), kwargs={'on_ready': ready.set}, daemon=True
+    )
+    thread.start()
+    assert ready.wait(5)
+    yield thread
+    transcriber_daemon.stop(socket_path)
+    thread.join(5)
+
+
+OPTIONS = {'model_size': 'tiny', 'use_stable': False, 'use_vad': False, 'compute_type': None}
+
+
+class TestTranscriberDaemon:
+    def test_not_running_without_daemon(self, socket_path):
+        """No socket means no daemon, and transcribe() reports None for a local fallback."""
+        assert transcriber_daemon.is_running(socket_path) is False
+        assert transcriber_daemon.transcribe("a.wav", None, OPTIONS, socket_path) is None
+
+    def test_running_daemon_answers_ping(self, socket_path, daemon):
+        assert transcriber_daemon.is_running(socket_path) is True
+
+    def test_socket_is_owner_only(self, socket_path, daemon):
+        assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+    def test_transcribe_returns_segments_and_backend(self, socket_path, daemon):
+        reply = transcriber_daemon.transcribe("a.wav", "en", OPTIONS, socket_path)
+
+        assert reply['segments'] == [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}]
+        assert reply['backend'] == "faster-whisper"
+        assert reply['device'] == "cpu"
+        assert reply['compute_type'] == "int8"
+
+    def test_model_is_kept_between_requests(self, socket_path, daemon, fake_transcriber_cls):
+        """Repeated requests with the same options reuse the loaded model."""
+        transcriber_daemon.transcribe("a.wav", "en", OPTIONS, socket_path)
+        transcriber_daemon.transcribe("b.wav", "en", OPTIONS, socket_path)
+
+        assert fake_transcriber_cls.call_count == 1
+
+    def test_different_options_reload_model(self, socket_path, daemon, fake_transcriber_cls):
+        transcriber_daemon.transcribe("a.wav", "en", OPTIONS, socket_path)
+        transcriber_daemon.transcribe("a.wav", "en", {**OPTIONS, 'model_size': 'large'}, socket_path)
+
+        assert fake_transcriber_cls.call_count == 2
+        fake_transcriber_cls.assert_called_with(**{**OPTIONS, 'model_size': 'large'})
+
+    def test_decode_options_keep_model(self, socket_path, daemon, fake_transcriber_cls):
+        """Options that don't pick the model apply to the loaded one instead of reloading it."""
+        created = []
+        make = fake_transcriber_cls.side_effect
+        fake_transcriber_cls.side_effect = lambda **options: created.append(make(**options)) or created[-1]
+
+        transcriber_daemon.transcribe("a.wav", "en", {**OPTIONS, 'use_stable': True}, socket_path)
+        transcriber_daemon.transcribe(
+            "a.wav", "en",
+            {**OPTIONS, 'use_stable': True, 'use_vad': True, 'condition_on_previous_text': False},
+            socket_path,
+        )
+
+        assert fake_transcriber_cls.call_count == 1
+        assert created[0].use_vad is True
+        assert created[0].condition_on_previous_text is False
+
+    def test_daemon_error_is_raised(self, socket_path, daemon, fake_transcriber_cls):
+        """A failure inside the daemon raises in the client, and the daemon keeps serving."""
+        fake_transcriber_cls.side_effect = RuntimeError("CUDA out of memory")
+
+        with pytest.raises(Exception, match="CUDA out of memory"):
+            transcriber_daemon.transcribe("a.wav", "en", OPTIONS, socket_path)
+        assert transcriber_daemon.is_running(socket_path) is True
+
+    def test_stop_ends_serve(self, socket_path, daemon):
+        assert transcriber_daemon.stop(socket_path) is True
+        daemon.join(5)
+
+        assert not daemon.is_alive()
+        assert not os.path.exists(socket_path)
+
+    def test_authkey_file_is_owner_only(self, socket_path, daemon):
+        key_path = os.path.join(os.path.dirname(socket_path), 'authkey')
+
+        assert os.stat(key_path).st_mode & 0o777 == 0o600
+        assert len(open(key_path, 'rb').read()) == 32
+
+    def test_listener_with_unknown_key_is_not_trusted(self, socket_path):
+        """A socket planted by someone without the key is treated as no daemon."""
+        from multiprocessing.connection import Listener
+
+        with open(os.path.join(os.path.dirname(socket_path), 'authkey'), 'wb') as f:
+            f.write(b'client key')
+        listener = Listener(socket_path, family='AF_UNIX', authkey=b'attacker key')
+
+        def accept():
+            try:
+                listener.accept()
+            except Exception:
+                pass  # The handshake fails on this side too
+
+        accepting = threading.Thread(target=accept, daemon=True)
+        accepting.start()
+        try:
+            assert transcriber_daemon.is_running(socket_path) is False
+        finally:
+            accepting.join(5)
+            listener.close()
+
+    def test_shared_directory_is_refused(self, socket_path, fake_transcriber_cls):
+        """Neither side uses a socket directory other users can write to."""
+        os.chmod(os.path.dirname(socket_path), 0o777)
+
+        assert transcriber_daemon.is_running(socket_path) is False
+        with pytest.raises(PermissionError):
+            transcriber_daemon.serve(socket_path)
+
+    def test_unsupported_platform_reports_no_daemon(self, socket_path):
+        with patch.object(transcriber_daemon, 'SUPPORTED', False):
+            assert transcriber_daemon.is_running(socket_path) is False
+            with pytest.raises(RuntimeError):
+                transcriber_daemon.serve(socket_path)
+
+    def test_default_socket_lives_in_private_runtime_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+
+        path = transcriber_daemon.socket_path()
+
+        directory = os.path.dirname(path)
+        assert directory == str(tmp_path / f"whisper-subtitle-{os.getuid()}")
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+
+    def test_stale_socket_is_replaced(self, socket_path, fake_transcriber_cls):
+        """A socket file left by a killed daemon does not block a new one."""
+        open(socket_path, 'w').close()
+        ready = threading.Event()
+        thread = threading.Thread(
+            target=transcriber_daemon.serve, args=(socket_path,), kwargs={'on_ready': ready.set}, daemon=True
+        )
+        thread.start()
+
+        assert ready.wait(5)
+        assert transcriber_daemon.is_running(socket_path) is True
+        transcriber_daemon.stop(socket_path)
+        thread.join(5)
+
+    def test_second_daemon_refuses_to_start(self, socket_path, daemon):
+        """A second serve() on a live socket fails instead of cutting off the first daemon."""
+        errors = []
+
+        def serve_again():
+            try:
+                transcriber_daemon.serve(socket_path)
+            except Exception as e:
+                errors.append(e)
+
+        second = threading.Thread(target=serve_again, daemon=True)
+        second.start()
+        second.join(5)
+
+        assert not second.is_alive()
+        assert [type(e) for e in errors] == [FileExistsError]
+        assert transcriber_daemon.is_running(socket_path) is True
+        assert transcriber_daemon.stop(socket_path) is True
+        daemon.join(5)
+        assert not daemon.is_alive()
+
+    def test_daemon_closing_without_reply_falls_back(self, socket_path):
+        """A daemon that goes away mid-request reports None, so the caller transcribes locally."""
+        from multiprocessing.connection import Listener
+
+        authkey = b'shared key'
+        with open(os.path.join(os.path.dirname(socket_path), 'authkey'), 'wb') as f:
+            f.write(authkey)
+        listener = Listener(socket_path, family='AF_UNIX', authkey=authkey)
+
+        def accept_and_hang_up():
+            with listener.accept() as conn:
+                conn.recv()
+
+        serving = threading.Thread(target=accept_and_hang_up, daemon=True)
+        serving.start()
+        try:
+            assert transcriber_daemon.transcribe("a.wav", None, OPTIONS, socket_path) is None
+        finally:
+            serving.join(5)
+            listener.close()
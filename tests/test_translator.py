@@ -1,10 +1,33 @@
 import pytest
 import json
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock
 
-from src.translator import OllamaTranslator, load_config, get_language_code, get_language_name, parse_language
+from src.translator import (
+    OllamaTranslator, TransientTranslationError, load_config, get_language_code, get_language_name, get_prompt_language,
+    needs_translation, parse_language
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """load_config is cached per process; tests swap config files underneath it."""
+    load_config.cache_clear()
+    yield
+    load_config.cache_clear()
+
+
+def ollama_response(text):
+    """Build a mock streaming /api/generate response that yields text line by line."""
+    response = Mock()
+    response.iter_lines.return_value = [
+        json.dumps({'response': part, 'done': False}).encode()
+        for part in text.splitlines(keepends=True)
+    ] + [json.dumps({'response': '', 'done': True}).encode()]
+    return response
 
 
 class TestGetLanguageCode:
@@ -238,6 +261,31 @@ class TestOllamaTranslator:
         translator2 = OllamaTranslator(model='llama3:8b', base_url='http://localhost:11434', batch_size=50)
         assert translator2._is_translategemma() is False
 
+    def test_batch_prompt_header_built_once_per_language_pair(self):
+        """The instruction header is reused across batches of the same language pair."""
+        translator = OllamaTranslator(model='translategemma:4b', base_url='http://localhost:11434')
+
+        with patch('src.translator.get_prompt_language', side_effect=lambda lang: lang) as mock_prompt_language:
+            first = translator._build_batch_prompt(['Hello'], 'English', 'Korean')
+            second = translator._build_batch_prompt(['World'], 'English', 'Korean')
+            translator._build_batch_prompt(['Hello'], 'Korean', 'English')
+
+        assert first.replace('Hello', 'World') == second
+        assert mock_prompt_language.call_count == 4  # Two per language pair
+
+    def test_translategemma_prompt_built_once_per_language_pair(self):
+        """Single-line prompts reuse the instructions; only the text changes."""
+        translator = OllamaTranslator(model='translategemma:4b', base_url='http://localhost:11434')
+
+        with patch('src.translator.get_prompt_language', side_effect=lambda lang: lang) as mock_prompt_language:
+            first = translator._build_translategemma_prompt('Hello', 'English', 'Korean')
+            second = translator._build_translategemma_prompt('World', 'English', 'Korean')
+            delimited = translator._build_translategemma_prompt('A || B', 'English', 'Korean', has_delimiter=True)
+
+        assert first.replace('Hello', 'World') == second
+        assert 'delimiters' in delimited and 'delimiters' not in first
+        assert mock_prompt_language.call_count == 4  # Two per (pair, has_delimiter)
+
     def test_translategemma_prompt_format(self):
         """Test that TranslateGemma uses the correct prompt format."""
         translator = OllamaTranslator(model='translategemma:4b', base_url='http://localhost:11434', batch_size=50)
@@ -263,12 +311,10 @@ class TestOllamaTranslator:
         """Test that multi-line text is translated with linebreaks preserved."""
         translator = OllamaTranslator(model='test-model', base_url='http://localhost:11434', batch_size=50)
 
-        mock_response = Mock()
         # LLM returns translation with delimiter preserved
-        mock_response.json.return_value = {'response': '你好 || 世界'}
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('你好 || 世界')
 
-        with patch('src.translator.requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             result = translator.translate_text(
                 'Hello\nWorld',
                 'English',
@@ -280,11 +326,9 @@ class TestOllamaTranslator:
 
     def test_translate_text_success(self, translator):
         """Test successful text translation."""
-        mock_response = Mock()
-        mock_response.json.return_value = {'response': '你好，世界！'}
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('你好，世界！')
 
-        with patch('src.translator.requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             result = translator.translate_text(
                 'Hello, world!',
                 'English',
@@ -293,13 +337,20 @@ class TestOllamaTranslator:
 
         assert result == '你好，世界！'
 
+    def test_translate_text_reuses_translation_of_repeated_line(self, translator):
+        """A repeated line is answered from the memo instead of Ollama."""
+        with patch('requests.Session.post', return_value=ollama_response('音乐')) as mock_post:
+            first = translator.translate_text('[Music]', 'English', 'Chinese')
+            second = translator.translate_text('[Music]', 'English', 'Chinese')
+
+        assert first == second == '音乐'
+        mock_post.assert_called_once()
+
     def test_translate_text_strips_whitespace(self, translator):
         """Test that translated text is stripped of whitespace."""
-        mock_response = Mock()
-        mock_response.json.return_value = {'response': '  你好，世界！  \n'}
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('  你好，世界！  \n')
 
-        with patch('src.translator.requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             result = translator.translate_text(
                 'Hello, world!',
                 'English',
@@ -312,7 +363,7 @@ class TestOllamaTranslator:
         """Test handling of connection errors."""
         import requests as req
 
-        with patch('src.translator.requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.side_effect = req.exceptions.ConnectionError()
 
             with pytest.raises(ConnectionError) as exc_info:
@@ -324,7 +375,7 @@ class TestOllamaTranslator:
         """Test handling of timeout errors."""
         import requests as req
 
-        with patch('src.translator.requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.side_effect = req.exceptions.Timeout()
 
             with pytest.raises(RuntimeError) as exc_info:
@@ -342,7 +393,7 @@ class TestOllamaTranslator:
 
         http_error = req.exceptions.HTTPError(response=mock_response)
 
-        with patch('src.translator.requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.return_value.raise_for_status.side_effect = http_error
 
             with pytest.raises(RuntimeError) as exc_info:
@@ -356,12 +407,82 @@ class TestOllamaTranslator:
         result = translator.translate_segments([], 'English', 'Chinese')
         assert result == []
 
+    def test_connection_pool_fits_concurrency(self):
+        """Parallel batches each keep a pooled keep-alive connection to Ollama."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434', concurrency=4)
+
+        adapter = translator._session.get_adapter('http://localhost:11434/api/generate')
+
+        assert adapter._pool_maxsize == 4
+
+    def test_translators_reuse_session(self):
+        """Translators with the same pool settings share one session."""
+        first = OllamaTranslator(model='a', base_url='http://localhost:11434', concurrency=2)
+        second = OllamaTranslator(model='b', base_url='http://127.0.0.1:11434', concurrency=2)
+        other = OllamaTranslator(model='a', base_url='http://localhost:11434', concurrency=3)
+
+        assert first._session is second._session
+        assert other._session is not first._session
+
+    @pytest.mark.parametrize("base_url, encoding", [
+        ('http://localhost:11434', 'identity'),
+        ('http://127.0.0.1:11434', 'identity'),
+        ('http://[::1]:11434', 'identity'),
+        ('http://gpu-box:11434', 'gzip, deflate'),
+    ])
+    def test_local_ollama_skips_compression(self, base_url, encoding):
+        """Responses from a local Ollama are requested uncompressed."""
+        translator = OllamaTranslator(model='test', base_url=base_url)
+
+        assert translator._session.headers['Accept-Encoding'].startswith(encoding)
+
+    def test_requests_share_one_session(self, translator):
+        """Connection check and generate calls go through the translator's session."""
+        with patch.object(translator._session, 'get', return_value=Mock(status_code=200)) as mock_get, \
+             patch.object(translator._session, 'post', return_value=ollama_response('Hola')) as mock_post:
+            translator.check_connection()
+            translator.translate_text('Hello', 'English', 'Spanish')
+
+        mock_get.assert_called_once()
+        mock_post.assert_called_once()
+
+    def test_warm_up_loads_model_with_empty_prompt(self, translator):
+        """warm_up asks Ollama to load the model without generating."""
+        with patch('requests.Session.post') as mock_post:
+            translator.warm_up()
+            translator._warmup.join(5)
+
+        payload = json.loads(mock_post.call_args[1]['data'])
+        assert payload['model'] == 'test-model'
+        assert payload['prompt'] == ''
+        assert payload['keep_alive'] == translator.keep_alive
+
+    def test_translate_segments_waits_for_warm_up(self, translator):
+        """The first batch is sent only after the model has loaded."""
+        calls = []
+        loaded = threading.Event()
+
+        def post(url, **kwargs):
+            if json.loads(kwargs['data'])['prompt'] == '':
+                loaded.wait(5)
+                calls.append('load')
+                return Mock()
+            calls.append('generate')
+            return ollama_response('1. Hola')
+
+        with patch('requests.Session.post', side_effect=post):
+            translator.warm_up()
+            threading.Timer(0.05, loaded.set).start()
+            translator.translate_segments([{'start': 0.0, 'end': 1.0, 'text': 'Hello'}], 'English', 'Spanish')
+
+        assert calls == ['load', 'generate']
+
     def test_check_connection_success(self, translator):
         """Test successful connection check."""
         mock_response = Mock()
         mock_response.status_code = 200
 
-        with patch('src.translator.requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = translator.check_connection()
 
         assert result is True
@@ -370,7 +491,7 @@ class TestOllamaTranslator:
         """Test failed connection check."""
         import requests as req
 
-        with patch('src.translator.requests.get') as mock_get:
+        with patch('requests.Session.get') as mock_get:
             mock_get.side_effect = req.exceptions.ConnectionError()
             result = translator.check_connection()
 
@@ -381,30 +502,203 @@ class TestOllamaTranslator:
         mock_response = Mock()
         mock_response.status_code = 500
 
-        with patch('src.translator.requests.get', return_value=mock_response):
+        with patch('requests.Session.get', return_value=mock_response):
             result = translator.check_connection()
 
         assert result is False
 
     def test_translate_text_sends_correct_prompt(self, translator):
         """Test that the correct prompt is sent to Ollama."""
-        mock_response = Mock()
-        mock_response.json.return_value = {'response': 'translated'}
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('translated')
 
-        with patch('src.translator.requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             translator.translate_text('Hello', 'English', 'Spanish')
 
             # Verify the call
             call_args = mock_post.call_args
             assert call_args[0][0] == 'http://localhost:11434/api/generate'
 
-            json_data = call_args[1]['json']
+            json_data = json.loads(call_args[1]['data'])
             assert json_data['model'] == 'test-model'
             assert 'English' in json_data['prompt']
             assert 'Spanish' in json_data['prompt']
             assert 'Hello' in json_data['prompt']
-            assert json_data['stream'] is False
+            assert json_data['stream'] is True
+            assert call_args[1]['stream'] is True
+
+
+class TestStreaming:
+    """Tests for streamed Ollama responses."""
+
+    @pytest.fixture
+    def translator(self):
+        return OllamaTranslator(model='test-model', base_url='http://localhost:11434', batch_size=3)
+
+    def test_call_ollama_joins_streamed_chunks(self, translator):
+        """Streamed fragments are concatenated into the full response."""
+        mock_response = Mock()
+        mock_response.iter_lines.return_value = [
+            b'{"response": "1. Hel", "done": false}',
+            b'',
+            b'{"response": "lo\\n2. ok", "done": false}',
+            b'{"response": "", "done": true}',
+        ]
+
+        with patch('requests.Session.post', return_value=mock_response):
+            result = translator._call_ollama('prompt')
+
+        assert result == '1. Hello\n2. ok'
+        mock_response.close.assert_called_once()
+
+    def test_call_ollama_reports_fragments(self, translator):
+        """on_text receives each fragment as it arrives."""
+        fragments = []
+
+        with patch('requests.Session.post', return_value=ollama_response('1. A\n2. B')):
+            translator._call_ollama('prompt', on_text=fragments.append)
+
+        assert fragments == ['1. A\n', '2. B']
+
+    def test_call_ollama_error_chunk_raises(self, translator):
+        """An error object in the stream is surfaced as RuntimeError."""
+        mock_response = Mock()
+        mock_response.iter_lines.return_value = [b'{"error": "model crashed"}']
+
+        with patch('requests.Session.post', return_value=mock_response):
+            with pytest.raises(RuntimeError, match='model crashed'):
+                translator._call_ollama('prompt')
+
+    def test_call_ollama_read_timeout_mid_stream(self, translator):
+        """A read timeout while streaming is reported as a timeout, not a connection failure."""
+        import requests as req
+        from urllib3.exceptions import ReadTimeoutError
+
+        mock_response = Mock()
+        mock_response.iter_lines.side_effect = req.exceptions.ConnectionError(
+            ReadTimeoutError(None, None, 'Read timed out.')
+        )
+
+        with patch('requests.Session.post', return_value=mock_response):
+            with pytest.raises(RuntimeError, match='timed out'):
+                translator._call_ollama('prompt')
+
+    def test_progress_reported_per_streamed_line(self, translator):
+        """Progress advances as numbered lines stream in, ending at the batch size."""
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': 'One'},
+            {'start': 1.0, 'end': 2.0, 'text': 'Two'},
+            {'start': 2.0, 'end': 3.0, 'text': 'Three'},
+        ]
+        progress_calls = []
+
+        with patch('requests.Session.post', return_value=ollama_response('1. A\n2. B\n3. C')):
+            translator.translate_segments(
+                segments, 'English', 'Chinese',
+                progress_callback=lambda current, total: progress_calls.append((current, total))
+            )
+
+        assert progress_calls == [(1, 3), (2, 3), (3, 3)]
+
+    def test_progress_counts_only_new_numbered_lines(self, translator):
+        """Preambles, blank lines and repeated numbers don't advance progress."""
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': 'One'},
+            {'start': 1.0, 'end': 2.0, 'text': 'Two'},
+            {'start': 2.0, 'end': 3.0, 'text': 'Three'},
+        ]
+        lines = []
+        response = 'Here are the translations:\n\n1. A\n1. A\n2. B\n3. C'
+
+        with patch('requests.Session.post', return_value=ollama_response(response)):
+            translator._try_translate_batch(segments, 'English', 'Chinese', on_line=lines.append)
+
+        assert lines == [0, 1]  # Line 3 has no trailing newline; the caller reports it on success
+
+    def test_progress_never_goes_backwards_across_splits(self, translator):
+        """Lines streamed before a failed parse are not counted again by the split halves."""
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': 'One'},
+            {'start': 1.0, 'end': 2.0, 'text': 'Two'},
+            {'start': 2.0, 'end': 3.0, 'text': 'Three'},
+        ]
+        responses = [
+            ollama_response('1. A\n2. B\nThat is all.'),  # Line 3 missing: split in half
+            ollama_response('1. A'),
+            ollama_response('1. B\n2. C'),
+        ]
+        progress_calls = []
+
+        with patch('requests.Session.post', side_effect=responses):
+            translator.translate_segments(
+                segments, 'English', 'Chinese',
+                progress_callback=lambda current, total: progress_calls.append((current, total))
+            )
+
+        currents = [current for current, _ in progress_calls]
+        assert currents == sorted(currents)
+        assert currents[-1] == 3
+        assert {total for _, total in progress_calls} == {3}
+
+    def test_stream_closed_once_all_lines_arrived(self, translator):
+        """Text generated after the last numbered line is not waited for."""
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': 'One'},
+            {'start': 1.0, 'end': 2.0, 'text': 'Two'},
+        ]
+        mock_response = ollama_response('1. A\n2. B\nNote: kept the tone informal.\n4. extra')
+        chunks = list(mock_response.iter_lines.return_value)
+        chunks_read = []
+        mock_response.iter_lines.return_value = (chunks_read.append(chunk) or chunk for chunk in chunks)
+
+        with patch('requests.Session.post', return_value=mock_response):
+            result = translator._try_translate_batch(segments, 'English', 'Chinese')
+
+        assert [seg['text'] for seg in result] == ['A', 'B']
+        assert len(chunks_read) == 3  # Stopped at the first fragment after "2. B\n"
+        mock_response.close.assert_called_once()
+
+    def test_trailing_newline_does_not_stop_stream(self, translator):
+        """A final newline after the last line is read normally, so the connection can be reused."""
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'One'}]
+        mock_response = ollama_response('1. A\n\n')
+        chunks = list(mock_response.iter_lines.return_value)
+        chunks_read = []
+        mock_response.iter_lines.return_value = (chunks_read.append(chunk) or chunk for chunk in chunks)
+
+        with patch('requests.Session.post', return_value=mock_response):
+            result = translator._try_translate_batch(segments, 'English', 'Chinese')
+
+        assert [seg['text'] for seg in result] == ['A']
+        assert chunks_read == chunks
+
+    def test_stream_chunks_parsed_with_orjson_when_installed(self):
+        """Streamed chunks go through orjson if it is available."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        mock_orjson = Mock()
+        mock_orjson.loads.side_effect = json.loads
+
+        with patch('src.translator.orjson', mock_orjson), \
+             patch('requests.Session.post', return_value=ollama_response("Hola")):
+            result = translator._call_ollama("prompt")
+
+        assert result == "Hola"
+        assert mock_orjson.loads.called
+
+    def test_request_body_serialized_with_orjson_when_installed(self):
+        """The generate request body is encoded by orjson if it is available, as UTF-8 JSON."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        mock_orjson = Mock()
+        mock_orjson.loads.side_effect = json.loads
+        mock_orjson.dumps.side_effect = lambda obj: json.dumps(obj, ensure_ascii=False).encode()
+
+        with patch('src.translator.orjson', mock_orjson), \
+             patch('requests.Session.post', return_value=ollama_response("Hola")) as mock_post:
+            translator._call_ollama("翻譯")
+
+        body = mock_post.call_args[1]['data']
+        assert json.loads(body)['prompt'] == "翻譯"
+        assert mock_orjson.dumps.called
+        assert translator._session.headers['Content-Type'] == 'application/json'
 
 
 class TestBatchTranslation:
@@ -455,6 +749,13 @@ class TestBatchTranslation:
 
         assert result == ['你好', '世界', '测试']
 
+    def test_parse_batch_response_without_space_after_number(self, translator):
+        """Test that lines like "2.text" still parse through the regex fallback."""
+        response = "1. 你好\n2.世界\n3. 1. 测试"
+        result = translator._parse_batch_response(response, 3)
+
+        assert result == ['你好', '世界', '1. 测试']
+
     def test_parse_batch_response_missing_line(self, translator):
         """Test parsing returns None when a line is missing."""
         response = """1. 你好
@@ -471,15 +772,18 @@ class TestBatchTranslation:
 
         assert result is None
 
+    def test_parse_batch_response_ignores_numbers_outside_batch(self, translator):
+        """Test that extra numbered lines (e.g. a model continuing the list) are dropped."""
+        response = "0. intro\n1. 你好\n2. 世界\n3. 多余"
+        result = translator._parse_batch_response(response, 2)
+
+        assert result == ['你好', '世界']
+
     def test_try_translate_batch_success(self, translator, sample_segments):
         """Test successful batch translation."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'response': '1. 你好，世界！\n2. 这是一个测试。\n3. 测试翻译。'
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('1. 你好，世界！\n2. 这是一个测试。\n3. 测试翻译。')
 
-        with patch('src.translator.requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             result = translator._try_translate_batch(sample_segments, 'English', 'Chinese')
 
         assert result is not None
@@ -488,15 +792,20 @@ class TestBatchTranslation:
         assert result[1]['text'] == '这是一个测试。'
         assert result[2]['text'] == '测试翻译。'
 
+    def test_try_translate_batch_restores_linebreaks(self, translator, sample_segments):
+        """Delimiters in translated lines become newlines again."""
+        mock_response = ollama_response('1. 你好 || 世界\n2. 这是一个测试。\n3. 测试 || 翻译')
+
+        with patch('requests.Session.post', return_value=mock_response):
+            result = translator._try_translate_batch(sample_segments, 'English', 'Chinese')
+
+        assert [seg['text'] for seg in result] == ['你好\n世界', '这是一个测试。', '测试\n翻译']
+
     def test_try_translate_batch_preserves_timestamps(self, translator, sample_segments):
         """Test that batch translation preserves timestamps."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'response': '1. Translation 1\n2. Translation 2\n3. Translation 3'
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('1. Translation 1\n2. Translation 2\n3. Translation 3')
 
-        with patch('src.translator.requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             result = translator._try_translate_batch(sample_segments, 'English', 'Chinese')
 
         assert result[0]['start'] == 0.0
@@ -508,13 +817,9 @@ class TestBatchTranslation:
 
     def test_try_translate_batch_returns_none_on_parse_failure(self, translator, sample_segments):
         """Test that batch translation returns None when parsing fails."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'response': 'Invalid response without numbers'
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('Invalid response without numbers')
 
-        with patch('src.translator.requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             result = translator._try_translate_batch(sample_segments, 'English', 'Chinese')
 
         assert result is None
@@ -523,7 +828,7 @@ class TestBatchTranslation:
         """Test that batch translation raises ConnectionError on connection error."""
         import requests as req
 
-        with patch('src.translator.requests.post') as mock_post:
+        with patch('requests.Session.post') as mock_post:
             mock_post.side_effect = req.exceptions.ConnectionError()
 
             with pytest.raises(ConnectionError):
@@ -531,13 +836,9 @@ class TestBatchTranslation:
 
     def test_translate_batch_recursive_success(self, translator, sample_segments):
         """Test recursive batch translation succeeds on first try."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'response': '1. Translation 1\n2. Translation 2\n3. Translation 3'
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('1. Translation 1\n2. Translation 2\n3. Translation 3')
 
-        with patch('src.translator.requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             result = translator._translate_batch_recursive(
                 sample_segments, 'English', 'Chinese', total_segments=3
             )
@@ -551,7 +852,7 @@ class TestBatchTranslation:
         """Test recursive batch splits in half when batch fails."""
         call_count = [0]
 
-        def mock_try_batch(segments, src, tgt, context=None):
+        def mock_try_batch(segments, src, tgt, context=None, on_line=None):
             call_count[0] += 1
             if len(segments) == 3:
                 return None  # Fail for full batch
@@ -572,6 +873,29 @@ class TestBatchTranslation:
         # Verify splitting happened (more than 1 call)
         assert call_count[0] > 1
 
+    def test_translate_batch_recursive_split_order_and_progress(self, translator):
+        """Halves are tried left first, results keep input order and progress only moves forward."""
+        segments = [{'start': float(i), 'end': i + 1.0, 'text': f'Line {i}'} for i in range(5)]
+        spans = []
+        progress_calls = []
+
+        def mock_try_batch(batch, src, tgt, context=None, on_line=None):
+            spans.append([seg['text'][-1] for seg in batch])
+            if len(batch) > 2 or batch[0]['text'] == 'Line 3':
+                return None  # Batches over 2 lines fail, and so does any batch starting at Line 3
+            return [{'start': seg['start'], 'end': seg['end'], 'text': f"T{seg['text'][-1]}"} for seg in batch]
+
+        with patch.object(translator, '_try_translate_batch', side_effect=mock_try_batch), \
+             patch.object(translator, 'translate_text', return_value='T3'):
+            result = translator._translate_batch_recursive(
+                segments, 'English', 'Chinese', total_segments=5,
+                progress_callback=lambda current, total: progress_calls.append(current)
+            )
+
+        assert spans == [['0', '1', '2', '3', '4'], ['0', '1'], ['2', '3', '4'], ['2'], ['3', '4'], ['3'], ['4']]
+        assert [seg['text'] for seg in result] == ['T0', 'T1', 'T2', 'T3', 'T4']
+        assert progress_calls == [2, 3, 4, 5]
+
     def test_translate_batch_recursive_falls_back_to_single(self, translator):
         """Test recursive batch falls back to single translation when batch size is 1."""
         single_segment = [{'start': 0.0, 'end': 2.5, 'text': 'Hello'}]
@@ -604,13 +928,9 @@ class TestBatchTranslation:
 
     def test_translate_segments_uses_batching(self, translator, sample_segments):
         """Test that translate_segments uses batch processing."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'response': '1. T1\n2. T2\n3. T3'
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('1. T1\n2. T2\n3. T3')
 
-        with patch('src.translator.requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             result = translator.translate_segments(sample_segments, 'English', 'Chinese')
 
         # Should have made one batch call (batch_size=3, segments=3)
@@ -628,7 +948,7 @@ class TestBatchTranslation:
 
         call_count = [0]
 
-        def mock_try_batch(segs, src, tgt, context=None):
+        def mock_try_batch(segs, src, tgt, context=None, on_line=None):
             call_count[0] += 1
             return [
                 {'start': s['start'], 'end': s['end'], 'text': f"T{i+1}"}
@@ -642,6 +962,42 @@ class TestBatchTranslation:
         assert call_count[0] == 2
         assert len(result) == 3
 
+    def test_translate_segments_balances_batch_sizes(self):
+        """Test that segments are spread evenly instead of leaving a tiny last batch."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434', batch_size=4)
+        segments = [{'start': float(i), 'end': float(i + 1), 'text': f'Line {i}'} for i in range(5)]
+        batch_sizes = []
+
+        def mock_try_batch(segs, src, tgt, context=None, on_line=None):
+            batch_sizes.append(len(segs))
+            return [{'start': s['start'], 'end': s['end'], 'text': 'T'} for s in segs]
+
+        with patch.object(translator, '_try_translate_batch', side_effect=mock_try_batch):
+            result = translator.translate_segments(segments, 'English', 'Chinese')
+
+        # 5 lines with batch_size=4: two requests either way, but 3+2 rather than 4+1
+        assert batch_sizes == [3, 2]
+        assert len(result) == 5
+
+    def test_translate_segments_closes_batch_at_char_budget(self):
+        """A batch ends early when the next line would exceed max_batch_chars."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434',
+                                      batch_size=10, max_batch_chars=25)
+        texts = ['a' * 10, 'b' * 10, 'c' * 10, 'd' * 40, 'e' * 5]
+        segments = [{'start': float(i), 'end': float(i + 1), 'text': t} for i, t in enumerate(texts)]
+        batch_sizes = []
+
+        def mock_try_batch(segs, src, tgt, context=None, on_line=None):
+            batch_sizes.append(len(segs))
+            return [{'start': s['start'], 'end': s['end'], 'text': 'T'} for s in segs]
+
+        with patch.object(translator, '_try_translate_batch', side_effect=mock_try_batch):
+            result = translator.translate_segments(segments, 'English', 'Chinese')
+
+        # An overlong line still gets a batch of its own
+        assert batch_sizes == [2, 1, 1, 1]
+        assert len(result) == 5
+
     def test_translate_segments_calls_progress_callback(self, translator, sample_segments):
         """Test that progress callback is called during translation."""
         progress_calls = []
@@ -649,13 +1005,9 @@ class TestBatchTranslation:
         def progress_callback(current, total):
             progress_calls.append((current, total))
 
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            'response': '1. T1\n2. T2\n3. T3'
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('1. T1\n2. T2\n3. T3')
 
-        with patch('src.translator.requests.post', return_value=mock_response):
+        with patch('requests.Session.post', return_value=mock_response):
             translator.translate_segments(
                 sample_segments,
                 'English',
@@ -759,12 +1111,10 @@ class TestContextWindow:
         segments = [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}]
         context = [('Hi', '嗨')]
 
-        mock_response = Mock()
-        mock_response.json.return_value = {'response': '1. 你好'}
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('1. 你好')
 
         with patch.object(translator, '_build_batch_prompt', wraps=translator._build_batch_prompt) as mock_build:
-            with patch('src.translator.requests.post', return_value=mock_response):
+            with patch('requests.Session.post', return_value=mock_response):
                 translator._try_translate_batch(segments, 'English', 'Chinese', context=context)
 
         mock_build.assert_called_once_with(['Hello'], 'English', 'Chinese', context=context)
@@ -779,7 +1129,7 @@ class TestContextWindow:
         context = [('Prior', '先前')]
         received_contexts = []
 
-        def mock_try_batch(segs, src, tgt, context=None):
+        def mock_try_batch(segs, src, tgt, context=None, on_line=None):
             received_contexts.append(context)
             if len(segs) == 2:
                 return None  # force split
@@ -885,6 +1235,565 @@ class TestContextWindow:
         assert received_contexts[3] == [('S1', 'T_S1'), ('S2', 'T_S2')]
 
 
+class TestConcurrency:
+    """Tests for parallel batch dispatch (ollama.concurrency)."""
+
+    @pytest.fixture
+    def segments(self):
+        return [{'start': float(i), 'end': float(i + 1), 'text': f'Line {i}'} for i in range(6)]
+
+    def test_load_config_default_concurrency(self):
+        """concurrency should default to 1 (sequential)."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / 'config.json'
+            config_path.write_text(json.dumps({"ollama": {"model": "test"}}))
+
+            with patch('src.translator.Path') as mock_path_class:
+                mock_path_class.return_value.parent.parent.__truediv__.return_value = config_path
+                config = load_config()
+
+        assert config['ollama']['concurrency'] == 1
+
+    def test_results_keep_input_order(self, segments):
+        """Output order follows input order even when later batches finish first."""
+        import time
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434',
+                                      batch_size=2, concurrency=3)
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            # First batch is the slowest
+            time.sleep(0.05 if progress_offset == 0 else 0)
+            return [{'start': s['start'], 'end': s['end'], 'text': f"T{s['text']}"} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive):
+            result = translator.translate_segments(segments, 'English', 'Chinese')
+
+        assert [seg['text'] for seg in result] == [f'TLine {i}' for i in range(6)]
+
+    def test_concurrent_batches_get_no_context(self, segments):
+        """Batches translated in parallel do not receive sliding context."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434',
+                                      batch_size=2, concurrency=2, context_lines=3)
+        contexts = []
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            contexts.append(context)
+            return [{'start': s['start'], 'end': s['end'], 'text': 'T'} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive):
+            translator.translate_segments(segments, 'English', 'Chinese')
+
+        assert contexts == [[], [], []]
+
+    def test_progress_counts_all_batches(self, segments):
+        """Progress aggregates completed segments across parallel batches."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434',
+                                      batch_size=2, concurrency=2)
+        progress_calls = []
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            progress_callback(progress_offset + len(segs), total_segments)
+            return [{'start': s['start'], 'end': s['end'], 'text': 'T'} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive):
+            translator.translate_segments(
+                segments, 'English', 'Chinese',
+                progress_callback=lambda current, total: progress_calls.append((current, total))
+            )
+
+        assert sorted(progress_calls) == [(2, 6), (4, 6), (6, 6)]
+
+    def test_progress_within_a_batch_is_not_double_counted(self, segments):
+        """Per-line updates from one batch replace that batch's count instead of adding to it."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434',
+                                      batch_size=3, concurrency=2)
+        progress_calls = []
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            for i in range(1, len(segs) + 1):
+                progress_callback(progress_offset + i, total_segments)
+            return [{'start': s['start'], 'end': s['end'], 'text': 'T'} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive):
+            translator.translate_segments(
+                segments, 'English', 'Chinese',
+                progress_callback=lambda current, total: progress_calls.append((current, total))
+            )
+
+        assert sorted(progress_calls) == [(i, 6) for i in range(1, 7)]
+
+    def test_error_in_batch_propagates(self, segments):
+        """A failing batch raises out of translate_segments."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434',
+                                      batch_size=2, concurrency=2)
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=ConnectionError('down')), \
+             patch('src.translator.time.sleep'):
+            with pytest.raises(ConnectionError):
+                translator.translate_segments(segments, 'English', 'Chinese')
+
+
+class TestBatchTimeout:
+    """Tests for the idle timeout between chunks of a streamed batch response."""
+
+    @pytest.fixture
+    def stalling_server(self):
+        """Ollama stand-in: first chunk after 0.3 s, second after a further 3 s."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers['Content-Length']))
+                self.send_response(200)
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                try:
+                    for delay, text in [(0.3, '1. Hola\n'), (3, '2. Mundo')]:
+                        time.sleep(delay)
+                        body = (json.dumps({'response': text}) + '\n').encode()
+                        self.wfile.write(b'%x\r\n%s\r\n' % (len(body), body))
+                        self.wfile.flush()
+                    self.wfile.write(b'0\r\n\r\n')
+                except OSError:
+                    pass  # The client gave up
+
+        server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        yield f'http://127.0.0.1:{server.server_port}'
+        server.shutdown()
+
+    def test_idle_timeout_only_applies_after_first_chunk(self, stalling_server):
+        """A slow first chunk is fine; a stall after it fails at the idle timeout."""
+        translator = OllamaTranslator(model='test', base_url=stalling_server)
+
+        started = time.monotonic()
+        with pytest.raises(TransientTranslationError, match="timed out"):
+            translator._call_ollama("prompt", timeout=10, idle_timeout=0.2)
+
+        assert time.monotonic() - started < 2
+
+    def test_first_chunk_keeps_fixed_allowance(self):
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        translator._record_chunk_gap(0.1)
+
+        assert translator._batch_timeout(10) == 120
+        assert translator._batch_timeout(50) == 250
+
+    def test_idle_timeout_before_any_measurement(self):
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+
+        assert translator._idle_timeout(120) == 120
+
+    def test_idle_timeout_follows_measured_gaps(self):
+        """Short gaps lower the idle timeout, but never below the floor or above the first-chunk one."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        translator._record_chunk_gap(20.0)
+
+        assert translator._idle_timeout(120) == pytest.approx(60)  # 20 * 3
+        assert translator._idle_timeout(40) == 40
+
+        translator._chunk_gap = 0.05
+        assert translator._idle_timeout(120) == OllamaTranslator.IDLE_TIMEOUT_FLOOR
+
+    def test_moving_average_weights_recent_batches(self):
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        translator._record_chunk_gap(1.0)
+        translator._record_chunk_gap(0.0)
+
+        assert translator._chunk_gap == pytest.approx(0.7)
+
+    def test_timeout_widens_estimate(self):
+        """A timed-out batch doubles the gap estimate, so repeated timeouts loosen the limit."""
+        import requests
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        translator._record_chunk_gap(20.0)
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}]
+
+        with patch('requests.Session.post', side_effect=requests.exceptions.Timeout()):
+            for _ in range(2):
+                with pytest.raises(TransientTranslationError):
+                    translator._try_translate_batch(segments, 'English', 'Spanish')
+
+        assert translator._chunk_gap == pytest.approx(80.0)
+        assert translator._idle_timeout(250) == 240
+
+    def test_batch_records_gap_and_passes_idle_timeout(self):
+        """A streamed batch is measured, and the next batch gets the idle timeout."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}, {'start': 1.0, 'end': 2.0, 'text': 'World'}]
+
+        with patch.object(translator, '_call_ollama', wraps=translator._call_ollama) as mock_call, \
+             patch('requests.Session.post', return_value=ollama_response('1. Hola\n2. Mundo')):
+            translator._try_translate_batch(segments, 'English', 'Spanish')
+            translator._try_translate_batch(segments, 'English', 'Spanish')
+
+        assert translator._chunk_gap is not None
+        assert [call[1]['timeout'] for call in mock_call.call_args_list] == [120, 120]
+        assert [call[1]['idle_timeout'] for call in mock_call.call_args_list] == [
+            120, OllamaTranslator.IDLE_TIMEOUT_FLOOR
+        ]
+
+
+class TestFailedBatchRetry:
+    """Tests for retrying batches that fail with transient errors."""
+
+    @pytest.fixture
+    def segments(self):
+        return [{'start': float(i), 'end': float(i + 1), 'text': f'Line {i}'} for i in range(6)]
+
+    def test_timeout_raises_transient_error(self):
+        """Request timeouts are reported as retryable errors."""
+        import requests
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+
+        with patch('requests.Session.post', side_effect=requests.exceptions.Timeout()):
+            with pytest.raises(TransientTranslationError):
+                translator._call_ollama("prompt")
+
+    def test_failed_batch_retried_after_main_pass(self, segments):
+        """A timed-out batch does not stop later batches and is retried at the end."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434', batch_size=2)
+        calls = []
+        failed_once = []
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            calls.append([s['text'] for s in segs])
+            if segs[0]['text'] == 'Line 0' and not failed_once:
+                failed_once.append(True)
+                raise TransientTranslationError("Translation request timed out")
+            return [{'start': s['start'], 'end': s['end'], 'text': f"T{s['text']}"} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive), \
+             patch('src.translator.time.sleep') as mock_sleep:
+            result = translator.translate_segments(segments, 'English', 'Chinese')
+
+        assert [seg['text'] for seg in result] == [f'TLine {i}' for i in range(6)]
+        # Main pass continues past the failure; retry uses half the batch size
+        assert calls == [['Line 0', 'Line 1'], ['Line 2', 'Line 3'], ['Line 4', 'Line 5'],
+                         ['Line 0'], ['Line 1']]
+        mock_sleep.assert_called_once_with(2)
+
+    def test_retries_exhausted_raises(self, segments):
+        """The last error is raised once every retry round has failed."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434', batch_size=2)
+
+        with patch.object(translator, '_translate_batch_recursive',
+                          side_effect=TransientTranslationError("Translation request timed out")), \
+             patch('src.translator.time.sleep') as mock_sleep:
+            with pytest.raises(TransientTranslationError):
+                translator.translate_segments(segments, 'English', 'Chinese')
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4]
+
+    def test_non_transient_error_not_retried(self, segments):
+        """API errors (e.g. model not found) abort immediately."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434', batch_size=2)
+
+        with patch.object(translator, '_translate_batch_recursive',
+                          side_effect=RuntimeError("Ollama API error: model not found")) as mock_recursive, \
+             patch('src.translator.time.sleep') as mock_sleep:
+            with pytest.raises(RuntimeError, match="model not found"):
+                translator.translate_segments(segments, 'English', 'Chinese')
+
+        assert mock_recursive.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_concurrent_failed_batch_retried(self, segments):
+        """Failed batches are also retried when translating concurrently."""
+        import threading
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434',
+                                      batch_size=2, concurrency=3)
+        failed_once = []
+        lock = threading.Lock()
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            with lock:
+                if segs[0]['text'] == 'Line 2' and not failed_once:
+                    failed_once.append(True)
+                    raise ConnectionError("Cannot connect to Ollama")
+            return [{'start': s['start'], 'end': s['end'], 'text': f"T{s['text']}"} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive), \
+             patch('src.translator.time.sleep'):
+            result = translator.translate_segments(segments, 'English', 'Chinese')
+
+        assert [seg['text'] for seg in result] == [f'TLine {i}' for i in range(6)]
+
+    def test_concurrent_retry_chunks_run_in_parallel(self):
+        """Chunks of a retry round are sent together when concurrency > 1."""
+        import threading
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434',
+                                      batch_size=2, concurrency=2)
+        segments = [{'start': float(i), 'end': float(i + 1), 'text': f'Line {i}'} for i in range(4)]
+        # Each retried chunk waits for a second one to be in flight at the same time
+        retry_barrier = threading.Barrier(2, timeout=5)
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            if len(segs) == 2:
+                raise TransientTranslationError("Translation request timed out")
+            retry_barrier.wait()
+            return [{'start': s['start'], 'end': s['end'], 'text': f"T{s['text']}"} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive), \
+             patch('src.translator.time.sleep'):
+            result = translator.translate_segments(segments, 'English', 'Chinese')
+
+        assert [seg['text'] for seg in result] == [f'TLine {i}' for i in range(4)]
+
+class TestPassthrough:
+    """Tests for skipping lines that have nothing to translate."""
+
+    @pytest.mark.parametrize("text", ["♪♪", "...", "2024", "<i>♪</i>", "- 100%", ""])
+    def test_lines_without_letters_skip_translation(self, text):
+        assert needs_translation(text, 'Chinese') is False
+
+    @pytest.mark.parametrize("text", ["[Applause]", "Yeah.", "OK 123"])
+    def test_lines_with_letters_need_translation(self, text):
+        assert needs_translation(text, 'Chinese') is True
+
+    def test_korean_text_skipped_for_korean_target(self):
+        assert needs_translation("안녕하세요!", 'Korean') is False
+        assert needs_translation("Hello 안녕", 'Korean') is True
+
+    def test_japanese_requires_kana(self):
+        """Kanji-only lines may be Chinese, so only lines with kana count as Japanese."""
+        assert needs_translation("ありがとう東京", 'Japanese') is False
+        assert needs_translation("東京", 'Japanese') is True
+
+    def test_han_text_still_translated_for_chinese(self):
+        """Han script can't distinguish Simplified from Traditional, so Chinese lines are still sent."""
+        assert needs_translation("你好", 'Chinese') is True
+
+    def test_translate_segments_passes_through_untranslatable(self):
+        """Music cues keep their text and are never sent to Ollama."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': '♪♪'},
+            {'start': 1.0, 'end': 2.0, 'text': 'Hello'},
+        ]
+        calls = []
+        progress_calls = []
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            calls.append([s['text'] for s in segs])
+            progress_callback(progress_offset + len(segs), total_segments)
+            return [{'start': s['start'], 'end': s['end'], 'text': '你好'} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive):
+            result = translator.translate_segments(segments, 'English', 'Chinese',
+                                                   progress_callback=lambda c, t: progress_calls.append((c, t)))
+
+        assert calls == [['Hello']]
+        assert [seg['text'] for seg in result] == ['♪♪', '你好']
+        assert progress_calls[-1] == (2, 2)
+
+    def test_all_passthrough_makes_no_requests(self):
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        segments = [{'start': 0.0, 'end': 1.0, 'text': '...'}]
+
+        with patch('requests.Session.post') as mock_post:
+            result = translator.translate_segments(segments, 'English', 'Chinese')
+
+        mock_post.assert_not_called()
+        assert result == segments
+
+
+class TestTranslationMemo:
+    """Tests for reusing translations of repeated lines."""
+
+    @staticmethod
+    def fake_recursive(calls):
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            calls.append([s['text'] for s in segs])
+            return [{'start': s['start'], 'end': s['end'], 'text': f"T{s['text']}"} for s in segs]
+        return mock_recursive
+
+    def test_duplicate_lines_translated_once(self):
+        """Repeated lines are sent once and every occurrence gets the translation."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': '[Applause]'},
+            {'start': 1.0, 'end': 2.0, 'text': 'Hello'},
+            {'start': 2.0, 'end': 3.0, 'text': ' [Applause] '},
+        ]
+        calls = []
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=self.fake_recursive(calls)):
+            result = translator.translate_segments(segments, 'English', 'Chinese')
+
+        assert calls == [['[Applause]', 'Hello']]
+        assert [seg['text'] for seg in result] == ['T[Applause]', 'THello', 'T[Applause]']
+        assert [seg['start'] for seg in result] == [0.0, 1.0, 2.0]
+
+    def test_memo_reused_across_calls(self):
+        """A second call with the same lines makes no requests."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'Yeah.'}]
+        calls = []
+        progress_calls = []
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=self.fake_recursive(calls)):
+            translator.translate_segments(segments, 'English', 'Chinese')
+            result = translator.translate_segments(
+                segments, 'English', 'Chinese',
+                progress_callback=lambda c, t: progress_calls.append((c, t))
+            )
+
+        assert len(calls) == 1
+        assert result[0]['text'] == 'TYeah.'
+        assert progress_calls == [(1, 1)]
+
+    def test_memo_keyed_by_language_pair(self):
+        """The same text is translated again for a different target language."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'Yeah.'}]
+        calls = []
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=self.fake_recursive(calls)):
+            translator.translate_segments(segments, 'English', 'Chinese')
+            translator.translate_segments(segments, 'English', 'Japanese')
+
+        assert len(calls) == 2
+
+    def test_memo_key_is_short_and_keyed_by_prompt(self):
+        """A long custom prompt is hashed, not repeated in every key, and still separates entries."""
+        prompt = 'Keep names untranslated. ' * 200
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434', custom_prompt=prompt)
+        other = OllamaTranslator(model='test', base_url='http://localhost:11434', custom_prompt=prompt + '!')
+
+        key = translator._cache_key(' Hello ', 'English', 'Chinese')
+
+        assert key.endswith('\x1fHello')
+        assert len(key) < 40
+        assert key != other._cache_key('Hello', 'English', 'Chinese')
+        assert key != translator._cache_key('Hello', 'English', 'Japanese')
+
+    def test_progress_counts_cached_segments(self):
+        """Progress totals include lines served from the memo."""
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434')
+        segments = [{'start': float(i), 'end': float(i + 1), 'text': 'Same'} for i in range(3)]
+        progress_calls = []
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            progress_callback(progress_offset + len(segs), total_segments)
+            return [{'start': s['start'], 'end': s['end'], 'text': 'T'} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive):
+            translator.translate_segments(segments, 'English', 'Chinese',
+                                          progress_callback=lambda c, t: progress_calls.append((c, t)))
+
+        assert progress_calls[-1] == (3, 3)
+
+    def test_cache_file_persists_between_instances(self, tmp_path):
+        """With cache_file set, a new translator reuses translations from a previous run."""
+        cache_file = tmp_path / 'cache' / 'translations.json'
+        segments = [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}]
+        calls = []
+
+        first = OllamaTranslator(model='test', base_url='http://localhost:11434', cache_file=str(cache_file))
+        with patch.object(first, '_translate_batch_recursive', side_effect=self.fake_recursive(calls)):
+            first.translate_segments(segments, 'English', 'Chinese')
+
+        assert cache_file.exists()
+
+        second = OllamaTranslator(model='test', base_url='http://localhost:11434', cache_file=str(cache_file))
+        with patch.object(second, '_translate_batch_recursive', side_effect=self.fake_recursive(calls)):
+            result = second.translate_segments(segments, 'English', 'Chinese')
+
+        assert len(calls) == 1
+        assert result[0]['text'] == 'THello'
+
+    def test_cache_file_saves_completed_batches_on_failure(self, tmp_path):
+        """Batches finished before an error are persisted."""
+        cache_file = tmp_path / 'translations.json'
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434',
+                                      batch_size=1, cache_file=str(cache_file))
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': 'One'},
+            {'start': 1.0, 'end': 2.0, 'text': 'Two'},
+        ]
+
+        def mock_recursive(segs, src, tgt, progress_callback=None,
+                           progress_offset=0, total_segments=0, context=None):
+            if segs[0]['text'] == 'Two':
+                raise ConnectionError("Cannot connect to Ollama")
+            return [{'start': s['start'], 'end': s['end'], 'text': 'Uno'} for s in segs]
+
+        with patch.object(translator, '_translate_batch_recursive', side_effect=mock_recursive), \
+             patch('src.translator.time.sleep'):
+            with pytest.raises(ConnectionError):
+                translator.translate_segments(segments, 'English', 'Spanish')
+
+        assert list(json.loads(cache_file.read_text()).values()) == ['Uno']
+
+    def test_failed_cache_write_keeps_previous_file(self, tmp_path):
+        """A write that fails part way leaves the old cache in place and no temp file."""
+        cache_file = tmp_path / 'translations.json'
+        cache_file.write_text(json.dumps({'old': 'Viejo'}))
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434', cache_file=str(cache_file))
+        translator._cache['new'] = 'Nuevo'
+
+        def write_half(path, data):
+            with open(path, 'wb') as f:
+                f.write(data[:len(data) // 2])
+            raise OSError("No space left on device")
+
+        with patch.object(Path, 'write_bytes', write_half):
+            translator._save_cache()
+
+        assert json.loads(cache_file.read_text()) == {'old': 'Viejo'}
+        assert list(tmp_path.iterdir()) == [cache_file]
+
+        translator._save_cache()
+
+        assert json.loads(cache_file.read_text()) == {'old': 'Viejo', 'new': 'Nuevo'}
+        assert list(tmp_path.iterdir()) == [cache_file]
+
+    def test_corrupt_cache_file_ignored(self, tmp_path):
+        """An unreadable cache file starts an empty memo."""
+        cache_file = tmp_path / 'translations.json'
+        cache_file.write_text('not json')
+
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434', cache_file=str(cache_file))
+
+        assert translator._cache == {}
+
+    def test_missing_cache_file_starts_empty(self, tmp_path):
+        """A cache file that doesn't exist yet starts an empty memo."""
+        cache_file = tmp_path / 'sub' / 'translations.json'
+
+        translator = OllamaTranslator(model='test', base_url='http://localhost:11434', cache_file=str(cache_file))
+
+        assert translator._cache == {}
+
+    def test_load_config_default_cache_file(self):
+        """cache_file defaults to None so nothing is written to disk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / 'config.json'
+            config_path.write_text(json.dumps({"ollama": {"model": "test"}}))
+
+            with patch('src.translator.Path') as mock_path_class:
+                mock_path_class.return_value.parent.parent.__truediv__.return_value = config_path
+                config = load_config()
+
+        assert config['ollama']['cache_file'] is None
+
+
 class TestCustomPrompt:
     """Tests for custom prompt file support in translation."""
 
@@ -939,14 +1848,12 @@ class TestCustomPrompt:
             custom_prompt='Use casual tone.'
         )
 
-        mock_response = Mock()
-        mock_response.json.return_value = {'response': 'translated'}
-        mock_response.raise_for_status = Mock()
+        mock_response = ollama_response('translated')
 
-        with patch('src.translator.requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             translator.translate_text('Hello', 'English', 'Chinese')
 
-        sent_prompt = mock_post.call_args[1]['json']['prompt']
+        sent_prompt = json.loads(mock_post.call_args[1]['data'])['prompt']
         assert 'Use casual tone.' in sent_prompt
 
     def test_build_batch_prompt_custom_prompt_before_numbered_lines(self):
@@ -1120,7 +2027,7 @@ class TestPromptFileConfig:
 class TestUnloadAllModels:
     """Tests for the unload_all_models function."""
 
-    @patch('src.translator.requests.get')
+    @patch('requests.get')
     def test_returns_zero_when_no_models_loaded(self, mock_get):
         """Should return 0 and not call generate when no models are loaded."""
         from src.translator import unload_all_models
@@ -1131,8 +2038,8 @@ class TestUnloadAllModels:
 
         assert unload_all_models('http://localhost:11434') == 0
 
-    @patch('src.translator.requests.post')
-    @patch('src.translator.requests.get')
+    @patch('requests.post')
+    @patch('requests.get')
     def test_unloads_each_loaded_model(self, mock_get, mock_post):
         """Should call generate with keep_alive=0 for every loaded model."""
         from src.translator import unload_all_models
@@ -1147,8 +2054,8 @@ class TestUnloadAllModels:
         assert n == 2
         assert mock_post.call_count == 2
 
-    @patch('src.translator.requests.post')
-    @patch('src.translator.requests.get')
+    @patch('requests.post')
+    @patch('requests.get')
     def test_unload_request_uses_keep_alive_zero(self, mock_get, mock_post):
         """Unload request must pass keep_alive=0 for the correct model."""
         from src.translator import unload_all_models
@@ -1164,7 +2071,7 @@ class TestUnloadAllModels:
         assert payload['keep_alive'] == 0
         assert payload['model'] == 'llama3:8b'
 
-    @patch('src.translator.requests.get')
+    @patch('requests.get')
     def test_returns_zero_on_connection_error(self, mock_get):
         """Should return 0 silently when Ollama is not reachable."""
         import requests as req
@@ -1173,7 +2080,7 @@ class TestUnloadAllModels:
 
         assert unload_all_models('http://localhost:11434') == 0
 
-    @patch('src.translator.requests.get')
+    @patch('requests.get')
     def test_returns_zero_on_any_request_exception(self, mock_get):
         """Should return 0 silently on any requests error."""
         import requests as req
@@ -1181,3 +2088,106 @@ class TestUnloadAllModels:
         mock_get.side_effect = req.exceptions.RequestException()
 
         assert unload_all_models('http://localhost:11434') == 0
+
+
+class TestFormattingTags:
+    """Tests for SRT formatting tag handling (<i>, <font>, ...)."""
+
+    @pytest.fixture
+    def translator(self):
+        return OllamaTranslator(model='test-model', base_url='http://localhost:11434', batch_size=3)
+
+    def test_split_plain_text(self, translator):
+        """Text without tags is returned unchanged."""
+        assert translator._split_formatting_tags('Hello') == ('', 'Hello', '')
+
+    def test_split_wrapping_tags(self, translator):
+        """Tags wrapping the whole line are split off as prefix/suffix."""
+        assert translator._split_formatting_tags('<i>Hello</i>') == ('<i>', 'Hello', '</i>')
+        assert translator._split_formatting_tags('<font color="#ffff00"><b>Hi</b></font>') == (
+            '<font color="#ffff00"><b>', 'Hi', '</b></font>'
+        )
+
+    def test_split_multiline_wrapping_tags(self, translator):
+        """Wrapping tags spanning multiple lines are detected."""
+        assert translator._split_formatting_tags('<i>Line 1\nLine 2</i>') == ('<i>', 'Line 1\nLine 2', '</i>')
+
+    def test_split_keeps_inline_tags(self, translator):
+        """Tags inside the line stay in the text sent for translation."""
+        assert translator._split_formatting_tags('I <b>really</b> mean it') == ('', 'I <b>really</b> mean it', '')
+
+    @pytest.mark.parametrize("text", [
+        '<i>Hello</i> there <b>friend</b>',
+        '<i>Hello</i> <i>world</i>',
+        '<b><i>Hello</b></i>',
+    ])
+    def test_split_leaves_unpaired_tags_unchanged(self, translator, text):
+        """Leading and trailing tags that don't pair up are not treated as a wrapper."""
+        assert translator._split_formatting_tags(text) == ('', text, '')
+
+    def test_try_translate_batch_reapplies_tags(self, translator):
+        """Batch translation sends plain text and re-wraps translations in the original tags."""
+        segments = [
+            {'start': 0.0, 'end': 1.0, 'text': '<i>Hello</i>'},
+            {'start': 1.0, 'end': 2.0, 'text': 'World'},
+        ]
+        mock_response = ollama_response('1. 你好\n2. 世界')
+
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
+            result = translator._try_translate_batch(segments, 'English', 'Chinese')
+
+        prompt = json.loads(mock_post.call_args[1]['data'])['prompt']
+        assert '<i>' not in prompt
+        assert '1. Hello' in prompt
+        assert result[0]['text'] == '<i>你好</i>'
+        assert result[1]['text'] == '世界'
+
+    def test_translate_text_reapplies_tags(self, translator):
+        """Single-text translation re-wraps the result in the original tags."""
+        mock_response = ollama_response('你好')
+
+        with patch('requests.Session.post', return_value=mock_response):
+            result = translator.translate_text('<i>Hello</i>', 'English', 'Chinese')
+
+        assert result == '<i>你好</i>'
+
+
+class TestCaching:
+    """Tests for per-process caching of config and language lookups."""
+
+    def test_load_config_reads_file_once(self):
+        """Repeated load_config calls return the same parsed config."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / 'config.json'
+            config_path.write_text(json.dumps({"ollama": {"model": "first"}}))
+
+            with patch('src.translator.Path') as mock_path_class:
+                mock_path_class.return_value.parent.parent.__truediv__.return_value = config_path
+                first = load_config()
+                config_path.write_text(json.dumps({"ollama": {"model": "second"}}))
+                second = load_config()
+
+        assert first is second
+        assert second['ollama']['model'] == 'first'
+
+    def test_parse_language_cached(self):
+        """parse_language results are memoized."""
+        parse_language.cache_clear()
+        parse_language('Korean')
+        parse_language('Korean')
+
+        assert parse_language.cache_info().hits == 1
+
+    @pytest.mark.parametrize("func, arg", [
+        (get_prompt_language, 'Chinese'),
+        (get_language_code, 'Korean'),
+        (get_language_name, 'ko'),
+    ])
+    def test_language_lookups_cached(self, func, arg):
+        """Language lookups used while building prompts are memoized."""
+        func.cache_clear()
+        first = func(arg)
+
+        assert func(arg) == first
+        assert func.cache_info().hits == 1
+
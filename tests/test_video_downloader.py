@@ -78,7 +78,7 @@ class TestVideoDownloader:
             downloader = VideoDownloader(download_dir=tmpdir)
             assert downloader.download_dir == Path(tmpdir)
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_video_from_url(self, mock_youtube_dl):
         """Test basic video download flow."""
         # Mock yt-dlp behavior
@@ -105,7 +105,7 @@ class TestVideoDownloader:
         assert result['duration'] == 120.5
         assert result['platform'] == 'youtube'
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_returns_video_info(self, mock_youtube_dl):
         """Test that download returns complete video information dictionary."""
         mock_instance = MagicMock()
@@ -130,7 +130,7 @@ class TestVideoDownloader:
         assert 'duration' in result
         assert 'platform' in result
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_saves_to_temp_directory(self, mock_youtube_dl):
         """Test that videos are saved to temp directory."""
         mock_instance = MagicMock()
@@ -157,7 +157,7 @@ class TestVideoDownloader:
         assert result['file_path'] == expected_path
         assert str(downloader.download_dir) in result['file_path']
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_accepts_quiet_flag(self, mock_youtube_dl):
         """Test that quiet flag is passed to yt-dlp."""
         mock_instance = MagicMock()
@@ -178,7 +178,20 @@ class TestVideoDownloader:
         # Should complete without errors
         assert result is not None
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
+    def test_download_fetches_audio_only(self, mock_youtube_dl):
+        """Test that only the audio stream is requested, with a fallback for single-file formats."""
+        mock_instance = MagicMock()
+        mock_youtube_dl.return_value.__enter__.return_value = mock_instance
+        mock_instance.extract_info.return_value = {'id': 'audio123', 'ext': 'm4a'}
+        mock_instance.prepare_filename.return_value = f'{tempfile.gettempdir()}/audio123.m4a'
+
+        VideoDownloader().download("https://youtube.com/watch?v=audio123", quiet=True)
+
+        ydl_opts = mock_youtube_dl.call_args[0][0]
+        assert ydl_opts['format'] == 'bestaudio/best'
+
+    @patch('yt_dlp.YoutubeDL')
     def test_download_raises_on_invalid_url(self, mock_youtube_dl):
         """Test that invalid URLs raise ValueError."""
         mock_instance = MagicMock()
@@ -190,7 +203,7 @@ class TestVideoDownloader:
         with pytest.raises(Exception):
             downloader.download("https://invalid-url.com/video")
 
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_raises_on_network_error(self, mock_youtube_dl):
         """Test that network errors are properly raised."""
         mock_instance = MagicMock()
@@ -204,7 +217,7 @@ class TestVideoDownloader:
 
     @patch('src.video_downloader.os.path.exists', return_value=True)
     @patch('src.video_downloader.os.utime')
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_sets_mtime_to_upload_date(self, mock_youtube_dl, mock_utime, mock_exists):
         """Test that download sets file mtime to upload date."""
         mock_instance = MagicMock()
@@ -234,7 +247,7 @@ class TestVideoDownloader:
 
     @patch('src.video_downloader.os.path.exists', return_value=True)
     @patch('src.video_downloader.os.utime')
-    @patch('src.video_downloader.yt_dlp.YoutubeDL')
+    @patch('yt_dlp.YoutubeDL')
     def test_download_skips_mtime_when_no_upload_date(self, mock_youtube_dl, mock_utime, mock_exists):
         """Test that download skips mtime setting when no upload_date."""
         mock_instance = MagicMock()